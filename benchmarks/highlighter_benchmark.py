@@ -0,0 +1,255 @@
+"""Benchmark für die Syntax-Hervorhebung.
+
+Läuft ohne Fenster (Qt-Plattform "offscreen") und misst für mehrere
+Korpora die reine Tokenisierung, die vollständige Neu-Hervorhebung mit
+leerem und gefülltem Token-Cache sowie den Speicherbedarf.
+
+Beispiele:
+    python benchmarks/highlighter_benchmark.py
+    python benchmarks/highlighter_benchmark.py --corpus demofile --corpus lines_10k
+    python benchmarks/highlighter_benchmark.py --output before.json
+    python benchmarks/highlighter_benchmark.py --compare before.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Füge das Hauptverzeichnis zum Python-Pfad hinzu
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+import PySide6
+from PySide6.QtWidgets import QApplication, QPlainTextEdit
+
+from syntax.python_highlighter import PythonHighlighter, PythonLexer
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Bausteine für die generierten Korpora
+SNIPPETS = (
+    'import os\nfrom typing import Dict, List\n\n',
+    '@decorator\ndef function_{n}(alpha, beta=None, *args, **kwargs):\n'
+    '    """Dokumentation für function_{n}.\n\n    Mehrzeiliger Docstring.\n    """\n'
+    '    result = alpha + beta * {n} - (alpha // 2) % 3\n'
+    '    if result >= 0x{n:x} and not beta:\n'
+    '        return f"{{alpha}} und {{beta!r}}"  # Kommentar {n}\n'
+    '    return [x ** 2 for x in range({n})]\n\n',
+    'class Klasse{n}(Basis):\n'
+    '    WERTE = {{"a": 1, "b": 2.5e-3, "c": [1, 2, 3]}}\n\n'
+    '    def methode(self, wert):\n'
+    '        try:\n'
+    '            self.wert = wert or \'standard\'\n'
+    '        except (ValueError, TypeError) as fehler:\n'
+    '            raise RuntimeError(str(fehler)) from fehler\n\n',
+    'daten = {{\n    "schluessel_{n}": ({n}, {n}.5, 1_000),\n    "liste": [\n'
+    '        "eins", "zwei",\n    ],\n}}\n\n',
+)
+
+
+def generate_python(line_count, seed=0):
+    """Erzeugt reproduzierbaren Python-Code mit ungefähr line_count Zeilen."""
+    rng = random.Random(seed)
+    parts = []
+    lines = 0
+    n = 0
+    while lines < line_count:
+        snippet = rng.choice(SNIPPETS).format(n=n)
+        parts.append(snippet)
+        lines += snippet.count('\n')
+        n += 1
+    return ''.join(parts)
+
+
+def generate_pathological():
+    """Erzeugt Zeilen, die den Tokenizer besonders fordern."""
+    lines = []
+    # Sehr lange Strings, mit und ohne Abschluss
+    lines.append('x = "' + 'a' * 100000 + '"')
+    lines.append("y = '" + 'b\\\'' * 20000)
+    # Viele Operatoren und Zahlen ohne Leerzeichen
+    lines.append('z=' + '+'.join(str(i) for i in range(20000)))
+    lines.append('w = ' + ' ** '.join('(a<=b)' for _ in range(5000)))
+    # Tief verschachtelte Klammern
+    lines.append('v = ' + '(' * 2000 + '1' + ')' * 2000)
+    # Lange Kommentarzeile und lange Zeile aus Bezeichnern
+    lines.append('# ' + 'kommentar ' * 10000)
+    lines.append(' '.join('name%d' % i for i in range(20000)))
+    # Offene Triple-Strings über viele Zeilen
+    lines.append('s = """')
+    lines.extend('    zeile %d in einem langen String' % i for i in range(5000))
+    lines.append('"""')
+    return '\n'.join(lines * 4)
+
+
+def load_demofile():
+    """Liest DEMOFILE.py aus dem Projektverzeichnis."""
+    with open(os.path.join(root_dir, 'DEMOFILE.py'), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+CORPORA = {
+    'demofile': load_demofile,
+    'lines_10k': lambda: generate_python(10000),
+    'lines_100k': lambda: generate_python(100000),
+    'pathological': generate_pathological,
+}
+
+
+def measure_tokenize(lines):
+    """Tokenisiert alle Zeilen ohne Qt und ohne Cache."""
+    lexer = PythonLexer()
+    tokenize = lexer.tokenize
+    state = 0
+    start = time.perf_counter()
+    for line in lines:
+        _spans, state = tokenize(line, state)
+    return time.perf_counter() - start
+
+
+def measure_memory(lines):
+    """Python-Heap des gefüllten Token-Caches und Spitze beim Befüllen."""
+    PythonHighlighter.token_cache.clear()
+    highlighter = PythonHighlighter()
+    tokenize = highlighter.tokenize
+    gc.collect()
+    tracemalloc.start()
+    state = 0
+    for line in lines:
+        _spans, state = tokenize(line, state)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, peak
+
+
+def measure_rehighlight(text, repeat):
+    """Misst die vollständige Neu-Hervorhebung in einem QPlainTextEdit."""
+    editor = QPlainTextEdit()
+    editor.setPlainText(text)
+    highlighter = PythonHighlighter(editor.document())
+    block_count = editor.document().blockCount()
+
+    cold = []
+    warm = []
+    for _ in range(repeat):
+        PythonHighlighter.token_cache.clear()
+        start = time.perf_counter()
+        highlighter.rehighlight()
+        cold.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        highlighter.rehighlight()
+        warm.append(time.perf_counter() - start)
+
+    stats = PythonHighlighter.token_cache.stats()
+    highlighter.setDocument(None)
+    editor.deleteLater()
+    return block_count, min(cold), min(warm), stats
+
+
+def run_corpus(name, repeat):
+    """Führt alle Messungen für ein Korpus aus."""
+    text = CORPORA[name]()
+    lines = text.split('\n')
+    tokenize_seconds = min(measure_tokenize(lines) for _ in range(repeat))
+    heap_current, heap_peak = measure_memory(lines)
+    block_count, cold, warm, cache_stats = measure_rehighlight(text, repeat)
+    return {
+        'lines': len(lines),
+        'characters': len(text),
+        'tokenize_seconds': round(tokenize_seconds, 6),
+        'tokenize_us_per_line': round(tokenize_seconds / len(lines) * 1e6, 3),
+        'rehighlight_cold_seconds': round(cold, 6),
+        'rehighlight_warm_seconds': round(warm, 6),
+        'us_per_block_cold': round(cold / block_count * 1e6, 3),
+        'us_per_block_warm': round(warm / block_count * 1e6, 3),
+        'token_cache_bytes': heap_current,
+        'token_cache_peak_bytes': heap_peak,
+        'token_cache': cache_stats,
+    }
+
+
+def max_rss_bytes():
+    """Maximaler Arbeitsspeicher des Prozesses, falls ermittelbar."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux meldet KiB, macOS Bytes
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def print_results(results, baseline=None):
+    """Gibt eine Tabelle aus, optional mit Abweichung zur Baseline."""
+    columns = (
+        ('tokenize_us_per_line', 'Token µs/Zeile'),
+        ('us_per_block_cold', 'µs/Block kalt'),
+        ('us_per_block_warm', 'µs/Block warm'),
+        ('rehighlight_cold_seconds', 'Rehighlight s'),
+        ('token_cache_peak_bytes', 'Heap-Spitze B'),
+    )
+    header = f"{'Korpus':<14}" + ''.join(f"{title:>18}" for _key, title in columns)
+    print(header)
+    print('-' * len(header))
+    for name, values in results['corpora'].items():
+        row = f"{name:<14}"
+        for key, _title in columns:
+            cell = f"{values[key]:.3f}" if isinstance(values[key], float) else str(values[key])
+            old = (baseline or {}).get('corpora', {}).get(name, {}).get(key)
+            if old:
+                cell += f" ({(values[key] - old) / old * 100:+.0f}%)"
+            row += f"{cell:>18}"
+        print(row)
+    if results.get('max_rss_bytes'):
+        print(f"\nMaximaler Arbeitsspeicher: {results['max_rss_bytes'] / 1024 / 1024:.1f} MiB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark für den Syntax-Highlighter")
+    parser.add_argument('--corpus', action='append', choices=sorted(CORPORA),
+                        help="Nur dieses Korpus messen (mehrfach möglich)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Wiederholungen pro Messung, das Minimum zählt")
+    parser.add_argument('--output', help="Ergebnisse als JSON in diese Datei schreiben")
+    parser.add_argument('--compare', help="JSON einer früheren Messung zum Vergleich")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    results = {
+        'python': platform.python_version(),
+        'pyside6': PySide6.__version__,
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'corpora': {},
+    }
+    for name in args.corpus or CORPORA:
+        results['corpora'][name] = run_corpus(name, args.repeat)
+    results['max_rss_bytes'] = max_rss_bytes()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    del app
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -20,9 +20,12 @@ from PySide6.QtGui import (
 # Import aus dem themes-Package
 from themes import WindsurfTheme
 from syntax.python_highlighter import PythonHighlighter
+from syntax.registry import get_lexer_for_path
+from syntax.semantic import SemanticHighlighter
 from utils.line_numbers import LineNumberArea
 from gui.minimap import MiniMap
 from utils.autocomplete import AutoCompleter
+from utils.encoding import DEFAULT_FORMAT
 
 class EditorContainer(QFrame):
     """Container für Editor und Mini-Map."""
@@ -58,6 +61,14 @@ class CodeEditor(QPlainTextEdit):
         # Minimap Einstellungen
         self._minimap_enabled = True
         self._minimap = None
+
+        # Abschaltbare Features (siehe toggle_feature)
+        self._syntax_highlight_enabled = True
+        self._current_line_enabled = True
+        self._stashed_lexer = None
+        self.large_file_mode = False
+        # Kodierung und Zeilenende der geladenen Datei (für das Speichern)
+        self.text_format = DEFAULT_FORMAT
         
         # Update Timer für Performance-Optimierung
         self._update_timer = QTimer()
@@ -75,7 +86,7 @@ class CodeEditor(QPlainTextEdit):
         # Performance-Optimierungen
         self.setLineWrapMode(QPlainTextEdit.NoWrap)  # Deaktiviert Zeilenumbruch für bessere Performance
         self.setCenterOnScroll(False)  # Verhindert unnötiges Neuzeichnen
-        self.setMaximumBlockCount(0)  # Kein Limit für Blöcke
+        # Kein setMaximumBlockCount: Qt schaltet damit Undo/Redo ab (0 ist ohnehin der Standard)
         
         # Viewport-Optimierungen
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -98,7 +109,13 @@ class CodeEditor(QPlainTextEdit):
         self.cursorPositionChanged.connect(self._highlight_current_line)
         
         # Syntax-Highlighter
-        self.highlighter = PythonHighlighter(self.document())
+        self.highlighter = PythonHighlighter(
+            self.document(), theme_styles=self.theme_styles, editor=self
+        )
+        self.verticalScrollBar().valueChanged.connect(self.highlighter.rehighlight_visible)
+        self.highlighter.formats_changed.connect(self._on_formats_changed)
+        self.semantic_highlighter = SemanticHighlighter(self.highlighter)
+        self.semantic_highlighter.set_enabled(True)
         
         # Autovervollständigung initialisieren
         self.auto_completer = AutoCompleter(self)
@@ -158,6 +175,42 @@ class CodeEditor(QPlainTextEdit):
         # Initial width setzen
         self.update_line_number_area_width(0)
         
+    def visible_block_range(self):
+        """Gibt (erste, letzte + 1) Blocknummer des sichtbaren Bereichs zurück."""
+        first = self.firstVisibleBlock().blockNumber()
+        line_height = max(1, self.fontMetrics().height())
+        return first, first + self.viewport().height() // line_height + 1
+
+    def set_language_for_path(self, path, file_size=None):
+        """Wählt den Lexer passend zur Dateiendung (oder keinen)."""
+        lexer = get_lexer_for_path(path, file_size)
+        if not self._syntax_highlight_enabled:
+            # Wird beim Wiedereinschalten übernommen
+            self._stashed_lexer = lexer
+            return
+        self.highlighter.set_lexer(lexer)
+        self.semantic_highlighter.refresh()
+
+    def setPlainText(self, text):
+        """Setzt den Text; große Texte werden im Hintergrund tokenisiert."""
+        self._insert_deferred(text, super().setPlainText, text)
+
+    def insertFromMimeData(self, source):
+        """Fügt Daten ein; große Texte werden im Hintergrund tokenisiert."""
+        text = source.text() if source.hasText() else ""
+        self._insert_deferred(text, super().insertFromMimeData, source)
+
+    def _insert_deferred(self, text, insert, *args):
+        """Führt eine Einfügung aus, ohne große Texte synchron zu highlighten."""
+        if not self.highlighter.should_defer(text):
+            insert(*args)
+            return
+        self.highlighter.begin_deferred()
+        try:
+            insert(*args)
+        finally:
+            self.highlighter.end_deferred()
+
     def _delayed_update(self):
         """Verzögerte Aktualisierung des Editors."""
         if hasattr(self.highlighter, 'rehighlight_visible'):
@@ -165,9 +218,15 @@ class CodeEditor(QPlainTextEdit):
         else:
             self.highlighter.rehighlight()  # Fallback auf normale Hervorhebung
             
-        if self._minimap_enabled:
-            self.update_minimap()
+        minimap = self.get_minimap()
+        if self._minimap_enabled and minimap:
+            minimap.update()
             
+    def showEvent(self, event):
+        """Holt beim Anzeigen ausstehende Hervorhebungen nach (z.B. nach Theme-Wechsel)."""
+        super().showEvent(event)
+        self.highlighter.rehighlight_visible()
+
     def paintEvent(self, event):
         """Zeichnet den Editor-Inhalt."""
         super().paintEvent(event)
@@ -257,19 +316,42 @@ class CodeEditor(QPlainTextEdit):
     def toggle_feature(self, feature_name: str, enabled: bool):
         """Aktiviert/Deaktiviert Features für bessere Performance."""
         if feature_name == "syntax_highlight":
-            self._syntax_highlight_enabled = enabled
+            if enabled != self._syntax_highlight_enabled:
+                self._syntax_highlight_enabled = enabled
+                if enabled:
+                    self.highlighter.set_lexer(self._stashed_lexer)
+                else:
+                    self._stashed_lexer = self.highlighter.lexer
+                    self.highlighter.set_lexer(None)
+                    self.update_minimap()
+                self.semantic_highlighter.refresh()
         elif feature_name == "line_numbers":
             self._line_numbers_enabled = enabled
             self.line_number_area.setVisible(enabled)
         elif feature_name == "minimap":
             self._minimap_enabled = enabled
+            minimap = self.get_minimap()
+            if minimap:
+                minimap.setVisible(enabled)
+            # Kacheln können seit dem Ausblenden veraltet sein
+            self.update_minimap()
+        elif feature_name == "autocomplete":
+            self.auto_completer.enabled = enabled
+        elif feature_name == "current_line":
+            self._current_line_enabled = enabled
+            self._highlight_current_line()
+        elif feature_name == "semantic_highlight":
+            self.semantic_highlighter.set_enabled(enabled)
             
         self._delayed_update()
         
     def optimize_for_large_file(self):
         """Optimiert den Editor für große Dateien."""
+        self.large_file_mode = True
         self.toggle_feature("syntax_highlight", False)
         self.toggle_feature("minimap", False)
+        self.toggle_feature("autocomplete", False)
+        self.toggle_feature("current_line", False)
         self.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.setCenterOnScroll(False)
         self._document_cache.clear()
@@ -278,7 +360,7 @@ class CodeEditor(QPlainTextEdit):
         """Hebt die aktuelle Zeile hervor."""
         extra_selections = []
 
-        if not self.isReadOnly():
+        if not self.isReadOnly() and self._current_line_enabled:
             selection = QTextEdit.ExtraSelection()
             line_color = QColor(self.theme_styles['current_line'])
             selection.format.setBackground(line_color)
@@ -316,6 +398,20 @@ class CodeEditor(QPlainTextEdit):
         if rect.contains(self.viewport().rect()):
             self.update_line_number_area_width(0)
 
+    def go_to_line(self, line):
+        """Setzt den Cursor an den Anfang der Zeile (1-basiert).
+
+        findBlockByNumber sucht im Blockbaum des Dokuments (O(log n)), ein
+        eigener Index ist hier nicht nötig.
+        """
+        block = self.document().findBlockByNumber(line - 1)
+        if not block.isValid():
+            return False
+        cursor = QTextCursor(block)
+        self.setTextCursor(cursor)
+        self.centerCursor()
+        return True
+
     def find_text(self, text, case_sensitive=False, whole_words=False, search_forward=True):
         """Sucht nach Text im Editor."""
         if not text:
@@ -426,6 +522,21 @@ class CodeEditor(QPlainTextEdit):
             minimap.mark_cache_dirty()
             minimap.update()
             
+    def _on_formats_changed(self, first, end):
+        """Verwirft die Minimap-Kacheln der neu formatierten Blöcke.
+
+        Umfasst der Bereich das ganze Dokument (Theme- oder Lexerwechsel),
+        werden alle Kacheln verworfen.
+        """
+        minimap = self.get_minimap()
+        if not minimap or not self._minimap_enabled:
+            return
+        if first == 0 and end >= self.document().blockCount():
+            minimap.mark_cache_dirty()
+        else:
+            minimap.invalidate_blocks(first, end)
+        minimap.update()
+
     def _update_minimap_content(self, minimap):
         """Aktualisiert den Inhalt der Minimap."""
         if minimap:
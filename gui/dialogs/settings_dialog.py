@@ -278,9 +278,38 @@ class SettingsDialog(QDialog):
         self.show_line_numbers = QCheckBox(self.parent.tr("Show Line Numbers"))
         self.show_line_numbers.setChecked(True)
         editor_layout_inner.addWidget(self.show_line_numbers)
+
+        # Minimap als Übersicht des ganzen Dokuments
+        self.minimap_overview = QCheckBox(self.parent.tr("Minimap: Whole Document"))
+        self.minimap_overview.setChecked(getattr(self.parent, 'minimap_overview', False))
+        editor_layout_inner.addWidget(self.minimap_overview)
+
+        # Semantische Hervorhebung (Parameter, Attribute, Importe, Globale)
+        self.semantic_highlighting = QCheckBox(self.parent.tr("Semantic Highlighting"))
+        self.semantic_highlighting.setChecked(getattr(self.parent, 'semantic_highlighting', True))
+        editor_layout_inner.addWidget(self.semantic_highlighting)
         
         editor_group.setLayout(editor_layout_inner)
         editor_layout.addWidget(editor_group)
+
+        # Großdatei-Modus Gruppe
+        thresholds = getattr(self.parent, 'large_file_thresholds', {})
+        large_file_group = QGroupBox(self.parent.tr("Large File Mode"))
+        large_file_layout = QVBoxLayout()
+        self.large_file_size_spin = self._add_threshold_spin(
+            large_file_layout, self.parent.tr("Max File Size (MB)"),
+            1, 1024, thresholds.get('size_mb', 10)
+        )
+        self.large_file_line_count_spin = self._add_threshold_spin(
+            large_file_layout, self.parent.tr("Max Line Count"),
+            1000, 100000000, thresholds.get('line_count', 200000)
+        )
+        self.large_file_line_length_spin = self._add_threshold_spin(
+            large_file_layout, self.parent.tr("Max Line Length"),
+            100, 100000000, thresholds.get('max_line_length', 10000)
+        )
+        large_file_group.setLayout(large_file_layout)
+        editor_layout.addWidget(large_file_group)
         editor_layout.addStretch()
         self.tab_widget.addTab(editor_tab, self.parent.tr("Editor Settings"))
         
@@ -300,6 +329,18 @@ class SettingsDialog(QDialog):
         title_bar.mousePressEvent = self._title_bar_mouse_press
         title_bar.mouseMoveEvent = self._title_bar_mouse_move
 
+    def _add_threshold_spin(self, layout, label, minimum, maximum, value):
+        """Fügt eine beschriftete SpinBox für einen Schwellenwert hinzu."""
+        row = QHBoxLayout()
+        row.addWidget(QLabel(label + ":"))
+        spin = QSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setValue(value)
+        row.addWidget(spin)
+        row.addStretch()
+        layout.addLayout(row)
+        return spin
+
     def _title_bar_mouse_press(self, event):
         if event.button() == Qt.LeftButton:
             self._drag_pos = event.globalPos() - self.frameGeometry().topLeft()
@@ -343,5 +384,10 @@ class SettingsDialog(QDialog):
             'font_size': self.font_size_spin.value(),
             'tab_size': self.tab_size_spin.value(),
             'auto_indent': self.auto_indent.isChecked(),
-            'show_line_numbers': self.show_line_numbers.isChecked()
+            'show_line_numbers': self.show_line_numbers.isChecked(),
+            'minimap_overview': self.minimap_overview.isChecked(),
+            'semantic_highlighting': self.semantic_highlighting.isChecked(),
+            'large_file_size_mb': self.large_file_size_spin.value(),
+            'large_file_line_count': self.large_file_line_count_spin.value(),
+            'large_file_max_line_length': self.large_file_line_length_spin.value()
         }
@@ -2,15 +2,26 @@ from PySide6.QtWidgets import (
     QMainWindow, QVBoxLayout, QWidget, QFileDialog, QSplitter,
     QTreeView, QFileSystemModel, QTabWidget, QLabel, QMenuBar,
     QMenu, QStatusBar, QDialog, QMessageBox, QInputDialog,
-    QStackedWidget, QTreeWidget, QHBoxLayout, QFrame, QTabBar
+    QStackedWidget, QTreeWidget, QHBoxLayout, QFrame, QTabBar,
+    QProgressBar, QPushButton, QApplication
 )
-from PySide6.QtCore import Qt, QDir, QEvent, Signal
+from PySide6.QtCore import Qt, QDir, QEvent, QTimer, Signal
 from PySide6.QtGui import QPalette, QColor, QAction, QKeySequence
 from .code_editor import CodeEditor, EditorContainer
+from .large_file_view import LargeFileView, LARGE_FILE_THRESHOLD
+from .log_viewer import LogViewer, LOG_VIEWER_THRESHOLD
+from .lazy_tab import LazyTab
 from .dialogs.search_dialog import SearchDialog
 from .dialogs.settings_dialog import SettingsDialog
 from .minimap import MiniMap
 from .sidebar import SearchWidget
+from utils.file_loader import StreamingFileLoader, STREAMING_THRESHOLD
+from utils.file_saver import FileSaver
+from utils.journal import HotExitJournal
+from utils.file_watcher import ExternalChangeWatcher
+from utils.session import load_session, save_session
+from utils.encoding import sniff_file, decoding_name, describe
+from utils.file_stats import measure_file, exceeds_thresholds, DEFAULT_LARGE_FILE_THRESHOLDS
 from translations import TRANSLATIONS
 import os
 import sys
@@ -23,6 +34,15 @@ class EditorWindow(QMainWindow):
         super().__init__(parent)
         self.current_editor = None
         self.current_file = None
+        self._active_loader = None
+        self.large_file_thresholds = dict(DEFAULT_LARGE_FILE_THRESHOLDS)
+        self.minimap_overview = False
+        self.semantic_highlighting = True
+        self.file_saver = FileSaver(self)
+        self.journal = HotExitJournal(parent=self)
+        self.file_watcher = ExternalChangeWatcher(self)
+        # (Tab-Widget, Index) des Platzhalters, der gerade ersetzt wird
+        self._tab_slot = None
         
         # Grundeinstellungen
         self.current_theme = "dark"
@@ -121,8 +141,21 @@ class EditorWindow(QMainWindow):
         
         # UI-Einrichtung
         self.setup_status_bar()
+        self.file_saver.started.connect(self._on_save_started)
+        self.file_saver.saved.connect(self._on_file_saved)
+        self.file_saver.failed.connect(self._on_save_failed)
+        self.file_saver.saved.connect(self.file_watcher.mark_synced)
+        self.file_watcher.reloaded.connect(self._on_external_reload)
+        self.file_watcher.conflict.connect(self._on_external_conflict)
+        self.file_watcher.removed.connect(self._on_external_removal)
         self.apply_theme()
         self.retranslateUi()
+
+        # Tabs und ungespeicherte Puffer der letzten Sitzung wiederherstellen
+        self.restore_session()
+        self.restore_unsaved_buffers()
+        QApplication.instance().aboutToQuit.connect(self.save_session)
+        QApplication.instance().aboutToQuit.connect(self.journal.shutdown)
         
         # Fenster maximieren
         self.showMaximized()
@@ -234,6 +267,23 @@ class EditorWindow(QMainWindow):
         self.line_count_label = QLabel()
         self.status_bar.addWidget(self.line_count_label)
         
+        # Fortschritt beim Laden großer Dateien
+        self.load_progress = QProgressBar()
+        self.load_progress.setMaximumWidth(150)
+        self.load_progress.setMaximumHeight(14)
+        self.load_progress.setTextVisible(False)
+        self.load_progress.hide()
+        self.status_bar.addPermanentWidget(self.load_progress)
+        self.load_cancel_button = QPushButton("Abbrechen")
+        self.load_cancel_button.setFlat(True)
+        self.load_cancel_button.clicked.connect(self.cancel_file_loading)
+        self.load_cancel_button.hide()
+        self.status_bar.addPermanentWidget(self.load_cancel_button)
+
+        # Kodierung und Zeilenende
+        self.encoding_label = QLabel()
+        self.status_bar.addPermanentWidget(self.encoding_label)
+
         # Cursor-Position
         self.cursor_position_label = QLabel()
         self.status_bar.addPermanentWidget(self.cursor_position_label)
@@ -247,6 +297,12 @@ class EditorWindow(QMainWindow):
 
     def update_status_bar(self):
         """Aktualisiert die Statusleiste."""
+        large_view = self.tab_widget.currentWidget()
+        if isinstance(large_view, LargeFileView):
+            self._update_large_view_status(large_view)
+            self.encoding_label.setText("")
+            return
+
         current_editor = self.get_current_editor()
         if current_editor:
             # Zeilen zählen
@@ -266,10 +322,31 @@ class EditorWindow(QMainWindow):
             self.cursor_position_label.setText(
                 f"{self.tr('Line')}: {line}, {self.tr('Column')}: {col}"
             )
+            self.encoding_label.setText(describe(current_editor.editor.text_format))
         else:
+            self.encoding_label.setText("")
             self.line_count_label.setText(f"{self.tr('Lines')}: 0 | {self.tr('Code Lines')}: 0")
             self.cursor_position_label.setText("")
 
+    def _update_large_view_status(self, viewer):
+        """Zeigt Zeilenzahl und Cursorzeile einer Großdatei-Ansicht an.
+
+        Beide kommen aus dem Zeilenindex der Ansicht; solange er die Datei
+        noch nicht abdeckt, wird der Fortschritt angezeigt.
+        """
+        line = viewer.line_for_offset(viewer.cursor_position())
+        line_index = viewer.line_index
+        if line_index.complete:
+            self.line_count_label.setText(f"{self.tr('Lines')}: {line_index.line_count}")
+        else:
+            total = max(1, len(viewer.table))
+            self.line_count_label.setText(
+                f"{self.tr('Lines')}: … ({line_index.indexed_bytes * 100 // total}%)"
+            )
+        self.cursor_position_label.setText(
+            f"{self.tr('Line')}: {line + 1 if line is not None else '…'}"
+        )
+
     def create_menu(self):
         """Erstellt die Menüleiste."""
         menubar = self.menuBar()
@@ -355,7 +432,7 @@ class EditorWindow(QMainWindow):
     def create_editor(self):
         """Erstellt einen neuen Code-Editor."""
         # Container erstellen
-        container = EditorContainer(self)
+        container = self._create_container()
         
         # Tab mit Container erstellen
         index = self.tab_widget.addTab(container, "Untitled")
@@ -364,10 +441,19 @@ class EditorWindow(QMainWindow):
         # Editor aus Container zurückgeben
         return container.editor
 
+    def _create_container(self):
+        """Erstellt Editor und Minimap mit den aktuellen Einstellungen."""
+        container = EditorContainer(self)
+        container.minimap.set_overview(self.minimap_overview)
+        if not self.semantic_highlighting:
+            container.editor.toggle_feature("semantic_highlight", False)
+        return container
+
     def new_file(self):
         editor = self.create_editor()
         editor.update_theme(self.current_theme)
         editor.setProperty("file_path", "")
+        self.journal.attach(editor)
         self.update_status_bar()
         self.current_editor = editor
         self.current_editor_changed.emit()
@@ -388,29 +474,64 @@ class EditorWindow(QMainWindow):
         try:
             # Prüfen ob die Datei bereits geöffnet ist
             for i in range(self.tab_widget.count()):
-                editor = self.get_editor_at(i)
-                if editor and editor.editor.property("file_path") == file_path:
+                if self.get_file_path_at(i) == file_path:
                     self.tab_widget.setCurrentIndex(i)
                     return
 
-            # Datei einlesen
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            # Sehr große Dateien nicht einlesen, sondern mappen
+            if os.path.getsize(file_path) >= LOG_VIEWER_THRESHOLD:
+                self.open_log_file(file_path)
+                return
+            if os.path.getsize(file_path) >= LARGE_FILE_THRESHOLD:
+                self.open_large_file(file_path)
+                return
 
             # Container und Editor erstellen
-            container = EditorContainer(self)
+            container = self._create_container()
             editor = container.editor
             
-            # Editor konfigurieren
-            editor.setPlainText(text)
+            # Editor konfigurieren (Theme und Lexer vor dem Einfügen wählen,
+            # damit der Text nur einmal hervorgehoben wird)
+            stats = measure_file(file_path, self.large_file_thresholds)
+            file_size = stats.size
+            editor.update_theme(self.current_theme == "dark")
+            if exceeds_thresholds(stats, self.large_file_thresholds):
+                # Hervorhebung, Minimap usw. abschalten, bevor Text eingefügt wird
+                editor.optimize_for_large_file()
+                # Die Messung endet beim ersten überschrittenen Schwellenwert
+                thresholds = self.large_file_thresholds
+                if stats.size > thresholds['size_mb'] * 1024 * 1024:
+                    reason = f"{stats.size / (1024 * 1024):.1f} MB"
+                elif stats.line_count > thresholds['line_count']:
+                    reason = f"mehr als {thresholds['line_count']} Zeilen"
+                else:
+                    reason = f"Zeilen mit mehr als {thresholds['max_line_length']} Zeichen"
+                self.status_bar.showMessage(f"Großdatei-Modus: {reason}", 3000)
+            editor.set_language_for_path(file_path, file_size)
             editor.setProperty("file_path", file_path)
+            # Kodierung und Zeilenende aus Anfang und Ende der Datei ablesen
+            editor.text_format = sniff_file(file_path)
+            encoding = decoding_name(editor.text_format)
+
+            if file_size >= STREAMING_THRESHOLD:
+                # Große Dateien im Hintergrund dekodieren und stückweise einfügen
+                self._start_streaming_load(container, file_path, encoding)
+            else:
+                try:
+                    with open(file_path, 'r', encoding=encoding) as f:
+                        text = f.read()
+                except UnicodeDecodeError:
+                    # Stichprobe war gültig, der Rest nicht: Latin-1 dekodiert alles
+                    editor.text_format = editor.text_format._replace(encoding='latin-1', bom=False)
+                    with open(file_path, 'r', encoding='latin-1') as f:
+                        text = f.read()
+                editor.setPlainText(text)
+                self.journal.attach(editor)
+                self.file_watcher.watch(editor)
             
             # Tab erstellen und konfigurieren
-            index = self.tab_widget.addTab(container, os.path.basename(file_path))
-            self.tab_widget.setCurrentIndex(index)
+            self._add_file_tab(container, os.path.basename(file_path))
             
-            # Theme aktualisieren
-            editor.update_theme(self.current_theme == "dark")
             self.update_status_bar()
             self.current_editor = container
             self.current_editor_changed.emit()
@@ -420,7 +541,268 @@ class EditorWindow(QMainWindow):
             self.status_bar.showMessage(error_msg, 3000)
             print(f"Error loading file: {str(e)}")  # Für Debug-Zwecke
 
+    def _add_file_tab(self, widget, title):
+        """Fügt einen Datei-Tab hinzu, beim Nachladen an der Stelle des Platzhalters."""
+        if self._tab_slot is not None:
+            tab_widget, index = self._tab_slot
+            self._tab_slot = None
+            index = tab_widget.insertTab(index, widget, title)
+        else:
+            tab_widget = self.tab_widget
+            index = tab_widget.addTab(widget, title)
+        tab_widget.setCurrentIndex(index)
+
+    def _tab_widgets(self):
+        """Alle Tab-Widgets (mehrere bei geteilter Ansicht)."""
+        return [self.editor_splitter.widget(i) for i in range(self.editor_splitter.count())
+                if isinstance(self.editor_splitter.widget(i), QTabWidget)]
+
+    def restore_session(self):
+        """Legt für die Tabs der letzten Sitzung Platzhalter an.
+
+        Editoren werden erst beim ersten Anzeigen eines Tabs erzeugt, damit
+        der Start mit vielen Tabs schnell bleibt.
+        """
+        session = load_session()
+        for tab in session['tabs']:
+            path = tab['path']
+            if not os.path.isfile(path):
+                continue
+            placeholder = LazyTab(path, tab['cursor'], tab['scroll'])
+            # Verzögert, da der Tab während der Anzeige ersetzt wird
+            placeholder.activated.connect(self._materialize_tab, Qt.QueuedConnection)
+            self.tab_widget.addTab(placeholder, os.path.basename(path))
+        if self.tab_widget.count():
+            self.tab_widget.setCurrentIndex(
+                max(0, min(session['current'], self.tab_widget.count() - 1))
+            )
+
+    def _materialize_tab(self, placeholder):
+        """Ersetzt einen Platzhalter durch den echten Tab der Datei."""
+        for tab_widget in self._tab_widgets():
+            index = tab_widget.indexOf(placeholder)
+            if index >= 0:
+                break
+        else:
+            return
+        if tab_widget.currentIndex() != index:
+            # Nur kurz angezeigt, während ein anderer Platzhalter ersetzt wurde
+            return
+        tab_widget.blockSignals(True)
+        tab_widget.removeTab(index)
+        tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        self._tab_slot = (tab_widget, index)
+        self.load_file(placeholder.property("file_path"))
+        if self._tab_slot is not None:
+            # Laden fehlgeschlagen; die Meldung steht schon in der Statusleiste
+            self._tab_slot = None
+            return
+        widget = tab_widget.widget(index)
+        if isinstance(widget, EditorContainer):
+            editor = widget.editor
+            loader = self._active_loader
+            if loader is not None and loader.editor is editor and loader.is_running():
+                loader.finished.connect(
+                    lambda: self._restore_view_state(editor, placeholder.cursor, placeholder.scroll))
+            else:
+                self._restore_view_state(editor, placeholder.cursor, placeholder.scroll)
+        elif isinstance(widget, LargeFileView):
+            widget.set_cursor_position(placeholder.cursor)
+
+    def _restore_view_state(self, editor, position, scroll):
+        cursor = editor.textCursor()
+        cursor.setPosition(min(position, editor.document().characterCount() - 1))
+        editor.setTextCursor(cursor)
+        # Erst nach dem Layout ist der Scrollbereich groß genug
+        QTimer.singleShot(0, lambda: editor.verticalScrollBar().setValue(scroll))
+
+    def save_session(self):
+        """Speichert die offenen Dateien mit Cursor und Scrollposition.
+
+        Geänderte Puffer fehlen hier; sie stellt das Journal wieder her.
+        """
+        tabs = []
+        current = 0
+        for tab_widget in self._tab_widgets():
+            for i in range(tab_widget.count()):
+                widget = tab_widget.widget(i)
+                path = widget.property("file_path")
+                if isinstance(widget, EditorContainer):
+                    editor = widget.editor
+                    path = editor.property("file_path")
+                    if not path or editor.document().isModified():
+                        continue
+                    state = (editor.textCursor().position(), editor.verticalScrollBar().value())
+                elif isinstance(widget, LazyTab):
+                    state = (widget.cursor, widget.scroll)
+                elif isinstance(widget, LargeFileView):
+                    state = (widget.cursor_position(), 0)
+                else:
+                    continue
+                if widget is self.tab_widget.currentWidget():
+                    current = len(tabs)
+                tabs.append({'path': path, 'cursor': state[0], 'scroll': state[1]})
+        try:
+            save_session(tabs, current)
+        except OSError as e:
+            print(f"Error saving session: {str(e)}")  # Für Debug-Zwecke
+
+    def restore_unsaved_buffers(self):
+        """Öffnet die Puffer aus dem Journal mit Cursor und Scrollposition."""
+        restored = 0
+        for buffer_id in self.journal.restorable_buffers():
+            container = self._create_container()
+            editor = container.editor
+            editor.update_theme(self.current_theme == "dark")
+            try:
+                meta = self.journal.restore(buffer_id, editor)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Error restoring buffer {buffer_id}: {str(e)}")  # Für Debug-Zwecke
+                container.deleteLater()
+                continue
+            path = meta['path']
+            if path:
+                editor.set_language_for_path(path)
+                self.file_watcher.watch(editor)
+            title = os.path.basename(path) if path else "Untitled"
+            self.tab_widget.addTab(container, title)
+            restored += 1
+        if restored:
+            self.tab_widget.setCurrentIndex(self.tab_widget.count() - 1)
+            self.update_status_bar()
+            self.status_bar.showMessage(
+                f"{restored} ungespeicherte Datei(en) wiederhergestellt", 3000
+            )
+
+    def _start_streaming_load(self, container, file_path, encoding='utf-8'):
+        """Startet das schrittweise Laden und zeigt den Fortschritt an."""
+        if self._active_loader is not None and self._active_loader.is_running():
+            # Nur ein Ladevorgang wird in der Statusleiste angezeigt
+            self._active_loader.progress.disconnect(self._on_load_progress)
+        loader = StreamingFileLoader(container.editor, file_path, encoding, parent=container)
+        loader.progress.connect(self._on_load_progress)
+        loader.finished.connect(lambda: self._on_load_finished(loader))
+        loader.failed.connect(lambda message: self._on_load_failed(loader, container, message))
+        self._active_loader = loader
+        self.load_progress.setRange(0, 1000)
+        self.load_progress.setValue(0)
+        self.load_progress.show()
+        self.load_cancel_button.show()
+        loader.start()
+
+    def _on_load_progress(self, loaded, total):
+        """Aktualisiert den Fortschrittsbalken."""
+        self.load_progress.setValue(int(loaded / total * 1000) if total else 1000)
+
+    def _hide_load_progress(self, loader):
+        if loader is self._active_loader:
+            self._active_loader = None
+            self.load_progress.hide()
+            self.load_cancel_button.hide()
+
+    def _on_load_finished(self, loader):
+        """Blendet den Fortschritt nach dem Laden aus."""
+        self._hide_load_progress(loader)
+        self.journal.attach(loader.editor)
+        self.file_watcher.watch(loader.editor)
+        self.update_status_bar()
+
+    def _on_load_failed(self, loader, container, message):
+        """Meldet einen Ladefehler und schließt den unvollständigen Tab."""
+        self._hide_load_progress(loader)
+        self._remove_tab_widget(container)
+        self.status_bar.showMessage(f"Fehler beim Öffnen der Datei: {message}", 3000)
+
+    def cancel_file_loading(self):
+        """Bricht das angezeigte Laden ab und schließt den Tab.
+
+        Ein halb geladener Tab würde beim Speichern die Datei abschneiden.
+        """
+        loader = self._active_loader
+        if loader is None:
+            return
+        loader.cancel()
+        self._hide_load_progress(loader)
+        self._remove_tab_widget(loader.parent())
+        self.status_bar.showMessage("Laden abgebrochen", 3000)
+
+    def _remove_tab_widget(self, widget):
+        """Entfernt den Tab, der widget enthält."""
+        index = self.tab_widget.indexOf(widget)
+        if index >= 0:
+            self.tab_widget.removeTab(index)
+        widget.deleteLater()
+
+    def open_large_file(self, file_path):
+        """Öffnet eine sehr große Datei in der Großdatei-Ansicht."""
+        view = LargeFileView(file_path, self)
+        view.update_theme(self.current_theme == "dark")
+        view.cursor_moved.connect(self.update_status_bar)
+        self._add_file_tab(view, os.path.basename(file_path))
+        self.update_status_bar()
+        self.status_bar.showMessage(
+            f"Große Datei im Großdatei-Modus geöffnet: {os.path.basename(file_path)}", 3000
+        )
+
+    def open_log_file_dialog(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, self.tr("Open Log File"))
+        if file_path:
+            self.open_log_file(file_path)
+
+    def open_log_file(self, file_path):
+        """Öffnet eine Datei schreibgeschützt im Log-Viewer."""
+        for i in range(self.tab_widget.count()):
+            if self.get_file_path_at(i) == file_path:
+                self.tab_widget.setCurrentIndex(i)
+                return
+        try:
+            viewer = LogViewer(file_path, self)
+        except OSError as e:
+            self.status_bar.showMessage(f"Fehler beim Öffnen der Datei: {str(e)}", 3000)
+            return
+        viewer.update_theme(self.current_theme == "dark")
+        viewer.cursor_moved.connect(self.update_status_bar)
+        viewer.index_progress.connect(self.update_status_bar)
+        viewer.search_finished.connect(self._on_log_search_finished)
+        self._add_file_tab(viewer, os.path.basename(file_path))
+        self.update_status_bar()
+        self.status_bar.showMessage(
+            f"Schreibgeschützt geöffnet: {os.path.basename(file_path)}", 3000
+        )
+
+    def _on_log_search_finished(self, start, end):
+        if start < 0:
+            self.status_bar.showMessage("Keine Treffer gefunden", 3000)
+            return
+        viewer = self.sender()
+        line = viewer.line_for_offset(start) if viewer else None
+        if line is not None:
+            self.status_bar.showMessage(f"Treffer in Zeile {line + 1}", 3000)
+
+    def show_go_to_line_dialog(self):
+        """Fragt eine Zeilennummer ab und springt dorthin."""
+        widget = self.tab_widget.currentWidget()
+        if isinstance(widget, LargeFileView):
+            target = widget
+            maximum = widget.line_index.line_count or 2147483647
+        elif isinstance(widget, EditorContainer):
+            target = widget.editor
+            maximum = widget.editor.blockCount()
+        else:
+            return
+        line, ok = QInputDialog.getInt(
+            self, self.tr("Go to Line"), self.tr("Line number:"), 1, 1, maximum
+        )
+        if ok and not target.go_to_line(line):
+            self.status_bar.showMessage("Zeile ist noch nicht indexiert", 3000)
+
     def save_file(self):
+        large_view = self.tab_widget.currentWidget()
+        if isinstance(large_view, LargeFileView):
+            self._save_large_view(large_view, large_view.property("file_path"))
+            return
+
         current_editor = self.get_current_editor()
         if not current_editor:
             return
@@ -430,26 +812,101 @@ class EditorWindow(QMainWindow):
             self.save_file_as()
             return
 
-        with open(path, "w", encoding="utf-8") as file:
-            file.write(current_editor.editor.toPlainText())
+        self._save_editor(current_editor.editor, path)
 
     def save_file_as(self):
+        large_view = self.tab_widget.currentWidget()
         current_editor = self.get_current_editor()
-        if not current_editor:
+        if not current_editor and not isinstance(large_view, LargeFileView):
             return
 
         path, _ = QFileDialog.getSaveFileName(
             self, self.tr("Save As"), "",
             self.tr("All Files (*.*)")
         )
-        if path:
-            with open(path, "w", encoding="utf-8") as file:
-                file.write(current_editor.editor.toPlainText())
+        if not path:
+            return
+        if isinstance(large_view, LargeFileView):
+            self._save_large_view(large_view, path, check_read_only=False)
+        else:
+            self._save_editor(current_editor.editor, path)
             current_editor.editor.setProperty("file_path", path)
-            self.tab_widget.setTabText(
-                self.tab_widget.currentIndex(),
-                os.path.basename(path)
-            )
+            current_editor.editor.set_language_for_path(path)
+            self.file_watcher.watch(current_editor.editor)
+        self.tab_widget.setTabText(
+            self.tab_widget.currentIndex(),
+            os.path.basename(path)
+        )
+
+    def _save_editor(self, editor, path):
+        """Speichert den Editorinhalt im Hintergrund.
+
+        toPlainText() ist der Schnappschuss; Kodieren und Schreiben laufen
+        im Worker. Das Dokument gilt erst nach erfolgreichem Schreiben als
+        unverändert, und nur wenn seit dem Schnappschuss nichts getippt
+        wurde; schlägt das Schreiben fehl, gilt es als geändert.
+        ``revision()`` taugt dafür nicht, sie steigt auch beim Hervorheben.
+        """
+        document = editor.document()
+        text = editor.toPlainText()
+        edited = []
+
+        def on_change(position, chars_removed, chars_added):
+            if chars_removed or chars_added:
+                edited.append(True)
+        document.contentsChange.connect(on_change)
+
+        def on_saved(error):
+            try:
+                document.contentsChange.disconnect(on_change)
+            except RuntimeError:
+                # Tab wurde inzwischen geschlossen
+                return
+            if error is not None:
+                # Nach "Speichern unter" liegt der Inhalt sonst nirgends
+                document.setModified(True)
+            elif not edited:
+                document.setModified(False)
+        self.file_saver.save_text(path, text, editor.text_format, callback=on_saved)
+
+    def _save_large_view(self, view, path, check_read_only=True):
+        """Speichert eine Großdatei-Ansicht im Hintergrund."""
+        if check_read_only and view.read_only:
+            self.status_bar.showMessage("Die Datei ist schreibgeschützt geöffnet", 3000)
+            return
+        if view.saving:
+            # Änderungen sind bis zum Ende des Speicherns gesperrt
+            return
+        chunks = view.begin_save()
+        # Das Mapping wird erst nach dem Schreiben der temporären Datei freigegeben
+        self.file_saver.save(
+            path, chunks,
+            callback=lambda error: view.finish_save(path, error),
+            release=view.table.close
+        )
+
+    def _on_save_started(self, path):
+        self.status_bar.showMessage(f"Speichere {os.path.basename(path)} …")
+
+    def _on_file_saved(self, path):
+        self.status_bar.showMessage(f"Gespeichert: {os.path.basename(path)}", 3000)
+
+    def _on_external_reload(self, path):
+        self.status_bar.showMessage(
+            f"Extern geändert, neu geladen: {os.path.basename(path)}", 3000
+        )
+
+    def _on_external_conflict(self, path):
+        self.status_bar.showMessage(
+            f"{os.path.basename(path)} wurde extern geändert; "
+            f"ungespeicherte Änderungen bleiben erhalten", 5000
+        )
+
+    def _on_external_removal(self, path):
+        self.status_bar.showMessage(f"{os.path.basename(path)} wurde gelöscht", 5000)
+
+    def _on_save_failed(self, path, message):
+        self.status_bar.showMessage(f"Fehler beim Speichern: {message}", 5000)
 
     def close_tab(self, index):
         """Schließt den Tab mit dem angegebenen Index."""
@@ -462,6 +919,18 @@ class EditorWindow(QMainWindow):
         widget = sender.widget(index)
         if widget:
             sender.removeTab(index)
+            if isinstance(widget, LargeFileView):
+                widget.close_file()
+            elif isinstance(widget, EditorContainer):
+                # Laufendes Laden abbrechen, sonst füllt der Timer den
+                # geschlossenen Editor weiter und der Fortschritt bleibt stehen
+                for loader in widget.findChildren(StreamingFileLoader):
+                    if loader.is_running():
+                        loader.cancel()
+                        self._hide_load_progress(loader)
+                # Geschlossene Tabs werden nicht wiederhergestellt
+                self.journal.detach(widget.editor)
+                self.file_watcher.unwatch(widget.editor)
             
         # Wenn das Tab-Widget leer ist und es nicht das letzte ist, entfernen
         if sender.count() == 0 and self.editor_splitter.count() > 1:
@@ -741,6 +1210,13 @@ class EditorWindow(QMainWindow):
 
     def show_search_dialog(self):
         """Zeigt den Suchdialog."""
+        viewer = self.tab_widget.currentWidget()
+        if isinstance(viewer, LogViewer):
+            dialog = SearchDialog(self)
+            dialog.search_requested.connect(viewer.find_text)
+            dialog.exec()
+            return
+
         current_editor = self.get_current_editor()
         if current_editor:
             dialog = SearchDialog(self)
@@ -826,12 +1302,23 @@ class EditorWindow(QMainWindow):
             return tab
         return None
 
+    def get_file_path_at(self, index):
+        """Gibt den Dateipfad des Tabs am Index zurück (auch Großdateien)."""
+        tab = self.tab_widget.widget(index)
+        if isinstance(tab, EditorContainer):
+            return tab.editor.property("file_path")
+        if isinstance(tab, (LargeFileView, LazyTab)):
+            return tab.property("file_path")
+        return None
+
     def update_editor_themes(self):
         """Aktualisiert das Theme für alle Editor-Instanzen."""
         for i in range(self.tab_widget.count()):
             editor = self.get_editor_at(i)
             if editor:
                 editor.editor.update_theme(self.current_theme == "dark")
+            elif isinstance(self.tab_widget.widget(i), LargeFileView):
+                self.tab_widget.widget(i).update_theme(self.current_theme == "dark")
 
     def show_file_tree(self):
         """Zeigt den Dateibaum an."""
@@ -852,6 +1339,8 @@ class EditorWindow(QMainWindow):
             self.current_editor = self.tab_widget.widget(index)
         else:
             self.current_editor = None
+        # Kodierung und Zeilenende gehören zum jeweiligen Tab
+        self.update_status_bar()
         self.current_editor_changed.emit()
 
     def show_settings_dialog(self):
@@ -876,11 +1365,25 @@ class EditorWindow(QMainWindow):
             
             if theme_changed:
                 self.apply_theme()
+
+            # Schwellenwerte gelten für die nächsten geöffneten Dateien
+            self.large_file_thresholds = {
+                'size_mb': settings["large_file_size_mb"],
+                'line_count': settings["large_file_line_count"],
+                'max_line_length': settings["large_file_max_line_length"],
+            }
             
+            self.minimap_overview = settings["minimap_overview"]
+            semantic_changed = settings["semantic_highlighting"] != self.semantic_highlighting
+            self.semantic_highlighting = settings["semantic_highlighting"]
+
             # Editor-Einstellungen anwenden
             for i in range(self.tab_widget.count()):
                 editor = self.get_editor_at(i)
                 if editor:
+                    editor.minimap.set_overview(self.minimap_overview)
+                    if semantic_changed:
+                        editor.editor.toggle_feature("semantic_highlight", self.semantic_highlighting)
                     font = editor.editor.font()
                     font.setPointSize(settings["font_size"])
                     editor.editor.setFont(font)
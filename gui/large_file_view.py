@@ -0,0 +1,394 @@
+"""Ansicht für sehr große Dateien auf Basis einer Piece Table."""
+from PySide6.QtWidgets import QAbstractScrollArea
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QPainter, QColor, QFont, QFontMetrics
+
+from themes import WindsurfTheme
+from utils.piece_table import PieceTable
+from utils.line_index import LineIndex
+
+# Ab dieser Dateigröße wird die Großdatei-Ansicht statt des Editors benutzt
+LARGE_FILE_THRESHOLD = 50 * 1024 * 1024
+
+
+class LargeFileView(QAbstractScrollArea):
+    """Zeigt und bearbeitet Dateien, ohne sie vollständig zu laden.
+
+    Der Inhalt liegt in einer ``PieceTable`` über der gemappten Datei. Die
+    Ansicht kennt nur den Byte-Offset der ersten sichtbaren Zeile und liest
+    beim Zeichnen genau die sichtbaren Zeilen. Die Scrollleiste bildet Byte-
+    Offsets ab, damit beim Öffnen keine Zeilen gezählt werden müssen.
+    """
+
+    # Auflösung der vertikalen Scrollleiste
+    SCROLL_STEPS = 1 << 20
+    # Längere Zeilen werden abgeschnitten angezeigt
+    MAX_LINE_BYTES = 16384
+    TAB_WIDTH = 4
+    WHEEL_LINES = 3
+
+    cursor_moved = Signal()
+
+    def __init__(self, path, parent=None, read_only=False):
+        super().__init__(parent)
+        self.table = PieceTable(path)
+        self.line_index = LineIndex(self.table)
+        self.read_only = read_only
+        # Während des Speicherns sind Änderungen gesperrt
+        self.saving = False
+        self._close_pending = False
+        self.setProperty("file_path", path)
+
+        self._top = 0
+        self._cursor = 0
+        self._highlight = None
+        self._max_width = 0
+        self._line_cache = None
+
+        font = QFont("Consolas", 10)
+        font.setStyleHint(QFont.Monospace)
+        self.setFont(font)
+        self.viewport().setCursor(Qt.IBeamCursor)
+        self.setFocusPolicy(Qt.StrongFocus)
+
+        self.verticalScrollBar().setRange(0, self.SCROLL_STEPS)
+        self.verticalScrollBar().valueChanged.connect(self._on_scrollbar_moved)
+        self.horizontalScrollBar().valueChanged.connect(self.viewport().update)
+
+        self.update_theme(True)
+
+    def update_theme(self, is_dark=True):
+        """Übernimmt die Editor-Farben des Themes."""
+        styles = WindsurfTheme.get_editor_styles(is_dark)
+        self._colors = {
+            'background': QColor(styles['background']),
+            'foreground': QColor(styles['foreground']),
+            'current_line': QColor(styles['current_line']),
+            'selection': QColor(styles['selection_background']),
+        }
+        self.viewport().update()
+
+    # Zeilen
+
+    def _line_height(self):
+        return QFontMetrics(self.font()).height()
+
+    def _visible_line_count(self):
+        return max(1, self.viewport().height() // max(1, self._line_height()) + 1)
+
+    def _next_line_start(self, offset):
+        """Anfang der Zeile nach der Zeile ab offset (oder None am Ende)."""
+        end = self.table.line_end(offset)
+        return end + 1 if end < len(self.table) else None
+
+    def _read_line(self, offset):
+        """Gibt den (ggf. gekürzten) Text der Zeile ab offset zurück."""
+        newline = self.table.find_byte(b'\n', offset, offset + self.MAX_LINE_BYTES)
+        end = newline if newline != -1 else min(len(self.table), offset + self.MAX_LINE_BYTES)
+        data = self.table.read(offset, end - offset)
+        if data.endswith(b'\r'):
+            data = data[:-1]
+        return data.decode('utf-8', 'replace')
+
+    def _visible_lines(self):
+        """Liste aus (Offset, Text) der sichtbaren Zeilen."""
+        if self._line_cache is not None and self._line_cache[0] == self._top:
+            return self._line_cache[1]
+        lines = []
+        offset = self._top
+        for _ in range(self._visible_line_count()):
+            lines.append((offset, self._read_line(offset)))
+            offset = self._next_line_start(offset)
+            if offset is None:
+                break
+        self._line_cache = (self._top, lines)
+        return lines
+
+    def _invalidate(self):
+        self._line_cache = None
+        self.viewport().update()
+
+    # Scrollen
+
+    def _set_top(self, offset):
+        """Setzt die erste sichtbare Zeile und führt die Scrollleiste nach."""
+        self._top = self.table.line_start(max(0, min(offset, len(self.table))))
+        length = len(self.table)
+        scrollbar = self.verticalScrollBar()
+        scrollbar.blockSignals(True)
+        scrollbar.setValue(int(self._top / length * self.SCROLL_STEPS) if length else 0)
+        scrollbar.blockSignals(False)
+        self._invalidate()
+
+    def _on_scrollbar_moved(self, value):
+        offset = int(value / self.SCROLL_STEPS * len(self.table))
+        self._top = self.table.line_start(offset)
+        self._invalidate()
+
+    def scroll_lines(self, count):
+        """Scrollt um count Zeilen (negativ nach oben)."""
+        offset = self._top
+        for _ in range(abs(count)):
+            if count > 0:
+                following = self._next_line_start(offset)
+                if following is None:
+                    break
+                offset = following
+            else:
+                if offset == 0:
+                    break
+                offset = self.table.line_start(offset - 1)
+        self._set_top(offset)
+
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() // 120
+        if steps:
+            self.scroll_lines(-steps * self.WHEEL_LINES)
+        event.accept()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.verticalScrollBar().setPageStep(self.SCROLL_STEPS // 100)
+        self._invalidate()
+
+    # Cursor
+
+    def cursor_position(self):
+        """Byte-Offset des Cursors."""
+        return self._cursor
+
+    def set_cursor_position(self, offset):
+        """Setzt den Cursor und scrollt ihn in den sichtbaren Bereich."""
+        self._cursor = max(0, min(offset, len(self.table)))
+        self._ensure_cursor_visible()
+        self.viewport().update()
+        self.cursor_moved.emit()
+
+    def _ensure_cursor_visible(self):
+        line_start = self.table.line_start(self._cursor)
+        if line_start < self._top:
+            self._set_top(line_start)
+            return
+        lines = self._visible_lines()
+        # Die letzte Zeile ist nur teilweise sichtbar
+        fully_visible = lines[:max(1, len(lines) - 1)]
+        if any(offset == line_start for offset, _text in fully_visible):
+            return
+        self._set_top(line_start)
+        self.scroll_lines(-(len(fully_visible) - 1))
+
+    def _column_of(self, offset):
+        """Zeichenspalte von offset innerhalb seiner Zeile."""
+        line_start = self.table.line_start(offset)
+        return len(self.table.read(line_start, offset - line_start).decode('utf-8', 'replace'))
+
+    def _offset_in_line(self, line_start, column):
+        """Byte-Offset der Zeichenspalte column in der Zeile ab line_start."""
+        text = self._read_line(line_start)
+        return line_start + len(text[:column].encode('utf-8'))
+
+    def _char_length_before(self, offset):
+        """Länge des UTF-8-Zeichens vor offset in Bytes."""
+        data = self.table.read(max(0, offset - 4), min(4, offset))
+        length = 1
+        while length < len(data) and 0x80 <= data[-length] < 0xC0:
+            length += 1
+        return length
+
+    def _char_length_at(self, offset):
+        """Länge des UTF-8-Zeichens ab offset in Bytes."""
+        data = self.table.read(offset, 4)
+        length = 1
+        while length < len(data) and 0x80 <= data[length] < 0xC0:
+            length += 1
+        return length
+
+    def line_for_offset(self, offset):
+        """Zeilennummer (0-basiert) von offset oder None, falls (noch) unbekannt."""
+        return self.line_index.line_for_offset(offset)
+
+    def go_to_line(self, line):
+        """Springt zur Zeile (1-basiert); False, wenn sie (noch) unbekannt ist."""
+        offset = self.line_index.offset_for_line(line - 1)
+        if offset is None:
+            return False
+        self._set_top(offset)
+        self.set_cursor_position(offset)
+        return True
+
+    def set_highlight(self, start, end):
+        """Markiert den Bereich [start, end), z.B. einen Suchtreffer."""
+        self._highlight = (start, end) if end > start else None
+        self.viewport().update()
+
+    def _move_vertical(self, lines):
+        column = self._column_of(self._cursor)
+        offset = self.table.line_start(self._cursor)
+        for _ in range(abs(lines)):
+            if lines > 0:
+                following = self._next_line_start(offset)
+                if following is None:
+                    break
+                offset = following
+            else:
+                if offset == 0:
+                    break
+                offset = self.table.line_start(offset - 1)
+        self.set_cursor_position(self._offset_in_line(offset, column))
+
+    # Bearbeiten
+
+    def _insert(self, data):
+        self.line_index.update(self._cursor, 0, 0, len(data), data.count(b'\n'))
+        self.table.insert(self._cursor, data)
+        self._cursor += len(data)
+        self._after_edit()
+
+    def _delete(self, offset, size):
+        removed = self.table.read(offset, size)
+        self.line_index.update(offset, len(removed), removed.count(b'\n'), 0, 0)
+        self.table.delete(offset, size)
+        self._cursor = offset
+        self._after_edit()
+
+    def _after_edit(self):
+        self._line_cache = None
+        self._ensure_cursor_visible()
+        self.viewport().update()
+        self.cursor_moved.emit()
+
+    def keyPressEvent(self, event):
+        key = event.key()
+        control = event.modifiers() & Qt.ControlModifier
+        length = len(self.table)
+        if key == Qt.Key_Left:
+            if self._cursor:
+                self.set_cursor_position(self._cursor - self._char_length_before(self._cursor))
+        elif key == Qt.Key_Right:
+            if self._cursor < length:
+                self.set_cursor_position(self._cursor + self._char_length_at(self._cursor))
+        elif key == Qt.Key_Up:
+            self._move_vertical(-1)
+        elif key == Qt.Key_Down:
+            self._move_vertical(1)
+        elif key == Qt.Key_PageUp:
+            self._move_vertical(-(self._visible_line_count() - 1))
+        elif key == Qt.Key_PageDown:
+            self._move_vertical(self._visible_line_count() - 1)
+        elif key == Qt.Key_Home:
+            self.set_cursor_position(0 if control else self.table.line_start(self._cursor))
+        elif key == Qt.Key_End:
+            self.set_cursor_position(length if control else self.table.line_end(self._cursor))
+        elif self.read_only or self.saving:
+            super().keyPressEvent(event)
+        elif key == Qt.Key_Backspace:
+            if self._cursor:
+                size = self._char_length_before(self._cursor)
+                self._delete(self._cursor - size, size)
+        elif key == Qt.Key_Delete:
+            if self._cursor < length:
+                self._delete(self._cursor, self._char_length_at(self._cursor))
+        elif key in (Qt.Key_Return, Qt.Key_Enter):
+            self._insert(b'\n')
+        elif key == Qt.Key_Tab:
+            self._insert(b' ' * self.TAB_WIDTH)
+        elif event.text() and event.text().isprintable() and not control:
+            self._insert(event.text().encode('utf-8'))
+        else:
+            super().keyPressEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() != Qt.LeftButton:
+            return super().mousePressEvent(event)
+        lines = self._visible_lines()
+        if not lines:
+            return
+        row = min(len(lines) - 1, int(event.position().y()) // self._line_height())
+        line_start, text = lines[row]
+        char_width = max(1, QFontMetrics(self.font()).horizontalAdvance(' '))
+        target = (event.position().x() + self.horizontalScrollBar().value()) / char_width
+        column = 0
+        visual = 0
+        for char in text:
+            width = self.TAB_WIDTH - visual % self.TAB_WIDTH if char == '\t' else 1
+            if visual + width / 2 > target:
+                break
+            visual += width
+            column += 1
+        self.set_cursor_position(line_start + len(text[:column].encode('utf-8')))
+
+    # Zeichnen
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        painter.fillRect(event.rect(), self._colors['background'])
+        painter.setFont(self.font())
+        metrics = QFontMetrics(self.font())
+        line_height = metrics.height()
+        x_offset = -self.horizontalScrollBar().value()
+        cursor_line = self.table.line_start(self._cursor)
+
+        max_width = self._max_width
+        for row, (offset, text) in enumerate(self._visible_lines()):
+            top = row * line_height
+            display = text.expandtabs(self.TAB_WIDTH)
+            if self._highlight and self._highlight[0] <= offset + len(text.encode('utf-8')) \
+                    and self._highlight[1] > offset:
+                self._paint_highlight(painter, metrics, offset, text, top, x_offset)
+            if offset == cursor_line:
+                painter.fillRect(0, top, self.viewport().width(), line_height,
+                                 self._colors['current_line'])
+                prefix = self.table.read(offset, self._cursor - offset).decode('utf-8', 'replace')
+                caret_x = x_offset + metrics.horizontalAdvance(prefix.expandtabs(self.TAB_WIDTH))
+                painter.fillRect(caret_x, top, 2, line_height, self._colors['foreground'])
+            painter.setPen(self._colors['foreground'])
+            painter.drawText(x_offset, top + metrics.ascent(), display)
+            max_width = max(max_width, metrics.horizontalAdvance(display))
+        painter.end()
+
+        if max_width != self._max_width:
+            self._max_width = max_width
+            self.horizontalScrollBar().setRange(0, max(0, max_width - self.viewport().width() + 20))
+
+    def _paint_highlight(self, painter, metrics, offset, text, top, x_offset):
+        """Hinterlegt den markierten Bereich innerhalb einer Zeile."""
+        encoded = text.encode('utf-8')
+        start = max(0, self._highlight[0] - offset)
+        end = min(len(encoded), self._highlight[1] - offset)
+        before = encoded[:start].decode('utf-8', 'replace').expandtabs(self.TAB_WIDTH)
+        marked = encoded[:end].decode('utf-8', 'replace').expandtabs(self.TAB_WIDTH)
+        left = x_offset + metrics.horizontalAdvance(before)
+        right = x_offset + metrics.horizontalAdvance(marked)
+        painter.fillRect(left, top, max(2, right - left), metrics.height(),
+                         self._colors['selection'])
+
+    # Datei
+
+    def is_modified(self):
+        return self.table.modified
+
+    def begin_save(self):
+        """Sperrt Änderungen und gibt den Schnappschuss für einen Worker zurück."""
+        self.saving = True
+        return self.table.snapshot()
+
+    def finish_save(self, path, error=None):
+        """Mappt nach dem Speichern die neue Datei und gibt Änderungen frei."""
+        self.saving = False
+        if self._close_pending:
+            # Tab wurde während des Speicherns geschlossen
+            self.table.close()
+            return
+        if error is None:
+            self.table.reopen(path)
+            self.setProperty("file_path", path)
+        elif self.table.closed:
+            self.table.reopen()
+        self._invalidate()
+
+    def close_file(self):
+        """Gibt die gemappte Datei frei (nach einem laufenden Speichern)."""
+        if self.saving:
+            self._close_pending = True
+            return
+        self.table.close()
@@ -0,0 +1,23 @@
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget
+
+
+class LazyTab(QWidget):
+    """Platzhalter für einen Tab aus der letzten Sitzung.
+
+    Hält nur Pfad, Cursor und Scrollposition. Editor, Hervorhebung und
+    Autovervollständigung entstehen erst, wenn der Tab zum ersten Mal
+    angezeigt wird; dann sendet er ``activated`` und wird ersetzt.
+    """
+
+    activated = Signal(object)
+
+    def __init__(self, file_path, cursor=0, scroll=0, parent=None):
+        super().__init__(parent)
+        self.setProperty("file_path", file_path)
+        self.cursor = cursor
+        self.scroll = scroll
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.activated.emit(self)
@@ -0,0 +1,204 @@
+"""Schreibgeschützte Ansicht für sehr große Logdateien."""
+import mmap
+import re
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import Signal
+
+from .large_file_view import LargeFileView
+from utils.line_index import scan_checkpoints
+
+# Ab dieser Dateigröße wird eine Datei immer im Log-Viewer geöffnet
+LOG_VIEWER_THRESHOLD = 1024 * 1024 * 1024
+
+
+class LogViewer(LargeFileView):
+    """Zeigt mehrere GB große Dateien schreibgeschützt an.
+
+    Die Darstellung übernimmt ``LargeFileView``; den dünnen Zeilenindex
+    (``LineIndex``) baut hier ein Worker über ein eigenes Mapping auf, damit
+    Sprung zu Zeile und Zeilennummern schon während des Scans für den
+    bereits gelesenen Teil funktionieren. Die Suche läuft
+    blockweise im Worker, sodass nie die ganze Datei im Speicher liegt.
+    """
+
+    # Blockgröße beim Indexieren und Suchen
+    SCAN_BLOCK = 1 << 22
+    # Alle so viele Bytes meldet der Worker den Zwischenstand
+    REPORT_BYTES = 64 * 1024 * 1024
+
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    index_progress = Signal(int, int)
+    search_finished = Signal(int, int)
+
+    # Interne Signale aus dem Worker
+    _index_chunk = Signal(object, int, int)
+    _search_result = Signal(int, int, int)
+
+    def __init__(self, path, parent=None):
+        super().__init__(path, parent, read_only=True)
+        # Der Worker füllt den Index; bis dahin nicht selbst nachscannen
+        self.line_index.lazy = False
+        self._cancelled = threading.Event()
+        self._search_generation = 0
+
+        self._index_chunk.connect(self._on_index_chunk)
+        self._search_result.connect(self._on_search_result)
+        self.executor.submit(self._build_index, path)
+
+    def close_file(self):
+        """Stoppt laufende Worker und gibt die Datei frei."""
+        self._cancelled.set()
+        self._search_generation += 1
+        super().close_file()
+
+    # Zeilenindex
+
+    def _build_index(self, path):
+        """Scannt die Datei über ein eigenes Mapping (läuft im Thread)."""
+        found = array('Q')
+        newlines = 0
+        next_report = self.REPORT_BYTES
+        try:
+            with open(path, 'rb') as f:
+                size = len(self.table)
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+                try:
+                    for block_start in range(0, size, self.SCAN_BLOCK):
+                        if self._cancelled.is_set():
+                            return
+                        block = mapped[block_start:block_start + self.SCAN_BLOCK]
+                        block_found, newlines = scan_checkpoints(
+                            block, block_start, newlines, self.line_index.every
+                        )
+                        found.extend(block_found)
+                        scanned = block_start + len(block)
+                        if scanned >= next_report and scanned < size:
+                            self._index_chunk.emit(found, scanned, newlines)
+                            found = array('Q')
+                            next_report = scanned + self.REPORT_BYTES
+                finally:
+                    if isinstance(mapped, mmap.mmap):
+                        mapped.close()
+        except (OSError, ValueError):
+            return
+        self._index_chunk.emit(found, size, newlines)
+
+    def _on_index_chunk(self, found, scanned, newlines):
+        self.line_index.add_scanned(found, scanned, newlines)
+        self.index_progress.emit(scanned, len(self.table))
+        if self.line_index.complete:
+            self.line_index.lazy = True
+
+    @property
+    def indexed_bytes(self):
+        return self.line_index.indexed_bytes
+
+    @property
+    def line_count(self):
+        return self.line_index.line_count
+
+    def is_indexed(self):
+        return self.line_index.complete
+
+    # Suche
+
+    def find_text(self, text, case_sensitive=False, whole_words=False, search_forward=True):
+        """Startet die Suche ab dem Cursor im Hintergrund.
+
+        Das Ergebnis kommt über ``search_finished`` (Start, Ende bzw. -1, -1).
+        Ohne Beachtung der Groß-/Kleinschreibung werden nur ASCII-Buchstaben
+        gleichgesetzt.
+        """
+        if not text:
+            return False
+        needle = text.encode('utf-8')
+        if not case_sensitive:
+            needle = needle.lower()
+        regex = None
+        if whole_words:
+            regex = re.compile(rb'\b' + re.escape(needle) + rb'\b',
+                               0 if case_sensitive else re.IGNORECASE)
+
+        if self._highlight:
+            start = self._highlight[1] if search_forward else self._highlight[0]
+        else:
+            start = self._cursor
+        self._search_generation += 1
+        self.executor.submit(
+            self._search, needle, regex, case_sensitive, start, search_forward,
+            self._search_generation
+        )
+        return True
+
+    def _search(self, needle, regex, case_sensitive, start, forward, generation):
+        """Sucht ab start und danach vom anderen Ende her (läuft im Thread)."""
+        size = len(self.table)
+        ranges = [(start, size), (0, start)] if forward else [(0, start), (start, size)]
+        try:
+            for range_start, range_end in ranges:
+                match = self._find_in_range(needle, regex, case_sensitive, range_start,
+                                            range_end, forward, generation)
+                if match is not None:
+                    self._search_result.emit(generation, *match)
+                    return
+        except ValueError:
+            return
+        self._search_result.emit(generation, -1, -1)
+
+    def _find_in_range(self, needle, regex, case_sensitive, start, end, forward, generation):
+        """Erster (bzw. letzter) Treffer, der in [start, end) beginnt.
+
+        Jeder Block wird mit einem Byte Kontext davor (für ``\\b``) und
+        einem Überhang in Länge des Suchtexts dahinter gelesen. Ohne
+        Wortgrenzen genügt ``bytes.find``, das deutlich schneller als ein
+        regulärer Ausdruck ist.
+        """
+        overlap = len(needle) + 1
+        position = start if forward else end
+        while (position < end) if forward else (position > start):
+            if generation != self._search_generation:
+                return None
+            if forward:
+                block_start, block_end = position, min(end, position + self.SCAN_BLOCK)
+            else:
+                block_start, block_end = max(start, position - self.SCAN_BLOCK), position
+            context = 1 if block_start else 0
+            data = self.table.read(block_start - context,
+                                   block_end - block_start + context + overlap)
+            limit = block_end - block_start + context
+            base = block_start - context
+            if regex is None:
+                if not case_sensitive:
+                    data = data.lower()
+                find = data.find if forward else data.rfind
+                found = find(needle, context, limit + len(needle) - 1)
+                if found != -1:
+                    return base + found, base + found + len(needle)
+                position = block_end if forward else block_start
+                continue
+            if forward:
+                match = regex.search(data, context)
+                if match is not None and match.start() >= limit:
+                    match = None
+            else:
+                match = None
+                for candidate in regex.finditer(data, context):
+                    if candidate.start() >= limit:
+                        break
+                    match = candidate
+            if match is not None:
+                return base + match.start(), base + match.end()
+            position = block_end if forward else block_start
+        return None
+
+    def _on_search_result(self, generation, start, end):
+        if generation != self._search_generation:
+            return
+        if start >= 0:
+            self.set_highlight(start, end)
+            self.set_cursor_position(start)
+        self.search_finished.emit(start, end)
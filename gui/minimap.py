@@ -1,12 +1,76 @@
 """Mini-Map Widget für Code-Übersicht im Windsurf-Stil."""
+import re
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QRect, QSize, QTimer, QPoint, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import Qt, QRect, QSize, QTimer, QPoint, QPropertyAnimation, QEasingCurve, Signal
 from PySide6.QtGui import (
     QPainter, QColor, QPainterPath, QLinearGradient,
-    QPen, QBrush, QImage, QFontMetrics
+    QPen, QBrush, QImage
 )
 
+from utils.line_summary import LineSummary
+from utils.lru_cache import LRUCache
+
+# Zusammenhängende Zeichen ohne Leerraum
+_WORD = re.compile(r'\S+')
+
+# Geschätzter Speicher eines Laufs: Tupel plus zwei int (Pixel sind geteilt)
+_RUN_BYTES = sys.getsizeof((0, 0, b'')) + 2 * sys.getsizeof(1000)
+# Schlüssel aus vier Werten
+_KEY_BYTES = sys.getsizeof((0, 0, 0, 0)) + 2 * sys.getsizeof(2 ** 62)
+
+
+def _runs_size(runs):
+    """Geschätzte Größe eines Eintrags im Lauf-Cache."""
+    return _KEY_BYTES + sys.getsizeof(runs) + len(runs) * _RUN_BYTES
+
 class MiniMap(QWidget):
+    """Übersicht des Dokuments neben dem Editor.
+
+    Jeder Block belegt LINE_PITCH Pixel. Die Darstellung ist in Kacheln zu
+    je TILE_BLOCKS Blöcken unterteilt, die als eigene Bilder gecacht werden.
+    Eine Änderung verwirft nur die Kacheln, die den geänderten Bereich
+    überdecken (bei neuen oder gelöschten Zeilen zusätzlich die folgenden);
+    gezeichnet werden nur die sichtbaren Kacheln.
+
+    Kacheln werden in einem Worker gerendert: Der GUI-Thread nimmt nur
+    einen Schnappschuss von Text und Format-Spans der Blöcke, der Worker
+    schreibt daraus jedes Wort als farbigen Lauf von CHAR_WIDTH Pixeln pro
+    Zeichen direkt in die Scanlines eines ``QImage`` (ohne Schrift und
+    Textlayout), das im GUI-Thread in einem Schritt
+    übernommen wird. Bis dahin bleibt das alte Bild der Kachel stehen.
+    Ergebnisse für inzwischen verworfene Kacheln werden ignoriert.
+
+    Im Übersichtsmodus (``set_overview``) zeigt die Minimap stattdessen das
+    ganze Dokument: Eine ``LineSummary`` hält Einrückung und Textende jeder
+    Zeile und wird bei Änderungen nur im betroffenen Bereich ersetzt; beim
+    Zeichnen werden die Zeilen auf Pixelzeilen verdichtet und als Balken in
+    der vorherrschenden Farbe der längsten Zeile gezeichnet.
+    """
+
+    # Pixel pro Block in der Minimap
+    LINE_PITCH = 2
+    # Blöcke pro Kachel
+    TILE_BLOCKS = 64
+    # Pixel pro Zeichen, Spalten pro Tabulator und linker Rand
+    CHAR_WIDTH = 1
+    TAB_WIDTH = 4
+    MARGIN = 6
+
+    # Gemeinsamer Worker für alle Minimaps
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    # Gemeinsamer Cache (Hash des Texts, Hash der Spans, Rand, Breite) ->
+    # Läufe für alle Minimaps, unabhängig von der Zeilennummer;
+    # run_cache.stats() liefert Speicher und Trefferquote.
+    run_cache = LRUCache(maxsize=None, max_bytes=4 * 1024 * 1024, sizeof=_runs_size)
+
+    # Interne Signale aus dem Worker
+    _tile_ready = Signal(int, object, object)
+
     def __init__(self, editor, parent=None):
         if parent is None:
             parent = editor
@@ -15,16 +79,18 @@ class MiniMap(QWidget):
         self.setFixedWidth(80)
         
         # Basis-Setup
-        self.cached_image = None
-        self.cache_dirty = True
         self.hover_opacity = 0.0
         
         # Performance-Optimierung
-        self.block_cache = {}  # Cache für Block-Rendering
-        self.last_doc_size = None
-        self.last_viewport_size = None
-        self.font_metrics = None
-        self.update_font_metrics()
+        # Kachelindex -> (Bild, Block-States); States None: veraltet
+        self.tiles = {}
+        # Kachelindex -> Marke des laufenden Auftrags
+        self._pending = {}
+        self._block_count = self.editor.document().blockCount()
+        self._pixels = {}  # Farbe -> Pixel, damit Läufe gleicher Farbe es teilen
+        self.overview = False
+        self.summary = None  # LineSummary, nur im Übersichtsmodus
+        self._tile_ready.connect(self._on_tile_ready)
         
         # Design-Konfiguration
         self.colors = {
@@ -41,7 +107,7 @@ class MiniMap(QWidget):
         self.update_timer.timeout.connect(self.delayed_update)
         
         # Event-Handler
-        self.editor.document().contentsChanged.connect(self.mark_cache_dirty)
+        self.editor.document().contentsChange.connect(self._on_contents_change)
         self.editor.verticalScrollBar().valueChanged.connect(self.smooth_scroll_update)
         
         # Initialisierung
@@ -49,193 +115,281 @@ class MiniMap(QWidget):
         self.target_viewport_rect = QRect()
         self.update_viewport_rect()
 
-    def cache_block(self, block, formats, text, x_start, max_width):
-        """Cached Block-Rendering für bessere Performance."""
-        key = (block.blockNumber(), text, x_start, max_width)
-        if key in self.block_cache:
-            return self.block_cache[key]
-
-        # Rendere den Block einmal und cache das Ergebnis
+    def cache_block(self, text, spans, max_x):
+        """Farbige Läufe (x_start, x_end, Pixel) eines Blocks (läuft im Worker).
+
+        spans sind (Start, Länge, Farbe oder None) aus dem Schnappschuss;
+        Lücken dazwischen bekommen die Code-Farbe. Jedes Wort wird zu einem
+        Lauf; Leerraum bleibt frei.
+        """
+        span_key = tuple((start, length, color.rgba() if color else None)
+                         for start, length, color in spans)
+        key = (hash(text), hash(span_key), self.MARGIN, max_x)
+        result = self.run_cache.get(key)
+        if result is not None:
+            return result
+
+        code_pixel = self._pixel(None)
+        runs = []
+        position = 0
+        for start, length, color in sorted(spans, key=lambda span: span[0]):
+            if start > position:
+                runs.append((position, start, code_pixel))
+            if start + length > max(position, start):
+                runs.append((max(position, start), start + length, self._pixel(color)))
+            position = max(position, start + length)
+        if position < len(text):
+            runs.append((position, len(text), code_pixel))
+
+        columns = self._columns(text) if '\t' in text else None
         result = []
-        if not formats:
-            # Unformatierter Text
-            clipped_text = self.font_metrics.elidedText(text, Qt.ElideRight, max_width - x_start)
-            result.append((self.colors['code'], x_start, clipped_text))
-        else:
-            x_pos = x_start
-            remaining_text = text
-            
-            for fmt in formats:
-                if x_pos >= max_width:
+        for start, end, pixel in runs:
+            for word in _WORD.finditer(text, start, end):
+                if columns is None:
+                    first, last = word.start(), word.end()
+                else:
+                    first, last = columns[word.start()], columns[word.end()]
+                x_start = self.MARGIN + first * self.CHAR_WIDTH
+                if x_start >= max_x:
                     break
+                result.append((x_start, min(max_x, self.MARGIN + last * self.CHAR_WIDTH), pixel))
 
-                start = fmt.start
-                length = fmt.length
-                
-                if start > 0:
-                    pre_text = remaining_text[:start]
-                    result.append((self.colors['code'], x_pos, pre_text))
-                    x_pos += self.font_metrics.horizontalAdvance(pre_text)
-                    remaining_text = remaining_text[start:]
-                
-                format_text = remaining_text[:length]
-                color = fmt.format.foreground().color()
-                if not color.isValid():
-                    color = self.colors['code']
-                else:
-                    color = QColor(color)
-                    color.setAlpha(200)
-                
-                if x_pos < max_width:
-                    text_width = self.font_metrics.horizontalAdvance(format_text)
-                    if x_pos + text_width > max_width:
-                        format_text = self.font_metrics.elidedText(format_text, Qt.ElideRight, max_width - x_pos)
-                    result.append((color, x_pos, format_text))
-                    x_pos += self.font_metrics.horizontalAdvance(format_text)
-                
-                remaining_text = remaining_text[length:]
-
-        self.block_cache[key] = result
+        self.run_cache.put(key, result)
         return result
 
-    def update_font_metrics(self):
-        """Aktualisiert Font-Metrics für schnellere Berechnungen."""
-        mini_font = self.editor.font()
-        mini_font.setPointSize(1)
-        self.font_metrics = QFontMetrics(mini_font)
-
-    def should_update_cache(self):
-        """Prüft, ob Cache aktualisiert werden muss."""
-        if not self.editor:
-            return False
-            
-        doc = self.editor.document()
-        current_doc_size = doc.size()
-        current_viewport_size = self.editor.viewport().size()
-        
-        # Prüfe ob sich Größen geändert haben
-        size_changed = (self.last_doc_size != current_doc_size or 
-                       self.last_viewport_size != current_viewport_size)
-        
-        # Aktualisiere gespeicherte Größen
-        if size_changed:
-            self.last_doc_size = current_doc_size
-            self.last_viewport_size = current_viewport_size
-            
-        return self.cache_dirty or size_changed
+    def _columns(self, text):
+        """Spalte jedes Zeichens (und des Zeilenendes) mit aufgelösten Tabulatoren."""
+        columns = []
+        column = 0
+        for char in text:
+            columns.append(column)
+            if char == '\t':
+                column += self.TAB_WIDTH - column % self.TAB_WIDTH
+            else:
+                column += 1
+        columns.append(column)
+        return columns
+
+    def _pixel(self, color):
+        """Farbe mit Alpha 200 über dem Hintergrund als deckendes ARGB32-Pixel."""
+        key = color.rgba() if color is not None else None
+        pixel = self._pixels.get(key)
+        if pixel is None:
+            pixel = self._pixels[key] = self._blend(color)
+        return pixel
+
+    def _blend(self, color):
+        ink = self.colors['code'] if color is None else color
+        background = self.colors['background']
+        alpha = 200 if color is not None else ink.alpha()
+        channels = [
+            (ink_channel * alpha + back_channel * (255 - alpha)) // 255
+            for ink_channel, back_channel in (
+                (ink.red(), background.red()),
+                (ink.green(), background.green()),
+                (ink.blue(), background.blue()),
+            )
+        ]
+        return struct.pack('=I', 0xFF000000 | channels[0] << 16 | channels[1] << 8 | channels[2])
+
+    def _tile_signature(self, block, count):
+        """Zustände der Blöcke einer Kachel.
+
+        Kaskadiert die Hervorhebung (z.B. nach einem geöffneten String) über
+        eine Kachel, ändern sich die Block-States, ohne dass ein
+        contentsChange für diese Zeilen kommt.
+        """
+        states = []
+        while block.isValid() and len(states) < count:
+            states.append(block.userState())
+            block = block.next()
+        return tuple(states)
 
-    def update_cache(self):
-        """Maximal optimierter Cache-Update."""
-        if not self.editor or not self.should_update_cache():
+    def set_overview(self, enabled):
+        """Schaltet zwischen Ausschnitt (Kacheln) und ganzem Dokument um."""
+        if enabled == self.overview:
             return
+        self.overview = enabled
+        if enabled:
+            self.summary = LineSummary(self.editor.document().toPlainText().split('\n'))
+        else:
+            self.summary = None
+        self.update_viewport_rect()
+        self.update()
 
-        # Neues Cache-Bild erstellen
-        self.cached_image = QImage(
-            self.width(),
-            self.height(),
-            QImage.Format_ARGB32_Premultiplied
-        )
-        self.cached_image.fill(self.colors['background'])
+    def _block_y(self, block_number):
+        """y-Position eines Blocks in der Minimap."""
+        if not self.overview:
+            return (block_number - self._first_block()) * self.LINE_PITCH
+        block_count = self.editor.document().blockCount()
+        if block_count * self.LINE_PITCH <= self.height():
+            return block_number * self.LINE_PITCH
+        return block_number * self.height() // block_count
+
+    def _y_block(self, y_pos):
+        """Blocknummer an der y-Position der Minimap."""
+        if not self.overview:
+            return self._first_block() + int(y_pos) // self.LINE_PITCH
+        block_count = self.editor.document().blockCount()
+        if block_count * self.LINE_PITCH <= self.height():
+            return int(y_pos) // self.LINE_PITCH
+        return int(y_pos * block_count / max(1, self.height()))
+
+    def _first_block(self):
+        """Nummer des obersten Blocks in der Minimap (Ausschnitt).
+
+        Passt das Dokument nicht hinein, läuft der Ausschnitt proportional
+        zur Scrollposition mit.
+        """
+        block_count = self.editor.document().blockCount()
+        rows = self.height() // self.LINE_PITCH
+        if block_count <= rows:
+            return 0
+        scrollbar = self.editor.verticalScrollBar()
+        ratio = scrollbar.value() / scrollbar.maximum() if scrollbar.maximum() > 0 else 0.0
+        return int(ratio * (block_count - rows))
 
-        painter = QPainter(self.cached_image)
-        painter.setRenderHint(QPainter.Antialiasing)
+    def tile(self, index):
+        """Gibt das Bild der Kachel index zurück (oder None).
 
-        # Dokumentgröße berechnen
+        Ist die Kachel veraltet, wird sie im Worker neu gerendert; bis das
+        Ergebnis da ist, liefert tile() das alte Bild.
+        """
         doc = self.editor.document()
-        doc_height = doc.size().height()
-        viewport_height = self.editor.viewport().height()
-        
-        if doc_height <= 0:
-            painter.end()
-            self.cache_dirty = False
+        first = doc.findBlockByNumber(index * self.TILE_BLOCKS)
+        signature = self._tile_signature(first, self.TILE_BLOCKS)
+        cached = self.tiles.get(index)
+        if cached is not None and cached[1] == signature:
+            return cached[0]
+        if index not in self._pending:
+            self._request_tile(index, first, signature)
+        return cached[0] if cached is not None else None
+
+    def _request_tile(self, index, block, signature):
+        """Übergibt einen Schnappschuss der Kachel an den Worker."""
+        snapshot = []
+        for _ in range(self.TILE_BLOCKS):
+            if not block.isValid():
+                break
+            spans = []
+            for fmt in block.layout().formats():
+                color = fmt.format.foreground().color()
+                spans.append((fmt.start, fmt.length, QColor(color) if color.isValid() else None))
+            snapshot.append((block.text(), spans))
+            block = block.next()
+        token = object()
+        self._pending[index] = token
+        future = self.executor.submit(self.render_tile, snapshot, self.width())
+        future.add_done_callback(lambda f: self._emit_tile(f, index, token, signature))
+
+    def _emit_tile(self, future, index, token, signature):
+        """Reicht das fertige Bild an den GUI-Thread weiter."""
+        if future.cancelled() or future.exception() is not None:
             return
+        try:
+            self._tile_ready.emit(index, token, (future.result(), signature))
+        except RuntimeError:
+            # Minimap wurde inzwischen gelöscht (Tab geschlossen)
+            pass
+
+    def _on_tile_ready(self, index, token, result):
+        """Übernimmt ein Kachelbild, sofern die Kachel nicht verworfen wurde."""
+        if self._pending.get(index) is not token:
+            return
+        del self._pending[index]
+        if result[0].width() != self.width():
+            return
+        self.tiles[index] = result
+        self.update()
 
-        # Skalierungsfaktor berechnen
-        scale_y = float(self.height()) / max(doc_height, viewport_height)
-        scale_y *= 0.85
-
-        # Font setzen
-        mini_font = self.editor.font()
-        mini_font.setPointSize(1)
-        painter.setFont(mini_font)
-
-        # Konstanten
-        max_width = self.width() - 12
-        ascent = self.font_metrics.ascent()
-
-        # Sichtbarer Bereich
-        scrollbar = self.editor.verticalScrollBar()
-        visible_top = scrollbar.value()
-        visible_bottom = visible_top + viewport_height
-        
-        # Code-Blöcke zeichnen
-        block = doc.firstBlock()
-        last_y = -1
-        block_count = 0
+    def render_tile(self, snapshot, width):
+        """Schreibt die Blöcke eines Schnappschusses in ein Bild (läuft im Worker)."""
+        image = QImage(width, self.TILE_BLOCKS * self.LINE_PITCH,
+                       QImage.Format_ARGB32_Premultiplied)
+        image.fill(self.colors['background'])
+
+        # Eine Scanline pro Block, die zweite bleibt als Zeilenabstand frei
+        bits = image.bits()
+        bytes_per_line = image.bytesPerLine()
+        max_x = width - self.MARGIN
+        for row, (text, spans) in enumerate(snapshot):
+            line_offset = row * self.LINE_PITCH * bytes_per_line
+            for x_start, x_end, pixel in self.cache_block(text, spans, max_x):
+                offset = line_offset + x_start * 4
+                bits[offset:offset + (x_end - x_start) * 4] = pixel * (x_end - x_start)
+        del bits
+        return image
+
+    def _invalidate_tile(self, index):
+        """Markiert eine Kachel als veraltet; das alte Bild bleibt bis zum Ersatz."""
+        self._pending.pop(index, None)
+        cached = self.tiles.get(index)
+        if cached is not None:
+            self.tiles[index] = (cached[0], None)
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """Verwirft nur die Kacheln, die den geänderten Bereich überdecken."""
+        doc = self.editor.document()
+        first_block = doc.findBlock(position).blockNumber()
+        # chars_added kann den abschließenden Absatztrenner mitzählen
+        last_block = doc.findBlock(min(position + chars_added, doc.characterCount() - 1)).blockNumber()
+        block_count = doc.blockCount()
+        added_blocks = block_count - self._block_count
+        self._block_count = block_count
+        if self.summary is not None:
+            self._update_summary(first_block, last_block, added_blocks)
+
+        first_tile = first_block // self.TILE_BLOCKS
+        if added_blocks:
+            # Zeilen eingefügt oder gelöscht: alle folgenden Kacheln verschieben sich
+            last_tile = None
+        else:
+            last_tile = last_block // self.TILE_BLOCKS
+        for index in set(self.tiles) | set(self._pending):
+            if index >= first_tile and (last_tile is None or index <= last_tile):
+                self._invalidate_tile(index)
+        self.update_timer.start(150)
 
-        # Batch-Verarbeitung für bessere Performance
-        render_batch = []
-        
-        while block.isValid() and block_count < 2000:  # Reduzierte Block-Anzahl für bessere Performance
-            # Block-Position
-            y_pos = self.editor.blockBoundingGeometry(block).y()
-            block_height = self.editor.blockBoundingRect(block).height()
-            
-            # Sichtbarkeitsoptimierung
-            if y_pos > visible_bottom + viewport_height:
-                break
-            if y_pos + block_height < visible_top - viewport_height:
+    def _update_summary(self, first_block, last_block, added_blocks):
+        """Ersetzt die Zusammenfassung der geänderten Blöcke."""
+        doc = self.editor.document()
+        if last_block - first_block > 1000:
+            lines = doc.toPlainText().split('\n')[first_block:last_block + 1]
+        else:
+            lines = []
+            block = doc.findBlockByNumber(first_block)
+            for _ in range(last_block - first_block + 1):
+                lines.append(block.text())
                 block = block.next()
-                continue
-
-            scaled_y = int(y_pos * scale_y)
-            if scaled_y - last_y < 1:
-                scaled_y = last_y + 1
-
-            if 0 <= scaled_y <= self.height():
-                text = block.text()
-                if text.strip():
-                    indent_level = len(text) - len(text.lstrip())
-                    x_start = 6 + (indent_level * 1.5)
-                    
-                    # Verwende gecachtes Rendering
-                    render_items = self.cache_block(
-                        block,
-                        block.layout().formats(),
-                        text,
-                        x_start,
-                        max_width
-                    )
-                    
-                    # Füge zum Batch hinzu
-                    for color, x_pos, render_text in render_items:
-                        render_batch.append((color, x_pos, scaled_y + ascent, render_text))
-                    
-                    last_y = scaled_y
-                    block_count += 1
-
-            block = block.next()
-
-        # Batch-Rendering aller Textelemente
-        for color, x_pos, y_pos, text in render_batch:
-            painter.setPen(color)
-            painter.drawText(x_pos, y_pos, text)
+        self.summary.replace(first_block, last_block - first_block + 1 - added_blocks, lines)
 
-        painter.end()
-        self.cache_dirty = False
+    def invalidate_blocks(self, first, end):
+        """Verwirft die Kacheln, die Blöcke aus first..end-1 enthalten."""
+        for index in range(first // self.TILE_BLOCKS, (end - 1) // self.TILE_BLOCKS + 1):
+            if index in self.tiles or index in self._pending:
+                self._invalidate_tile(index)
+        self.update_timer.start(150)
 
     def mark_cache_dirty(self):
-        """Cache als veraltet markieren."""
-        self.cache_dirty = True
-        # Cache leeren wenn zu groß
-        if len(self.block_cache) > 5000:
-            self.block_cache.clear()
+        """Alle Kacheln verwerfen (z.B. nach Theme- oder Featurewechsel)."""
+        for index in set(self.tiles) | set(self._pending):
+            self._invalidate_tile(index)
         self.update_timer.start(150)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if event.size().width() != event.oldSize().width():
+            # Kacheln haben die Breite des Widgets
+            self.tiles.clear()
+            self._pending.clear()
+        self.update_viewport_rect()
+
     def delayed_update(self):
         """Verzögertes Update durchführen."""
-        if self.cache_dirty:
-            self.update_cache()
+        if not self.isVisible():
+            # Ausgeblendet (z.B. Großdatei-Modus): erst beim Anzeigen rendern
+            return
+        self.update_viewport_rect()
         self.update()
 
     def smooth_scroll_update(self):
@@ -244,31 +398,13 @@ class MiniMap(QWidget):
         self.update()
 
     def update_viewport_rect(self):
-        """Aktualisiert den sichtbaren Bereich mit korrigierter Größe."""
+        """Aktualisiert den Rahmen um die im Editor sichtbaren Blöcke."""
         if not self.editor:
             return
 
-        # Dokumentgröße und Viewport
-        doc = self.editor.document()
-        doc_height = doc.size().height()
-        viewport_height = self.editor.viewport().height()
-        
-        # Berechne den Anteil des sichtbaren Bereichs
-        visible_ratio = viewport_height / float(max(doc_height, viewport_height))
-        
-        # Korrigiere die Höhe des Indikators
-        # Begrenzen auf maximal 30% der Minimap-Höhe
-        indicator_height = min(int(self.height() * visible_ratio), int(self.height() * 0.3))
-        indicator_height = max(20, indicator_height)  # Mindesthöhe 20px
-        
-        # Berechne die Position basierend auf der Scroll-Position
-        scrollbar = self.editor.verticalScrollBar()
-        if scrollbar.maximum() <= 0:
-            indicator_top = 0
-        else:
-            scroll_ratio = scrollbar.value() / float(scrollbar.maximum())
-            available_space = self.height() - indicator_height
-            indicator_top = int(scroll_ratio * available_space)
+        first_visible, last_visible = self.editor.visible_block_range()
+        indicator_top = self._block_y(first_visible)
+        indicator_height = max(20, self._block_y(last_visible) - indicator_top)
         
         # Neue Zielposition setzen
         self.target_viewport_rect = QRect(
@@ -292,19 +428,57 @@ class MiniMap(QWidget):
         self.update()
 
     def paintEvent(self, event):
-        """Verbesserte Darstellung mit Animationen."""
-        if self.cache_dirty:
-            self.update_cache()
-            
-        if not self.cached_image:
-            return
-
+        """Zeichnet die sichtbaren Kacheln und den Viewport-Rahmen."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), self.colors['background'])
+
+        if self.overview:
+            self._paint_overview(painter)
+            self._paint_viewport(painter)
+            return
 
-        # Cache zeichnen
-        painter.drawImage(0, 0, self.cached_image)
+        # Nur Kacheln im aktualisierten Bereich zeichnen (und ggf. rendern)
+        first_block = self._first_block()
+        block_count = self.editor.document().blockCount()
+        top_block = first_block + event.rect().top() // self.LINE_PITCH
+        bottom_block = min(block_count, first_block + event.rect().bottom() // self.LINE_PITCH + 1)
+        for index in range(top_block // self.TILE_BLOCKS, (bottom_block - 1) // self.TILE_BLOCKS + 1):
+            image = self.tile(index)
+            if image is not None:
+                y = (index * self.TILE_BLOCKS - first_block) * self.LINE_PITCH
+                painter.drawImage(0, y, image)
+        self._paint_viewport(painter)
+
+    def _paint_overview(self, painter):
+        """Zeichnet das ganze Dokument als verdichtete Balken."""
+        doc = self.editor.document()
+        max_x = self.width() - self.MARGIN
+        # Ganzzahlige Rechtecke ohne Antialiasing: schneller Füllpfad
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        for y, height, line, indent, end in self.summary.rows(self.height(), self.LINE_PITCH):
+            x_start = self.MARGIN + indent * self.CHAR_WIDTH
+            width = min(max_x - x_start, (end - indent) * self.CHAR_WIDTH)
+            if width > 0:
+                color = self._dominant_color(doc.findBlockByNumber(line))
+                painter.fillRect(QRect(x_start, y, width, max(1, height - 1)), color)
+        painter.setRenderHint(QPainter.Antialiasing)
 
+    def _dominant_color(self, block):
+        """Farbe des Formats, das den größten Teil des Blocks einnimmt."""
+        best_color = self.colors['code']
+        best_length = 0
+        for fmt in block.layout().formats():
+            if fmt.length > best_length:
+                color = fmt.format.foreground().color()
+                if color.isValid():
+                    best_color = QColor(color)
+                    best_color.setAlpha(200)
+                    best_length = fmt.length
+        return best_color
+
+    def _paint_viewport(self, painter):
+        """Zeichnet den sichtbaren Bereich des Editors."""
         # Viewport-Bereich mit Verlaufseffekt
         if self.viewport_rect.isValid():
             # Hintergrund mit Verlauf
@@ -342,18 +516,12 @@ class MiniMap(QWidget):
             self.scroll_to_position(event.pos().y())
 
     def scroll_to_position(self, y_pos):
-        """Präzise Scroll-Position-Berechnung."""
+        """Zentriert den Editor auf den angeklickten Block."""
         if not self.editor:
             return
 
-        # Position relativ zum Dokument berechnen
-        doc_height = self.editor.document().size().height()
-        viewport_height = self.editor.viewport().height()
-        
-        # Scroll-Position mit Offset berechnen
-        scroll_ratio = y_pos / float(self.height())
-        scroll_pos = int((doc_height - viewport_height) * scroll_ratio)
-        scroll_pos = max(0, min(scroll_pos, self.editor.verticalScrollBar().maximum()))
-        
-        # Scroll durchführen
-        self.editor.verticalScrollBar().setValue(scroll_pos)
+        block_number = self._y_block(y_pos)
+        first_visible, last_visible = self.editor.visible_block_range()
+        scrollbar = self.editor.verticalScrollBar()
+        scroll_pos = block_number - (last_visible - first_visible) // 2
+        scrollbar.setValue(max(0, min(scroll_pos, scrollbar.maximum())))
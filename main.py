@@ -250,6 +250,10 @@ class MainWindow(QMainWindow):
         open_folder_action = QAction(self.tr("Ordner öffnen"), self)
         open_folder_action.triggered.connect(self.editor_window.open_folder)
         file_menu.addAction(open_folder_action)
+
+        open_log_action = QAction(self.tr("Log öffnen"), self)
+        open_log_action.triggered.connect(self.editor_window.open_log_file_dialog)
+        file_menu.addAction(open_log_action)
         
         file_menu.addSeparator()
         
@@ -310,6 +314,11 @@ class MainWindow(QMainWindow):
         replace_action.setShortcut(QKeySequence.Replace)
         replace_action.triggered.connect(self.editor_window.show_replace_dialog)
         edit_menu.addAction(replace_action)
+
+        go_to_line_action = QAction(self.tr("Gehe zu Zeile"), self)
+        go_to_line_action.setShortcut(QKeySequence("Ctrl+G"))
+        go_to_line_action.triggered.connect(self.editor_window.show_go_to_line_dialog)
+        edit_menu.addAction(go_to_line_action)
         
         ai_help_action = QAction('AI Hilfe anfordern', self)
         ai_help_action.triggered.connect(self.show_ai_help_dialog)
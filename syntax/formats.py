@@ -0,0 +1,56 @@
+"""Prozessweiter Pool der Textformate für die Syntax-Hervorhebung."""
+from PySide6.QtGui import QTextCharFormat, QColor
+
+# Token-Typen mit ihren Standardfarben (Windsurf Dark)
+DEFAULT_COLORS = {
+    'keyword': "#569CD6",
+    'string': "#CE9178",
+    'comment': "#6A9955",
+    'function': "#DCDCAA",
+    'class': "#4EC9B0",
+    'number': "#B5CEA8",
+    'operator': "#D4D4D4",
+    # Semantische Hervorhebung
+    'parameter': "#9CDCFE",
+    'attribute': "#D7BA7D",
+    'import': "#4EC9B0",
+    'global': "#4FC1FF",
+}
+
+# (Theme-Schlüssel, Token-Typ) -> QTextCharFormat
+_formats = {}
+# Theme-Schlüssel -> Tabelle Token-Typ -> QTextCharFormat
+_tables = {}
+
+
+def theme_key(theme_styles):
+    """Bildet den Schlüssel eines Themes aus seinen Syntax-Farben."""
+    theme_styles = theme_styles or {}
+    return tuple(theme_styles.get(token, color) for token, color in DEFAULT_COLORS.items())
+
+
+def get_format(key, token, color):
+    """Gibt das gemeinsame Format für (Theme, Token-Typ) zurück."""
+    text_format = _formats.get((key, token))
+    if text_format is None:
+        text_format = QTextCharFormat()
+        text_format.setForeground(QColor(color))
+        _formats[(key, token)] = text_format
+    return text_format
+
+
+def get_formats(theme_styles):
+    """Gibt die gemeinsame Format-Tabelle eines Themes zurück.
+
+    Alle Highlighter mit denselben Syntax-Farben erhalten dasselbe
+    Dictionary; ein Theme-Wechsel tauscht nur die Referenz aus.
+    """
+    key = theme_key(theme_styles)
+    table = _tables.get(key)
+    if table is None:
+        table = {
+            token: get_format(key, token, color)
+            for token, color in zip(DEFAULT_COLORS, key)
+        }
+        _tables[key] = table
+    return table
@@ -0,0 +1,442 @@
+"""Gemeinsame Highlighter-Maschinerie für alle Sprachen."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import Signal, QTimer, QObject, SIGNAL, SLOT
+from PySide6.QtGui import QSyntaxHighlighter
+
+from syntax.formats import get_formats
+from utils.lru_cache import LRUCache
+
+
+class SyntaxHighlighter(QSyntaxHighlighter):
+    """Syntax Highlighter im Windsurf-Stil für einen austauschbaren Lexer.
+
+    Blöcke, deren Hervorhebung noch aussteht, werden in ``_dirty`` (ein Byte
+    pro Block) markiert. ``rehighlight_visible()`` bearbeitet davon nur den
+    sichtbaren Bereich sofort, der Rest folgt in kurzen Zeitscheiben, sobald
+    die Event-Loop frei ist.
+
+    Große Einfügungen (Paste, Datei laden) werden nicht im GUI-Thread
+    tokenisiert: Zwischen ``begin_deferred()`` und ``end_deferred()`` bleiben
+    die Blöcke unformatiert, ein Worker tokenisiert einen Schnappschuss des
+    Dokuments, und die betroffenen Blöcke werden danach als ausstehend
+    markiert und mit den vorberechneten Spans hervorgehoben.
+
+    Ohne Lexer (unbekannte oder sehr große Dateien) trennt der Highlighter
+    Qts eigenen Slot vom Dokument und kostet dann nichts. ``setDocument()``
+    kommt dafür nicht in Frage: Beim Wiederanhängen stellt Qt ein
+    synchrones Hervorheben aller Blöcke in die Event-Loop.
+    """
+
+    # Ab dieser Zeilenzahl wird eine Einfügung im Hintergrund tokenisiert
+    ASYNC_LINE_THRESHOLD = 2000
+    # Maximale Dauer einer Zeitscheibe im Leerlauf (Sekunden)
+    IDLE_SLICE_SECONDS = 0.008
+    # Qts eigener Slot, der geänderte Blöcke neu formatiert
+    QT_CONTENTS_CHANGE = SIGNAL("contentsChange(int,int,int)")
+    QT_REFORMAT_SLOT = SLOT("_q_reformatBlocks(int,int,int)")
+
+    # Blöcke, die pro Qt-Aufruf am Stück formatiert werden
+    CHUNK_BLOCKS = 64
+    # Blöcke ober- und unterhalb des Viewports, die sofort mitbearbeitet werden
+    VISIBLE_MARGIN_BLOCKS = 50
+    # Längere Zeilen (z.B. minifiziertes JSON) werden nicht tokenisiert
+    MAX_LINE_LENGTH = 20000
+
+    # Gemeinsamer Worker für alle Editoren
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    # Gemeinsamer Cache (Lexer, Zeilentext, Eingangszustand) ->
+    # (spans, Endzustand) für alle Editoren; token_cache.stats() liefert die Trefferquote.
+    token_cache = LRUCache(maxsize=20000)
+
+    tokens_ready = Signal(int, object)
+    # Alle ausstehenden Blöcke sind neu formatiert (Theme, Lexer, Overlay);
+    # Argumente: erster Block und Ende des seitdem markierten Bereichs
+    formats_changed = Signal(int, int)
+
+    def __init__(self, parent=None, lexer=None, theme_styles=None, editor=None):
+        super().__init__(parent)
+        self.theme_styles = theme_styles or {}
+        self.editor = editor
+        self.lexer = lexer
+        self.initialize_formats()
+
+        # Ausstehende Blöcke (leer, wenn nichts aussteht)
+        self._dirty = bytearray()
+        # Seit dem letzten formats_changed markierter Bereich (start, end)
+        self._dirty_span = None
+        self._block_count = self.document().blockCount() if self.document() else 0
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.timeout.connect(self._idle_step)
+
+        # Hintergrund-Tokenisierung
+        self._deferred = False
+        self._deferred_range = None
+        # Blocknummer -> (Zeilentext, spans, Endzustand, Eingangszustand)
+        self._precomputed = {}
+        self._precomputed_revision = -1
+        # Zusätzliche Spans pro Zeile, z.B. aus der semantischen Analyse:
+        # Liste von (Zeilentext, spans) oder None, leer ohne Overlay
+        self._overlay = []
+        self._revision = 0
+        self._current_future = None
+        self.tokens_ready.connect(self._on_tokens_ready)
+        self._text_document = self.document()
+        if self._text_document is not None:
+            # Vor Qts eigenem Slot verbinden: Markierungen und Overlay
+            # müssen verschoben sein, bevor Qt die geänderten Blöcke formatiert
+            self.setDocument(None)
+            self._text_document.contentsChange.connect(self._on_contents_change)
+            self.setDocument(self._text_document)
+            if lexer is None:
+                self._detach_reformat()
+
+    def initialize_formats(self):
+        """Übernimmt die gemeinsamen Formate des aktuellen Themes."""
+        self.formats = get_formats(self.theme_styles)
+
+    def update_theme(self, theme_styles):
+        """Aktualisiert die Farben basierend auf dem aktuellen Theme.
+
+        Bei unveränderten Syntax-Farben bleibt die Format-Tabelle dieselbe
+        und es wird nichts neu hervorgehoben. Sonst werden alle Blöcke als
+        ausstehend markiert: Ein sichtbarer Editor färbt sofort den Viewport
+        und den Rest in Leerlauf-Zeitscheiben um, ein verdeckter Tab erst,
+        wenn er angezeigt wird.
+        """
+        self.theme_styles = theme_styles
+        formats = get_formats(theme_styles)
+        if formats is self.formats:
+            return
+        self.formats = formats
+        if self.lexer is None:
+            return
+        self.mark_dirty()
+        if self.editor is None or self.editor.isVisible():
+            self.rehighlight_visible()
+
+    def set_lexer(self, lexer):
+        """Wechselt den Lexer; None schaltet die Hervorhebung ab."""
+        if lexer is None:
+            if self.lexer is None:
+                return
+            self.lexer = None
+            self._dirty = bytearray()
+            self._dirty_span = None
+            self._precomputed = {}
+            self._overlay = []
+            if self.document() is not None:
+                self._detach_reformat()
+            return
+        if self.lexer is not None and self.lexer.name == lexer.name:
+            return
+        was_disabled = self.lexer is None
+        self.lexer = lexer
+        # Laufende Worker-Ergebnisse des alten Lexers verwerfen
+        self._revision += 1
+        self._precomputed = {}
+        if self.document() is None:
+            return
+        if was_disabled:
+            self._block_count = self.document().blockCount()
+            # Verbindet nach _on_contents_change, die Reihenfolge bleibt
+            QObject.connect(self.document(), self.QT_CONTENTS_CHANGE,
+                            self, self.QT_REFORMAT_SLOT)
+        self.mark_dirty()
+        self.rehighlight_visible()
+
+    def _detach_reformat(self):
+        """Trennt Qts Neuformatierung vom Dokument und entfernt alle Formate."""
+        document = self.document()
+        QObject.disconnect(document, self.QT_CONTENTS_CHANGE,
+                           self, self.QT_REFORMAT_SLOT)
+        block = document.begin()
+        while block.isValid():
+            block.layout().clearFormats()
+            block = block.next()
+        document.markContentsDirty(0, document.characterCount())
+
+    def highlightBlock(self, text):
+        """Hebt einen Textblock mit dem aktuellen Lexer hervor.
+
+        Der Endzustand wird als Block-State gespeichert; Qt hebt den
+        nächsten Block nur dann erneut hervor, wenn sich dieser ändert.
+        """
+        if self._deferred or self.lexer is None:
+            # Ohne Lexer bleibt der Block unformatiert, sonst wird er
+            # später mit dem Worker-Ergebnis formatiert
+            return
+        precomputed = None
+        overlay = None
+        if self._dirty or self._precomputed or self._overlay:
+            number = self.currentBlock().blockNumber()
+            if number < len(self._dirty):
+                self._dirty[number] = 0
+            precomputed = self._precomputed.get(number)
+            if number < len(self._overlay):
+                overlay = self._overlay[number]
+        previous = max(self.previousBlockState(), 0)
+        if (precomputed is not None
+                and self._precomputed_revision == self._revision
+                and precomputed[0] == text and precomputed[3] == previous):
+            spans, state = precomputed[1], precomputed[2]
+        else:
+            spans, state = self.tokenize(text, previous)
+        formats = self.formats
+        set_format = self.setFormat
+        for start, length, token in spans:
+            set_format(start, length, formats[token])
+        if overlay is not None and overlay[0] == text:
+            for start, length, token in overlay[1]:
+                set_format(start, length, formats[token])
+        self.setCurrentBlockState(state)
+
+    def tokenize(self, text, state):
+        """Tokenisiert eine Zeile über den gemeinsamen Token-Cache."""
+        if state < 0:
+            state = 0
+        if len(text) > self.MAX_LINE_LENGTH:
+            return (), state
+        key = (self.lexer.name, text, state)
+        cached = self.token_cache.get(key)
+        if cached is None:
+            spans, end_state = self.lexer.tokenize(text, state)
+            cached = (tuple(spans), end_state)
+            self.token_cache.put(key, cached)
+        return cached
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """Führt Revision und ausstehende Blöcke bei Textänderungen nach.
+
+        ``QTextDocument.revision()`` steigt auch beim Anwenden von Formaten
+        und taugt deshalb nicht zum Erkennen veralteter Worker-Ergebnisse.
+        Läuft vor Qts Neuformatierung, damit ``highlightBlock`` bereits die
+        verschobenen Blocknummern sieht.
+        """
+        if not (chars_removed or chars_added):
+            return
+        self._revision += 1
+
+        document = self._text_document
+        block_count = document.blockCount()
+        delta = block_count - self._block_count
+        self._block_count = block_count
+        if not (self._dirty or self._deferred or (self._overlay and delta)):
+            return
+
+        first = document.findBlock(position).blockNumber()
+        if self._deferred:
+            last = document.findBlock(position + chars_added).blockNumber()
+            if self._deferred_range is not None:
+                first_before, last_before = self._deferred_range
+                if last_before > first:
+                    last_before += delta
+                first, last = min(first, first_before), max(last, last_before)
+            self._deferred_range = (first, last + 1)
+        if self._dirty_span is not None and delta > 0 and self._dirty_span[1] > first:
+            self._dirty_span = (self._dirty_span[0], self._dirty_span[1] + delta)
+        if self._dirty:
+            # Markierungen hinter der Änderung mitverschieben
+            if delta > 0:
+                self._dirty[first + 1:first + 1] = bytes(delta)
+            elif delta < 0:
+                del self._dirty[first + 1:first + 1 - delta]
+        if self._overlay:
+            if delta > 0:
+                self._overlay[first + 1:first + 1] = [None] * delta
+            elif delta < 0:
+                del self._overlay[first + 1:first + 1 - delta]
+
+    def set_overlay(self, overlay):
+        """Setzt zusätzliche Spans pro Zeile und färbt geänderte Zeilen neu.
+
+        overlay ist eine Liste mit einem Eintrag (Zeilentext, spans) oder
+        None pro Zeile; None für overlay entfernt alle zusätzlichen Spans.
+        Ein Eintrag gilt nur, solange der Zeilentext übereinstimmt.
+        """
+        old = self._overlay
+        new = overlay or []
+        self._overlay = new
+        if self.document() is None or self.lexer is None:
+            return
+        changed = False
+        for number in range(max(len(old), len(new))):
+            old_entry = old[number] if number < len(old) else None
+            new_entry = new[number] if number < len(new) else None
+            if old_entry != new_entry:
+                self.mark_dirty(number, number + 1)
+                changed = True
+        if changed:
+            self.rehighlight_visible()
+
+    def mark_dirty(self, start=0, end=None):
+        """Markiert die Blöcke start..end-1 als neu hervorzuheben."""
+        if self.document() is None or self.lexer is None:
+            return
+        block_count = self.document().blockCount()
+        end = block_count if end is None else min(end, block_count)
+        if len(self._dirty) != block_count:
+            self._dirty.extend(bytes(block_count - len(self._dirty)))
+            del self._dirty[block_count:]
+        if start < end:
+            self._dirty[start:end] = b'\x01' * (end - start)
+            if self._dirty_span is not None:
+                start = min(start, self._dirty_span[0])
+                end = max(end, self._dirty_span[1])
+            self._dirty_span = (start, end)
+
+    def rehighlight_visible(self):
+        """Hebt ausstehende Blöcke im und um den Viewport sofort hervor.
+
+        Blöcke außerhalb folgen, sobald sie ins Bild gescrollt werden oder
+        die Event-Loop Zeit für eine Leerlauf-Zeitscheibe hat.
+        """
+        if not self._dirty:
+            return
+        first, last = self._visible_block_range()
+        self._rehighlight_dirty(
+            max(0, first - self.VISIBLE_MARGIN_BLOCKS),
+            last + self.VISIBLE_MARGIN_BLOCKS
+        )
+        self._idle_timer.start(0)
+
+    def _visible_block_range(self):
+        """Gibt (erster, letzter + 1) sichtbarer Blocknummer zurück."""
+        if self.editor is None:
+            return 0, 0
+        return self.editor.visible_block_range()
+
+    def _rehighlight_dirty(self, start, end, deadline=None):
+        """Hebt ausstehende Blöcke im Bereich hervor.
+
+        Gibt False zurück, wenn die Frist abgelaufen ist, bevor alles
+        bearbeitet wurde.
+        """
+        dirty = self._dirty
+        end = min(end, len(dirty))
+        pos = start
+        while pos < end:
+            run_start = dirty.find(1, pos, end)
+            if run_start == -1:
+                break
+            run_end = dirty.find(0, run_start, min(end, run_start + self.CHUNK_BLOCKS))
+            if run_end == -1:
+                run_end = min(end, run_start + self.CHUNK_BLOCKS)
+            self._rehighlight_run(run_start, run_end)
+            # Falls Qt vorher anhält, nicht endlos wiederholen
+            dirty[run_start:run_end] = bytes(run_end - run_start)
+            pos = run_end
+            if deadline is not None and time.perf_counter() >= deadline:
+                return pos >= end or dirty.find(1, pos, end) == -1
+        return True
+
+    def _rehighlight_run(self, start, end):
+        """Hebt die Blöcke start..end-1 mit einem einzigen Qt-Aufruf hervor.
+
+        Die gespeicherten Zustände werden so vorbelegt, dass Qt vom ersten
+        Block bis genau zum letzten weiterkaskadiert und dort anhält.
+        """
+        first = self.document().findBlockByNumber(start)
+        block = first
+        number = start
+        while block.isValid() and number < end - 1:
+            block.setUserState(-2)
+            block = block.next()
+            number += 1
+        if block.isValid() and self._precomputed_revision == self._revision:
+            precomputed = self._precomputed.get(number)
+            if precomputed is not None:
+                block.setUserState(precomputed[2])
+        if first.isValid():
+            self.rehighlightBlock(first)
+
+    def _idle_step(self):
+        """Bearbeitet ausstehende Blöcke für eine Zeitscheibe."""
+        if not self._dirty:
+            return
+        if self._current_future is not None and not self._current_future.done():
+            # Worker-Ergebnis abwarten, statt synchron zu tokenisieren
+            return
+        if self._precomputed and self._revision != self._precomputed_revision:
+            # Veraltete Ergebnisse verwerfen und neu tokenisieren
+            self._schedule_tokenize()
+            return
+
+        deadline = time.perf_counter() + self.IDLE_SLICE_SECONDS
+        if self._rehighlight_dirty(0, len(self._dirty), deadline):
+            self._dirty = bytearray()
+            self._precomputed = {}
+            if self._dirty_span is not None:
+                span, self._dirty_span = self._dirty_span, None
+                self.formats_changed.emit(*span)
+        else:
+            self._idle_timer.start(0)
+
+    def should_defer(self, text):
+        """Prüft, ob ein einzufügender Text im Hintergrund tokenisiert wird."""
+        if self.document() is None or self.lexer is None:
+            return False
+        return text.count('\n') >= self.ASYNC_LINE_THRESHOLD
+
+    def begin_deferred(self):
+        """Unterdrückt das synchrone Tokenisieren bis ``end_deferred()``."""
+        self._deferred = True
+
+    def end_deferred(self):
+        """Startet die Hintergrund-Tokenisierung des aktuellen Dokuments."""
+        self._deferred = False
+        if self._deferred_range is not None:
+            self.mark_dirty(*self._deferred_range)
+            self._deferred_range = None
+        self._schedule_tokenize()
+
+    def _schedule_tokenize(self):
+        """Übergibt einen Schnappschuss des Dokuments an den Worker."""
+        document = self.document()
+        if document is None or self.lexer is None:
+            return
+        self._precomputed = {}
+        if self._current_future and not self._current_future.done():
+            self._current_future.cancel()
+        self._current_future = self.executor.submit(
+            self._tokenize_snapshot,
+            document.toPlainText(), self._revision
+        )
+        self._current_future.add_done_callback(self._emit_tokens)
+
+    def _tokenize_snapshot(self, text, revision):
+        """Tokenisiert alle Zeilen eines Schnappschusses (läuft im Thread)."""
+        tokenize = self.tokenize
+        results = []
+        state = 0
+        for line in text.split('\n'):
+            entry_state = state
+            spans, state = tokenize(line, state)
+            results.append((line, spans, state, entry_state))
+        return revision, results
+
+    def _emit_tokens(self, future):
+        """Reicht das Worker-Ergebnis an den GUI-Thread weiter."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        revision, results = future.result()
+        try:
+            self.tokens_ready.emit(revision, results)
+        except RuntimeError:
+            # Highlighter wurde inzwischen gelöscht (Tab geschlossen)
+            pass
+
+    def _on_tokens_ready(self, revision, results):
+        """Übernimmt die Worker-Ergebnisse, sofern sie noch aktuell sind."""
+        if self.document() is None or self.lexer is None:
+            return
+        if revision != self._revision:
+            # Dokument hat sich inzwischen geändert: neu tokenisieren
+            self._schedule_tokenize()
+            return
+        self._precomputed = dict(enumerate(results))
+        self._precomputed_revision = revision
+        self.rehighlight_visible()
@@ -0,0 +1,91 @@
+"""Gemeinsamer Kern für zeilenweise Regex-Lexer."""
+import re
+
+
+class RegexLexer:
+    """Basis für Lexer, die eine Zeile in einem Durchlauf in Spans zerlegen.
+
+    Unterklassen beschreiben ihre Regeln in ``RULES`` als Tupel
+    (gruppenname, token_typ, muster). Beim Erzeugen der Klasse werden alle
+    Regeln zu einem einzigen Muster mit benannten Gruppen kompiliert; die
+    Reihenfolge bestimmt die Priorität. Regeln mit token_typ ``None``
+    werden nur übersprungen (z.B. Bezeichner, damit Schlüsselwörter nicht
+    in Namen erkannt werden).
+
+    Mehrzeilige Konstrukte (Blockkommentare, Template-Strings, ...) stehen
+    in ``MULTILINE`` als gruppenname -> Endmuster. Bleibt ein solches
+    Konstrukt am Zeilenende offen, wird seine Nummer als Zustand
+    zurückgegeben und die nächste Zeile beginnt mit der Suche nach dem Ende.
+    """
+
+    # Eindeutiger Name, u.a. Teil des Token-Cache-Schlüssels
+    name = 'text'
+    # Dateiendungen (klein, mit Punkt), für die der Lexer registriert wird
+    extensions = ()
+
+    RULES = ()
+    MULTILINE = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.RULES:
+            return
+        cls.MASTER_PATTERN = re.compile("|".join(
+            f"(?P<{group}>{pattern})" for group, _token, pattern in cls.RULES
+        ), re.MULTILINE)
+        cls.GROUP_TOKENS = {group: token for group, token, _pattern in cls.RULES}
+        cls.MULTILINE_STATES = {}
+        cls.STATE_END_PATTERNS = {}
+        for state, (group, end_pattern) in enumerate(cls.MULTILINE.items(), start=1):
+            cls.MULTILINE_STATES[group] = state
+            cls.STATE_END_PATTERNS[state] = (re.compile(end_pattern), cls.GROUP_TOKENS[group])
+
+    def tokenize(self, text, state=0):
+        """Hebt eine Zeile ab dem Eingangszustand hervor.
+
+        Gibt ``(spans, end_state)`` zurück; spans sind Tupel aus
+        (start, länge, token_typ). Spätere Spans überschreiben frühere.
+        """
+        spans = []
+        pos = 0
+        if state > 0 and state in self.STATE_END_PATTERNS:
+            end_pattern, token = self.STATE_END_PATTERNS[state]
+            closing = end_pattern.match(text)
+            end = closing.end() if closing else len(text)
+            if end:
+                spans.append((0, end, token))
+            if not closing:
+                return spans, state
+            pos = end
+        return self._scan(text, pos, spans)
+
+    def _scan(self, text, pos, spans):
+        """Tokenisiert text ab pos und liefert den Endzustand."""
+        append = spans.append
+        search = self.MASTER_PATTERN.search
+        group_tokens = self.GROUP_TOKENS
+        multiline_states = self.MULTILINE_STATES
+        while True:
+            match = search(text, pos)
+            if match is None:
+                return spans, 0
+            group = match.lastgroup
+            start = match.start()
+            pos = match.end()
+            if pos == start:
+                # Leere Treffer dürfen die Schleife nicht blockieren
+                pos += 1
+                continue
+            state = multiline_states.get(group)
+            if state is not None:
+                end_pattern, token = self.STATE_END_PATTERNS[state]
+                closing = end_pattern.match(text, pos)
+                end = closing.end() if closing else len(text)
+                append((start, end - start, token))
+                if not closing:
+                    return spans, state
+                pos = end
+                continue
+            token = group_tokens[group]
+            if token is not None:
+                append((start, pos - start, token))
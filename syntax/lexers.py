@@ -0,0 +1,124 @@
+"""Lexer für die übrigen im Datei-Explorer angezeigten Sprachen.
+
+Alle Lexer bilden ihre Tokens auf die Formate des Python-Highlighters ab
+(keyword, string, comment, function, class, number, operator), damit die
+Themes ohne zusätzliche Farben auskommen.
+"""
+from syntax.lexer import RegexLexer
+
+DOUBLE_QUOTED = r'"[^"\\]*(?:\\.[^"\\]*)*"?'
+SINGLE_QUOTED = r"'[^'\\]*(?:\\.[^'\\]*)*'?"
+
+
+class JsonLexer(RegexLexer):
+    """JSON: Schlüssel, Strings, Zahlen und Literale."""
+
+    name = 'json'
+    extensions = ('.json',)
+
+    RULES = (
+        ('key', 'function', DOUBLE_QUOTED + r'(?=\s*:)'),
+        ('string', 'string', DOUBLE_QUOTED),
+        ('literal', 'keyword', r'\b(?:true|false|null)\b'),
+        ('number', 'number', r'-?\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b'),
+    )
+
+
+class MarkdownLexer(RegexLexer):
+    """Markdown: Überschriften, Zitate, Listen, Code und Links."""
+
+    name = 'markdown'
+    extensions = ('.md', '.markdown')
+
+    RULES = (
+        ('fence', 'string', r'^ {0,3}```.*'),
+        ('heading', 'keyword', r'^ {0,3}#{1,6}(?:\s.*)?$'),
+        ('quote', 'comment', r'^ {0,3}>.*'),
+        ('list_marker', 'operator', r'^\s*(?:[-*+]|\d+[.)])(?=\s)'),
+        ('code', 'string', r'`[^`]+`'),
+        ('bold', 'function', r'\*\*[^*]+\*\*|__[^_]+__'),
+        ('link', 'class', r'!?\[[^\]]*\]\([^)]*\)'),
+        ('html_comment', 'comment', r'<!--'),
+    )
+
+    MULTILINE = {
+        'fence': r' {0,3}```\s*$',
+        'html_comment': r'.*?-->',
+    }
+
+
+class HtmlLexer(RegexLexer):
+    """HTML: Tags, Attribute, Strings, Entities und Kommentare."""
+
+    name = 'html'
+    extensions = ('.html', '.htm')
+
+    RULES = (
+        ('comment', 'comment', r'<!--'),
+        ('tag', 'keyword', r'</?[A-Za-z][\w:-]*|/?>'),
+        ('attribute', 'function', r'\b[A-Za-z_:][\w:.-]*(?=\s*=)'),
+        ('string', 'string', r'"[^"]*"|\'[^\']*\''),
+        ('entity', 'number', r'&#?\w+;'),
+    )
+
+    MULTILINE = {
+        'comment': r'.*?-->',
+    }
+
+
+class CssLexer(RegexLexer):
+    """CSS: Selektoren, Eigenschaften, Werte und Blockkommentare."""
+
+    name = 'css'
+    extensions = ('.css',)
+
+    RULES = (
+        ('comment', 'comment', r'/\*'),
+        ('string', 'string', DOUBLE_QUOTED + '|' + SINGLE_QUOTED),
+        ('at_rule', 'keyword', r'@[\w-]+'),
+        ('property', 'function', r'-?[A-Za-z][\w-]*(?=\s*:[^{;]*(?:;|$))'),
+        ('number', 'number',
+         r'#[0-9a-fA-F]{3,8}\b|-?\b\d+(?:\.\d+)?(?:%|[a-zA-Z]+\b)?'),
+        ('selector', 'class', r'[.#][A-Za-z_-][\w-]*'),
+        ('important', 'keyword', r'!important\b'),
+    )
+
+    MULTILINE = {
+        'comment': r'.*?\*/',
+    }
+
+
+class JavaScriptLexer(RegexLexer):
+    """JavaScript: Schlüsselwörter, Strings, Template-Strings und Kommentare."""
+
+    name = 'javascript'
+    extensions = ('.js', '.mjs', '.cjs', '.jsx')
+
+    KEYWORDS = (
+        'async', 'await', 'break', 'case', 'catch', 'class', 'const',
+        'continue', 'debugger', 'default', 'delete', 'do', 'else', 'export',
+        'extends', 'false', 'finally', 'for', 'function', 'if', 'import',
+        'in', 'instanceof', 'let', 'new', 'null', 'of', 'return', 'static',
+        'super', 'switch', 'this', 'throw', 'true', 'try', 'typeof',
+        'undefined', 'var', 'void', 'while', 'with', 'yield'
+    )
+
+    RULES = (
+        ('block_comment', 'comment', r'/\*'),
+        ('comment', 'comment', r'//.*'),
+        ('template', 'string', r'`'),
+        ('string', 'string', DOUBLE_QUOTED + '|' + SINGLE_QUOTED),
+        ('function', 'function', r'(?<=\bfunction\s)[A-Za-z_$][\w$]*'),
+        ('class', 'class', r'(?<=\bclass\s)[A-Za-z_$][\w$]*'),
+        ('keyword', 'keyword', r'\b(?:' + '|'.join(KEYWORDS) + r')\b'),
+        ('identifier', None, r'[A-Za-z_$][\w$]*'),
+        ('number', 'number',
+         r'\b(?:0[xX][0-9a-fA-F_]+|0[bB][01_]+|0[oO][0-7_]+'
+         r'|\d[\d_]*(?:\.\d*)?(?:[eE][+-]?\d+)?)n?\b'),
+        ('operator', 'operator', r'=>|[-+*/%=<>!&|^~?]=?=?'),
+    )
+
+    MULTILINE = {
+        'block_comment': r'.*?\*/',
+        'template': r'[^`\\]*(?:\\.[^`\\]*)*`',
+    }
@@ -1,98 +1,159 @@
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont
+import re
 
-class PythonHighlighter(QSyntaxHighlighter):
+from syntax.highlighter import SyntaxHighlighter
+from syntax.lexer import RegexLexer
+
+KEYWORDS = (
+    'and', 'as', 'assert', 'break', 'class', 'continue', 'def',
+    'del', 'elif', 'else', 'except', 'False', 'finally', 'for',
+    'from', 'global', 'if', 'import', 'in', 'is', 'lambda', 'None',
+    'nonlocal', 'not', 'or', 'pass', 'raise', 'return', 'True',
+    'try', 'while', 'with', 'yield'
+)
+
+
+class PythonLexer(RegexLexer):
+    """Zerlegt eine Python-Zeile in einem Durchlauf in Format-Spans.
+
+    Alle Regeln stecken als benannte Gruppen in einem einzigen, beim Import
+    kompilierten Muster. Die Reihenfolge der Alternativen bestimmt die
+    Priorität: Kommentare und Strings werden zuerst erkannt, damit ``#`` in
+    Strings oder Schlüsselwörter in Kommentaren nicht falsch gefärbt werden.
+    Der Lookahead verwirft Leerzeichen, bevor die Alternativen probiert
+    werden, und ``identifier`` überspringt normale Namen am Stück.
+
+    Der Zustand am Zeilenende ist ein kleiner Integer (offener Triple-String,
+    f-String-Flag), der als Block-State gespeichert wird. So muss nach einer
+    Änderung nur so lange weiter hervorgehoben werden, bis der Zustand eines
+    Blocks wieder mit dem gespeicherten übereinstimmt. Die Klammertiefe
+    gehört nicht dazu: Sie ändert keine Farbe, würde aber nach jeder
+    geöffneten Klammer den Rest der Datei neu hervorheben lassen.
+    """
+
+    name = 'python'
+    extensions = ('.py', '.pyw', '.pyi')
+
+    # Aufbau des Block-States
+    IN_TRIPLE_SINGLE = 1
+    IN_TRIPLE_DOUBLE = 2
+    STRING_MASK = 0x3
+    FSTRING_FLAG = 0x4
+
+    MASTER_PATTERN = re.compile(
+        r"(?=[#\"'\w+\-*/%<>!=])(?:"
+        r"(?P<comment>#.*)"
+        r"|(?P<triple>(?:\b[rRbBuUfF]{1,2})?(?:'''|\"\"\"))"
+        r"|(?P<string>(?:\b[rRbBuUfF]{1,2})?"
+        r"(?:\"[^\"\\]*(?:\\.[^\"\\]*)*\"?|'[^'\\]*(?:\\.[^'\\]*)*'?))"
+        r"|(?P<definition>\b(?P<definition_keyword>def|class)\s+(?P<definition_name>[^\W\d]\w*))"
+        r"|(?P<keyword>\b(?:" + "|".join(KEYWORDS) + r")\b)"
+        r"|(?P<identifier>[^\W\d]\w*)"
+        r"|(?P<number>\b(?:0[xX][0-9a-fA-F_]+|0[oO][0-7_]+|0[bB][01_]+"
+        r"|\d[\d_]*(?:\.\d*)?(?:[eE][+-]?\d+)?[jJ]?)\b)"
+        r"|(?P<operator>\*\*=?|//=?|[-+*/%<>!=]=|[-+*/%<>=]))"
+    )
+
+    # Ende eines offenen Triple-Strings (Escapes werden übersprungen)
+    TRIPLE_END_PATTERNS = {
+        IN_TRIPLE_SINGLE: re.compile(r"[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*'''"),
+        IN_TRIPLE_DOUBLE: re.compile(r'[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*"""'),
+    }
+
+    def tokenize(self, text, state=0):
+        """Hebt eine Zeile ab dem Eingangszustand hervor.
+
+        Gibt ``(spans, end_state)`` zurück; spans sind Tupel aus
+        (start, länge, token_typ). Spätere Spans überschreiben frühere.
+        """
+        spans = []
+        if state < 0:
+            state = 0
+        string_state = state & self.STRING_MASK
+        pos = 0
+
+        if string_state:
+            closing = self.TRIPLE_END_PATTERNS[string_state].match(text)
+            end = closing.end() if closing else len(text)
+            spans.append((0, end, 'string'))
+            if state & self.FSTRING_FLAG:
+                self._scan_fields(text, 0, end, spans)
+            if not closing:
+                return spans, state
+            pos = end
+
+        return self._scan(text, pos, len(text), spans)
+
+    def _scan(self, text, pos, endpos, spans):
+        """Tokenisiert text[pos:endpos] als Code und liefert den Endzustand."""
+        append = spans.append
+        search = self.MASTER_PATTERN.search
+        while True:
+            match = search(text, pos, endpos)
+            if match is None:
+                return spans, 0
+            kind = match.lastgroup
+            start = match.start()
+            pos = match.end()
+            if kind == 'identifier':
+                continue
+            if kind == 'definition':
+                keyword = match.group('definition_keyword')
+                append((start, len(keyword), 'keyword'))
+                name_start = match.start('definition_name')
+                token = 'function' if keyword == 'def' else 'class'
+                append((name_start, pos - name_start, token))
+            elif kind == 'triple':
+                if text[pos - 1] == "'":
+                    string_state = self.IN_TRIPLE_SINGLE
+                else:
+                    string_state = self.IN_TRIPLE_DOUBLE
+                is_fstring = 'f' in text[start:pos - 3].lower()
+                closing = self.TRIPLE_END_PATTERNS[string_state].match(text, pos, endpos)
+                end = closing.end() if closing else endpos
+                append((start, end - start, 'string'))
+                if is_fstring:
+                    self._scan_fields(text, pos, end, spans)
+                if not closing:
+                    if is_fstring:
+                        string_state |= self.FSTRING_FLAG
+                    return spans, string_state
+                pos = end
+            else:
+                append((start, pos - start, kind))
+                if kind == 'string' and text[start] not in '"\'':
+                    # Nur das Präfix vor dem Anführungszeichen zählt
+                    quote = start + 1
+                    while text[quote] not in '"\'':
+                        quote += 1
+                    if 'f' in text[start:quote].lower():
+                        self._scan_fields(text, start, pos, spans)
+
+    def _scan_fields(self, text, pos, endpos, spans):
+        """Hebt die Ausdrücke in ``{...}`` eines f-Strings als Code hervor."""
+        while True:
+            brace = text.find('{', pos, endpos)
+            if brace == -1:
+                return
+            if text.startswith('{{', brace):
+                pos = brace + 2
+                continue
+            nesting = 1
+            index = brace + 1
+            while index < endpos and nesting:
+                char = text[index]
+                if char == '{':
+                    nesting += 1
+                elif char == '}':
+                    nesting -= 1
+                index += 1
+            field_end = index - 1 if not nesting else endpos
+            # Verschachtelte f-Strings im Feld werden rekursiv behandelt
+            self._scan(text, brace + 1, field_end, spans)
+            pos = index
+
+
+class PythonHighlighter(SyntaxHighlighter):
     """Syntax Highlighter für Python-Code im Windsurf-Stil."""
 
-    def __init__(self, parent=None, theme_styles=None):
-        super().__init__(parent)
-        self.theme_styles = theme_styles or {}
-        self.initialize_formats()
-
-    def initialize_formats(self):
-        """Initialisiert die Formatierungen für verschiedene Syntax-Elemente."""
-        self.formats = {
-            'keyword': self.create_format(self.theme_styles.get('keyword', "#569CD6")),
-            'string': self.create_format(self.theme_styles.get('string', "#CE9178")),
-            'comment': self.create_format(self.theme_styles.get('comment', "#6A9955")),
-            'function': self.create_format(self.theme_styles.get('function', "#DCDCAA")),
-            'class': self.create_format(self.theme_styles.get('class', "#4EC9B0")),
-            'number': self.create_format(self.theme_styles.get('number', "#B5CEA8")),
-            'operator': self.create_format(self.theme_styles.get('operator', "#D4D4D4")),
-        }
-
-    def create_format(self, color):
-        """Erstellt ein Textformat mit der angegebenen Farbe."""
-        text_format = QTextCharFormat()
-        text_format.setForeground(QColor(color))
-        return text_format
-
-    def update_theme(self, theme_styles):
-        """Aktualisiert die Farben basierend auf dem aktuellen Theme."""
-        self.theme_styles = theme_styles
-        self.initialize_formats()
-        self.rehighlight()
-
-    def highlightBlock(self, text):
-        """Hebt einen Textblock entsprechend der Python-Syntax hervor."""
-        # Keywords
-        keywords = [
-            'and', 'as', 'assert', 'break', 'class', 'continue', 'def',
-            'del', 'elif', 'else', 'except', 'False', 'finally', 'for',
-            'from', 'global', 'if', 'import', 'in', 'is', 'lambda', 'None',
-            'nonlocal', 'not', 'or', 'pass', 'raise', 'return', 'True',
-            'try', 'while', 'with', 'yield'
-        ]
-        
-        for word in text.split():
-            if word in keywords:
-                index = text.index(word)
-                self.setFormat(index, len(word), self.formats['keyword'])
-
-        # Strings (einfache und doppelte Anführungszeichen)
-        quote_chars = ['"', "'"]
-        for quote in quote_chars:
-            in_string = False
-            start_pos = 0
-            
-            for i, char in enumerate(text):
-                if char == quote and (i == 0 or text[i-1] != '\\'):
-                    if not in_string:
-                        start_pos = i
-                        in_string = True
-                    else:
-                        self.setFormat(start_pos, i - start_pos + 1, self.formats['string'])
-                        in_string = False
-
-        # Kommentare
-        if '#' in text:
-            comment_pos = text.index('#')
-            self.setFormat(comment_pos, len(text) - comment_pos, self.formats['comment'])
-
-        # Funktionen und Klassen
-        import re
-        # Funktionsdefinitionen
-        func_matches = re.finditer(r'def\s+(\w+)\s*\(', text)
-        for match in func_matches:
-            self.setFormat(match.start(1), len(match.group(1)), self.formats['function'])
-
-        # Klassendefinitionen
-        class_matches = re.finditer(r'class\s+(\w+)\s*[:\(]', text)
-        for match in class_matches:
-            self.setFormat(match.start(1), len(match.group(1)), self.formats['class'])
-
-        # Zahlen
-        number_pattern = r'\b\d+\b'
-        for match in re.finditer(number_pattern, text):
-            self.setFormat(match.start(), match.end() - match.start(), self.formats['number'])
-
-        # Operatoren
-        operators = ['+', '-', '*', '/', '//', '%', '**', '=', '==', '!=', '<', '>', '<=', '>=']
-        for op in operators:
-            pos = 0
-            while True:
-                pos = text.find(op, pos)
-                if pos == -1:
-                    break
-                self.setFormat(pos, len(op), self.formats['operator'])
-                pos += len(op)
+    def __init__(self, parent=None, theme_styles=None, editor=None):
+        super().__init__(parent, PythonLexer(), theme_styles, editor)
@@ -0,0 +1,36 @@
+"""Auswahl des Lexers anhand der Dateiendung."""
+import os
+
+from syntax.python_highlighter import PythonLexer
+from syntax.lexers import JsonLexer, MarkdownLexer, HtmlLexer, CssLexer, JavaScriptLexer
+
+# Größere Dateien werden ohne Syntax-Hervorhebung geöffnet
+MAX_HIGHLIGHT_FILE_SIZE = 5 * 1024 * 1024
+
+_lexers_by_extension = {}
+
+
+def register_lexer(lexer_class):
+    """Registriert eine Lexer-Klasse für ihre Dateiendungen."""
+    for extension in lexer_class.extensions:
+        _lexers_by_extension[extension.lower()] = lexer_class
+    return lexer_class
+
+
+def get_lexer_for_path(path, file_size=None):
+    """Gibt einen passenden Lexer zurück oder None für reinen Text.
+
+    None bedeutet: keine Hervorhebung, weil die Endung unbekannt oder die
+    Datei zu groß ist.
+    """
+    if file_size is None and path and os.path.isfile(path):
+        file_size = os.path.getsize(path)
+    if file_size is not None and file_size > MAX_HIGHLIGHT_FILE_SIZE:
+        return None
+    extension = os.path.splitext(path or '')[1].lower()
+    lexer_class = _lexers_by_extension.get(extension)
+    return lexer_class() if lexer_class is not None else None
+
+
+for _lexer_class in (PythonLexer, JsonLexer, MarkdownLexer, HtmlLexer, CssLexer, JavaScriptLexer):
+    register_lexer(_lexer_class)
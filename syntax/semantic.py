@@ -0,0 +1,321 @@
+"""Semantische Hervorhebung für Python auf Basis von ``ast``."""
+import ast
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, Signal, QTimer
+
+from utils.lru_cache import LRUCache
+
+# Zeilen, die einen neuen Abschnitt nicht beginnen, sondern fortsetzen
+CONTINUATION_KEYWORDS = ('else', 'elif', 'except', 'finally', 'case')
+# Anweisungen, die am Zeilenanfang nur außerhalb von Klammern stehen können;
+# sie setzen die Klammertiefe zurück, damit eine ungeschlossene Klammer
+# nicht den Rest der Datei zu einem Abschnitt macht
+TOPLEVEL_PREFIXES = ('def ', 'class ', 'async def ', 'import ', 'from ', '@')
+
+
+def _bracket_depth(line, spans, depth):
+    """Klammertiefe nach line; Klammern in Strings und Kommentaren zählen nicht."""
+    pieces = []
+    pos = 0
+    for start, length, token in spans:
+        if token in ('string', 'comment') and start >= pos:
+            pieces.append(line[pos:start])
+            pos = start + length
+    pieces.append(line[pos:])
+    code = ''.join(pieces)
+    for opening, closing in ('()', '[]', '{}'):
+        depth += code.count(opening) - code.count(closing)
+    return max(depth, 0)
+
+
+class _SymbolVisitor(ast.NodeVisitor):
+    """Sammelt Parameter, Attribute, Importe und globale Namen eines Abschnitts."""
+
+    def __init__(self):
+        self.items = []
+        self.imports = set()
+        self.globals = set()
+        # Pro Funktion: (Parameter, lokale Namen)
+        self._scopes = []
+        self._class_depth = 0
+
+    def _add(self, lineno, col, length, kind, name=None):
+        self.items.append((lineno, col, length, kind, name))
+
+    def _at_module_level(self):
+        return not self._scopes and not self._class_depth
+
+    def visit_Import(self, node):
+        if self._at_module_level():
+            for alias in node.names:
+                self.imports.add(alias.asname or alias.name.split('.')[0])
+
+    def visit_ImportFrom(self, node):
+        if self._at_module_level():
+            for alias in node.names:
+                if alias.name != '*':
+                    self.imports.add(alias.asname or alias.name)
+
+    def visit_Assign(self, node):
+        if self._at_module_level():
+            for target in node.targets:
+                self._collect_globals(target)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node):
+        if self._at_module_level():
+            self._collect_globals(node.target)
+        self.generic_visit(node)
+
+    def _collect_globals(self, target):
+        for child in ast.walk(target):
+            if isinstance(child, ast.Name):
+                self.globals.add(child.id)
+
+    def visit_ClassDef(self, node):
+        for child in node.decorator_list + node.bases + node.keywords:
+            self.visit(child)
+        self._class_depth += 1
+        for statement in node.body:
+            self.visit(statement)
+        self._class_depth -= 1
+
+    def visit_JoinedStr(self, node):
+        # Vor Python 3.12 sind die Positionen in f-Strings unzuverlässig
+        if sys.version_info >= (3, 12):
+            self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        if node.returns is not None:
+            self.visit(node.returns)
+        self._visit_function(node.args, node.body)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        self._visit_function(node.args, [node.body])
+
+    def _visit_function(self, args, body):
+        for default in args.defaults + [d for d in args.kw_defaults if d is not None]:
+            self.visit(default)
+        params = set()
+        for arg in args.posonlyargs + args.args + args.kwonlyargs + [args.vararg, args.kwarg]:
+            if arg is None:
+                continue
+            params.add(arg.arg)
+            self._add(arg.lineno, arg.col_offset, len(arg.arg), 'parameter')
+            if arg.annotation is not None:
+                self.visit(arg.annotation)
+        self._scopes.append((params, self._local_names(body)))
+        for statement in body:
+            self.visit(statement)
+        self._scopes.pop()
+
+    def _local_names(self, body):
+        """Namen, die im Funktionsrumpf gebunden werden (ohne ``global``)."""
+        names = set()
+        declared_global = set()
+        for statement in body:
+            for child in ast.walk(statement):
+                if isinstance(child, ast.Name) and not isinstance(child.ctx, ast.Load):
+                    names.add(child.id)
+                elif isinstance(child, (ast.Global, ast.Nonlocal)):
+                    declared_global.update(child.names)
+        return names - declared_global
+
+    def visit_Name(self, node):
+        for params, local_names in reversed(self._scopes):
+            if node.id in params:
+                self._add(node.lineno, node.col_offset, len(node.id), 'parameter')
+                return
+            if node.id in local_names:
+                return
+        self._add(node.lineno, node.col_offset, len(node.id), 'name', node.id)
+
+    def visit_Attribute(self, node):
+        self.visit(node.value)
+        if node.end_lineno is not None:
+            self._add(node.end_lineno, node.end_col_offset - len(node.attr),
+                      len(node.attr), 'attribute')
+
+
+class SemanticHighlighter(QObject):
+    """Legt semantische Farben über die Regex-Hervorhebung eines Python-Dokuments.
+
+    Nach einer Änderungspause wird ein Schnappschuss des Dokuments im
+    Hintergrund an Zeilen auf oberster Ebene in Abschnitte zerlegt. Jeder
+    Abschnitt wird einzeln mit ``ast`` geparst und über seinen Text gecacht,
+    sodass nach einer Änderung nur die betroffenen Definitionen neu geparst
+    werden und ein Syntaxfehler nur seinen eigenen Abschnitt betrifft.
+    """
+
+    # Wartezeit nach der letzten Änderung (ms)
+    DEBOUNCE_MS = 400
+
+    # Gemeinsamer Worker und Abschnitts-Cache für alle Editoren
+    executor = ThreadPoolExecutor(max_workers=1)
+    chunk_cache = LRUCache(maxsize=4000)
+
+    results_ready = Signal(int, object)
+
+    def __init__(self, highlighter):
+        super().__init__(highlighter)
+        self.highlighter = highlighter
+        self._enabled = False
+        self._current_future = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self._schedule_analysis)
+        self.results_ready.connect(self._on_results_ready)
+        highlighter._text_document.contentsChange.connect(self._on_contents_change)
+
+    def set_enabled(self, enabled):
+        """Schaltet die semantische Hervorhebung ein oder aus."""
+        self._enabled = enabled
+        if enabled:
+            self._timer.start(0)
+        else:
+            self._timer.stop()
+            self.highlighter.set_overlay(None)
+
+    def _is_active(self):
+        lexer = self.highlighter.lexer
+        return self._enabled and lexer is not None and lexer.name == 'python'
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        if (chars_removed or chars_added) and self._is_active():
+            self._timer.start()
+
+    def refresh(self):
+        """Plant eine neue Analyse, z.B. nach einem Wechsel des Lexers."""
+        if self._is_active():
+            self._timer.start(0)
+        else:
+            self.highlighter.set_overlay(None)
+
+    def _schedule_analysis(self):
+        """Übergibt einen Schnappschuss des Dokuments an den Worker."""
+        if not self._is_active():
+            return
+        if self._current_future and not self._current_future.done():
+            self._current_future.cancel()
+        self._current_future = self.executor.submit(
+            self._analyze,
+            self.highlighter._text_document.toPlainText(),
+            self.highlighter._revision
+        )
+        self._current_future.add_done_callback(self._emit_results)
+
+    def _emit_results(self, future):
+        """Reicht das Worker-Ergebnis an den GUI-Thread weiter."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        revision, overlay = future.result()
+        try:
+            self.results_ready.emit(revision, overlay)
+        except RuntimeError:
+            # Editor wurde inzwischen geschlossen
+            pass
+
+    def _on_results_ready(self, revision, overlay):
+        """Übernimmt die Ergebnisse, sofern das Dokument unverändert ist."""
+        if revision != self.highlighter._revision or not self._is_active():
+            return
+        self.highlighter.set_overlay(overlay)
+
+    def _analyze(self, text, revision):
+        """Analysiert alle Abschnitte eines Schnappschusses (läuft im Thread)."""
+        lines = text.split('\n')
+        chunks = self._split_chunks(lines)
+
+        analyses = []
+        imports = set()
+        module_globals = set()
+        for first, last in chunks:
+            analysis = self._analyze_chunk('\n'.join(lines[first:last]))
+            analyses.append((first, analysis))
+            imports |= analysis[0]
+            module_globals |= analysis[1]
+
+        spans_by_line = {}
+        for first, (_imports, _globals, items) in analyses:
+            for line, col, length, kind, name in items:
+                if kind == 'name':
+                    if name in imports:
+                        kind = 'import'
+                    elif name in module_globals:
+                        kind = 'global'
+                    else:
+                        continue
+                spans_by_line.setdefault(first + line, []).append((col, length, kind))
+
+        overlay = [None] * len(lines)
+        for number, spans in spans_by_line.items():
+            overlay[number] = (lines[number], tuple(spans))
+        return revision, overlay
+
+    def _split_chunks(self, lines):
+        """Zerlegt das Dokument in Abschnitte, die auf oberster Ebene beginnen.
+
+        Der Block-State des Lexers zeigt an, ob eine Zeile innerhalb eines
+        Strings beginnt, die mitgezählte Klammertiefe, ob sie innerhalb
+        einer Klammer beginnt; solche Zeilen setzen den laufenden Abschnitt
+        fort, ebenso Decorator-Folgezeilen und ``else``/``except``-Zweige.
+        """
+        tokenize = self.highlighter.tokenize
+        chunks = []
+        first = 0
+        state = 0
+        depth = 0
+        after_decorator = False
+        for number, line in enumerate(lines):
+            if depth and state == 0 and line.startswith(TOPLEVEL_PREFIXES):
+                depth = 0
+            starts_chunk = (
+                state == 0 and depth == 0 and number > first
+                and line[:1] not in ('', ' ', '\t', '#', ')', ']', '}')
+                and not after_decorator
+                and not line.startswith(CONTINUATION_KEYWORDS)
+            )
+            if starts_chunk:
+                chunks.append((first, number))
+                first = number
+            if line.strip():
+                after_decorator = line.startswith('@')
+            spans, state = tokenize(line, state)
+            depth = _bracket_depth(line, spans, depth)
+        chunks.append((first, len(lines)))
+        return chunks
+
+    def _analyze_chunk(self, source):
+        """Parst einen Abschnitt und gibt (Importe, Globale, Fundstellen) zurück.
+
+        Die Fundstellen haben 0-basierte Zeilen relativ zum Abschnitt und
+        Spalten in Zeichen.
+        """
+        cached = self.chunk_cache.get(source)
+        if cached is not None:
+            return cached
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError):
+            result = (frozenset(), frozenset(), ())
+        else:
+            visitor = _SymbolVisitor()
+            visitor.visit(tree)
+            source_lines = source.split('\n')
+            items = []
+            for lineno, col, length, kind, name in visitor.items:
+                line = source_lines[lineno - 1]
+                if not line.isascii():
+                    # ast liefert Spalten als UTF-8-Byte-Offsets
+                    col = len(line.encode('utf-8')[:col].decode('utf-8', 'ignore'))
+                items.append((lineno - 1, col, length, kind, name))
+            result = (frozenset(visitor.imports), frozenset(visitor.globals), tuple(items))
+        self.chunk_cache.put(source, result)
+        return result
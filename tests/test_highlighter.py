@@ -0,0 +1,64 @@
+from PySide6.QtGui import QTextCursor
+
+from conftest import wait_until
+from gui.code_editor import CodeEditor
+from syntax.formats import DEFAULT_COLORS
+from syntax.python_highlighter import PythonLexer
+
+
+def block_colors(document, number):
+    """Vordergrundfarben der Formatbereiche eines Blocks."""
+    block = document.findBlockByNumber(number)
+    return [r.format.foreground().color().name() for r in block.layout().formats()]
+
+
+def load_editor(qapp, text):
+    """Editor mit text, dessen Worker-Ergebnis bereits übernommen ist."""
+    editor = CodeEditor()
+    editor.resize(600, 400)
+    editor.show()
+    editor.setPlainText(text)
+    highlighter = editor.highlighter
+    assert wait_until(qapp, lambda: bool(highlighter._precomputed))
+    return editor
+
+
+def test_edit_after_worker_results_uses_new_state(qapp):
+    editor = load_editor(qapp, '\n'.join('x%d = 1' % i for i in range(5000)))
+    # Leerlauf-Zeitscheiben anhalten, damit die Ergebnisse gültig bleiben
+    editor.highlighter._idle_timer.stop()
+
+    cursor = QTextCursor(editor.document())
+    cursor.insertText('"""')
+
+    string_color = DEFAULT_COLORS['string'].lower()
+    for number in (1, 2, 3):
+        assert block_colors(editor.document(), number) == [string_color]
+
+
+def test_insert_in_hidden_tab_keeps_pending_theme_change(qapp):
+    editor = CodeEditor()
+    editor.resize(600, 400)
+    editor.setPlainText('\n'.join('x%d = 1' % i for i in range(100)))
+    highlighter = editor.highlighter
+    qapp.processEvents()
+
+    # Theme-Wechsel in einem verdeckten Tab markiert alle Blöcke nur
+    number_color = '#ff0000'
+    highlighter.update_theme({'number': number_color})
+    cursor = QTextCursor(editor.document().findBlockByNumber(5))
+    cursor.insertText(''.join('y%d = 2\n' % i for i in range(10)))
+
+    editor.show()
+    assert wait_until(qapp, lambda: not highlighter._dirty)
+    for number in range(editor.document().blockCount()):
+        assert number_color in block_colors(editor.document(), number), number
+
+
+def test_plain_string_starting_with_f_has_no_fields():
+    lexer = PythonLexer()
+    spans, _state = lexer.tokenize('x = "format {0} here"', 0)
+    assert [token for _start, _length, token in spans] == ['operator', 'string']
+
+    spans, _state = lexer.tokenize('x = f"format {0} here"', 0)
+    assert (14, 1, 'number') in spans
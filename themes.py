@@ -73,6 +73,12 @@ class WindsurfTheme:
                 'class': "#4EC9B0",
                 'number': "#B5CEA8",
                 'operator': "#D4D4D4",
+
+                # Semantische Hervorhebung
+                'parameter': "#9CDCFE",
+                'attribute': "#D7BA7D",
+                'import': "#4EC9B0",
+                'global': "#4FC1FF",
             }
         else:
             return {
@@ -92,4 +98,10 @@ class WindsurfTheme:
                 'class': "#267F99",
                 'number': "#098658",
                 'operator': "#000000",
+
+                # Semantische Hervorhebung
+                'parameter': "#001080",
+                'attribute': "#811F3F",
+                'import': "#267F99",
+                'global': "#0070C1",
             }
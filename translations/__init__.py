@@ -31,6 +31,15 @@ TRANSLATIONS = {
         "Tab Size": "Tabulator-Größe",
         "Auto Indent": "Automatischer Einzug",
         "Show Line Numbers": "Zeilennummern anzeigen",
+        "Minimap: Whole Document": "Minimap: ganzes Dokument",
+        "Semantic Highlighting": "Semantische Hervorhebung",
+        "Large File Mode": "Großdatei-Modus",
+        "Open Log File": "Logdatei öffnen",
+        "Go to Line": "Gehe zu Zeile",
+        "Line number:": "Zeilennummer:",
+        "Max File Size (MB)": "Maximale Dateigröße (MB)",
+        "Max Line Count": "Maximale Zeilenzahl",
+        "Max Line Length": "Maximale Zeilenlänge",
         "OK": "OK",
         "Cancel": "Abbrechen",
         
@@ -81,6 +90,15 @@ TRANSLATIONS = {
         "Tab Size": "Taille de tabulation",
         "Auto Indent": "Indentation automatique",
         "Show Line Numbers": "Afficher les numéros de ligne",
+        "Minimap: Whole Document": "Minimap : document entier",
+        "Semantic Highlighting": "Coloration sémantique",
+        "Large File Mode": "Mode fichiers volumineux",
+        "Open Log File": "Ouvrir un fichier journal",
+        "Go to Line": "Aller à la ligne",
+        "Line number:": "Numéro de ligne :",
+        "Max File Size (MB)": "Taille maximale du fichier (Mo)",
+        "Max Line Count": "Nombre maximal de lignes",
+        "Max Line Length": "Longueur maximale de ligne",
         "OK": "OK",
         "Cancel": "Annuler",
         
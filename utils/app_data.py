@@ -0,0 +1,9 @@
+"""Ablageort für Anwendungsdaten (Journal, Sitzung)."""
+import os
+
+APP_DIR_NAME = '.funlight_editor'
+
+
+def app_data_path(*parts):
+    """Pfad unterhalb des Datenverzeichnisses im Benutzerordner."""
+    return os.path.join(os.path.expanduser('~'), APP_DIR_NAME, *parts)
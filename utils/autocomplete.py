@@ -67,6 +67,7 @@ class AutoCompleter:
         self.completion_list = CompletionList()
         self.completion_list.completion_selected.connect(self.insert_completion)
         self.completion_prefix = ""
+        self.enabled = True
         
         # Thread-Pool für asynchrone Vervollständigung
         self.executor = ThreadPoolExecutor(max_workers=1)
@@ -86,6 +87,8 @@ class AutoCompleter:
         
     def show_completions(self):
         """Startet den Vervollständigungsprozess."""
+        if not self.enabled:
+            return
         self.delay_timer.start(100)  # 100ms Verzögerung
         
     def request_completions(self):
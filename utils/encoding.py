@@ -0,0 +1,121 @@
+"""Erkennung von Kodierung und Zeilenende anhand einer Stichprobe."""
+import codecs
+import os
+from collections import namedtuple
+
+# Kodierung, ob eine BOM vorhanden ist, und dominantes Zeilenende
+TextFormat = namedtuple('TextFormat', 'encoding bom line_ending')
+
+DEFAULT_FORMAT = TextFormat('utf-8', False, '\n')
+
+# Größe der Stichproben am Anfang und am Ende der Datei
+SAMPLE_SIZE = 64 * 1024
+
+# Längere BOMs zuerst, da die UTF-32-LE-BOM mit der UTF-16-LE-BOM beginnt
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+
+LINE_ENDING_NAMES = {'\n': 'LF', '\r\n': 'CRLF', '\r': 'CR'}
+
+
+def _decodes(samples, encoding):
+    """Prüft, ob alle Stichproben in encoding dekodierbar sind.
+
+    Eine Stichprobe kann mitten in einem Mehrbyte-Zeichen beginnen oder
+    enden; ein paar Bytes am Rand werden daher toleriert.
+    """
+    for sample, at_start, at_end in samples:
+        if not at_start:
+            # Fortsetzungsbytes am Anfang überspringen
+            skip = 0
+            while skip < min(3, len(sample)) and 0x80 <= sample[skip] < 0xC0:
+                skip += 1
+            sample = sample[skip:]
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=at_end)
+        except UnicodeDecodeError:
+            return False
+    return True
+
+
+def detect_encoding(head, tail=b'', tail_is_end=True):
+    """Ermittelt (Kodierung, BOM) aus den Stichproben am Anfang und Ende."""
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding, True
+    samples = [(head, True, not tail and tail_is_end)]
+    if tail:
+        samples.append((tail, False, tail_is_end))
+    if _decodes(samples, 'utf-8'):
+        return 'utf-8', False
+    # Westeuropäische Altdateien; cp1252 lässt fünf Bytes undefiniert
+    if _decodes(samples, 'cp1252'):
+        return 'cp1252', False
+    return 'latin-1', False
+
+
+def detect_line_ending(sample):
+    """Gibt das häufigste Zeilenende der Stichprobe zurück ('\\n' ohne Treffer)."""
+    crlf = sample.count(b'\r\n')
+    lf = sample.count(b'\n') - crlf
+    cr = sample.count(b'\r') - crlf
+    if crlf == lf == cr == 0:
+        return '\n'
+    counts = {'\n': lf, '\r\n': crlf, '\r': cr}
+    return max(counts, key=counts.get)
+
+
+def sniff_file(path, sample_size=SAMPLE_SIZE):
+    """Erkennt Kodierung und Zeilenende, ohne die ganze Datei zu lesen.
+
+    Gelesen werden höchstens je sample_size Bytes am Anfang und am Ende.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(sample_size)
+        size = os.fstat(f.fileno()).st_size
+        tail = b''
+        if size > 2 * sample_size:
+            f.seek(size - sample_size)
+            tail = f.read(sample_size)
+        elif size > sample_size:
+            tail = f.read()
+    encoding, bom = detect_encoding(head, tail)
+    if encoding.startswith(('utf-16', 'utf-32')):
+        # Zeilenenden auf Zeichenebene zählen
+        text = head[:len(head) - len(head) % 4].decode(encoding, 'replace')
+        line_ending = detect_line_ending(text.encode('utf-8'))
+    else:
+        line_ending = detect_line_ending(head)
+    return TextFormat(encoding, bom, line_ending)
+
+
+def decoding_name(text_format):
+    """Codec zum Lesen; bei BOM einer, der die BOM entfernt."""
+    if not text_format.bom:
+        return text_format.encoding
+    return {'utf-8': 'utf-8-sig'}.get(text_format.encoding, text_format.encoding[:6])
+
+
+def encode_text(text, text_format):
+    """Kodiert Editortext ('\\n'-Zeilenenden) im Format der Originaldatei."""
+    if text_format.line_ending != '\n':
+        text = text.replace('\n', text_format.line_ending)
+    data = text.encode(text_format.encoding)
+    if text_format.bom:
+        bom = next(bom for bom, encoding in _BOMS if encoding == text_format.encoding)
+        data = bom + data
+    return data
+
+
+def describe(text_format):
+    """Kurzbeschreibung für die Statusleiste, z.B. 'UTF-8 BOM | CRLF'."""
+    name = text_format.encoding.upper()
+    if text_format.bom:
+        name += ' BOM'
+    return f"{name} | {LINE_ENDING_NAMES[text_format.line_ending]}"
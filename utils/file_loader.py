@@ -0,0 +1,169 @@
+"""Schrittweises Laden großer Dateien in einen Editor."""
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtGui import QTextCursor
+
+# Ab dieser Dateigröße wird eine Datei schrittweise geladen
+STREAMING_THRESHOLD = 2 * 1024 * 1024
+
+
+class StreamingFileLoader(QObject):
+    """Liest und dekodiert eine Datei im Hintergrund und hängt sie stückweise an.
+
+    Der Worker liest die Datei im Textmodus (inkrementelles Dekodieren und
+    Zeilenenden-Umwandlung übernimmt Python) und legt die Stücke in eine
+    kleine Queue. Ein Timer im GUI-Thread hängt pro Durchlauf ein Stück an
+    das Dokument an, sodass die Event-Loop dazwischen frei bleibt. Das erste
+    Stück ist klein und wird normal hervorgehoben, damit der erste Bildschirm
+    sofort fertig ist; der Rest wird im Hintergrund tokenisiert. Die volle
+    Queue bremst den Worker, damit nie die ganze Datei doppelt im Speicher
+    liegt.
+    """
+
+    FIRST_CHUNK_CHARS = 64 * 1024
+    CHUNK_CHARS = 256 * 1024
+    QUEUE_CHUNKS = 4
+
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    progress = Signal(int, int)
+    finished = Signal()
+    failed = Signal(str)
+
+    # Markiert das Ende der Datei in der Queue
+    _END = object()
+    # Kodierung passte nicht: Die Datei kommt ab hier noch einmal als Latin-1
+    _RESTART = object()
+
+    def __init__(self, editor, file_path, encoding='utf-8', parent=None):
+        super().__init__(parent)
+        self.editor = editor
+        self.file_path = file_path
+        self.encoding = encoding
+        self.total_bytes = os.path.getsize(file_path)
+        self.loaded_bytes = 0
+        self._queue = queue.Queue(maxsize=self.QUEUE_CHUNKS)
+        self._cancelled = threading.Event()
+        self._first_chunk = True
+        self._restarted = False
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._append_next_chunk)
+
+    def start(self):
+        """Startet Worker und Einfüge-Timer."""
+        document = self.editor.document()
+        document.setUndoRedoEnabled(False)
+        self.executor.submit(self._read)
+        self._timer.start(1)
+
+    def cancel(self):
+        """Bricht das Laden ab; der Editor behält den Teilinhalt nicht."""
+        self._cancelled.set()
+        self._finish()
+        # Wartenden Worker freigeben
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def is_running(self):
+        return self._timer.isActive()
+
+    def _read(self):
+        """Liest die Datei stückweise (läuft im Thread).
+
+        Die Kodierung stammt aus Stichproben; passt ein späterer Teil nicht,
+        beginnt das Lesen mit Latin-1 von vorn, das jedes Byte dekodiert.
+        """
+        encoding = self.encoding
+        while True:
+            try:
+                with open(self.file_path, 'r', encoding=encoding, errors='strict') as f:
+                    size = self.FIRST_CHUNK_CHARS
+                    while not self._cancelled.is_set():
+                        chunk = f.read(size)
+                        if not chunk:
+                            break
+                        position = f.buffer.tell()
+                        self._put((chunk, position))
+                        size = self.CHUNK_CHARS
+            except UnicodeDecodeError:
+                encoding = 'latin-1'
+                self._put(self._RESTART)
+                continue
+            except Exception as e:
+                self._put(e)
+                return
+            break
+        self._put(self._END)
+
+    def _put(self, item):
+        """Legt ein Stück in die Queue, solange nicht abgebrochen wurde."""
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _append_next_chunk(self):
+        """Hängt das nächste fertige Stück an das Dokument an (GUI-Thread)."""
+        try:
+            item = self._queue.get_nowait()
+        except queue.Empty:
+            return
+        if item is self._END:
+            self._finish()
+            self.finished.emit()
+            return
+        if isinstance(item, Exception):
+            self._finish()
+            self.failed.emit(str(item))
+            return
+        if item is self._RESTART:
+            self._restart_as_latin1()
+            return
+
+        chunk, position = item
+        highlighter = getattr(self.editor, 'highlighter', None)
+        if self._first_chunk:
+            self._first_chunk = False
+            self.editor.setPlainText(chunk)
+            if highlighter is not None:
+                highlighter.begin_deferred()
+        elif self._restarted:
+            # Bisher eingefügten Text durch das neue erste Stück ersetzen
+            self._restarted = False
+            cursor = QTextCursor(self.editor.document())
+            cursor.select(QTextCursor.Document)
+            cursor.insertText(chunk)
+        else:
+            cursor = QTextCursor(self.editor.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(chunk)
+        self.loaded_bytes = position
+        self.progress.emit(position, self.total_bytes)
+
+    def _finish(self):
+        """Beendet das Einfügen und gibt Undo und Hervorhebung wieder frei."""
+        if not self._timer.isActive():
+            return
+        self._timer.stop()
+        document = self.editor.document()
+        document.setUndoRedoEnabled(True)
+        document.setModified(False)
+        highlighter = getattr(self.editor, 'highlighter', None)
+        if highlighter is not None and not self._first_chunk:
+            highlighter.end_deferred()
+
+    def _restart_as_latin1(self):
+        """Übernimmt Latin-1, damit auch das Speichern die Bytes erhält."""
+        self.encoding = 'latin-1'
+        text_format = getattr(self.editor, 'text_format', None)
+        if text_format is not None:
+            self.editor.text_format = text_format._replace(encoding='latin-1', bom=False)
+        # Vor dem ersten Stück gibt es nichts zu ersetzen
+        self._restarted = not self._first_chunk
+        self.loaded_bytes = 0
@@ -0,0 +1,173 @@
+"""Atomares Speichern im Hintergrund."""
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, Signal
+
+from utils.encoding import DEFAULT_FORMAT, encode_text
+
+
+def _read_umask():
+    # os.umask lässt sich nur setzen und zurücksetzen; einmal beim Import
+    # lesen, damit Worker-Threads nicht kurz mit Maske 0 Dateien anlegen
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+def write_temp(path, chunks):
+    """Schreibt die Bytes aus chunks in eine temporäre Datei neben path.
+
+    Die Datei wird vor der Rückgabe mit fsync auf die Platte gebracht und
+    bekommt die Rechte der alten Datei, bei einer neuen Datei die üblichen
+    Rechte nach umask (mkstemp legt sie mit 0600 an). Ist path ein
+    symbolischer Link, entsteht sie neben dem Ziel des Links. Gibt den
+    temporären Pfad zurück.
+    """
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(temp_path, mode)
+    except BaseException:
+        discard_temp(temp_path)
+        raise
+    return temp_path
+
+
+def discard_temp(temp_path):
+    try:
+        os.remove(temp_path)
+    except OSError:
+        pass
+
+
+def replace_file(temp_path, path):
+    """Ersetzt path atomar durch temp_path und sichert den Verzeichniseintrag.
+
+    Ein symbolischer Link bleibt erhalten; ersetzt wird sein Ziel.
+    """
+    path = os.path.realpath(path)
+    os.replace(temp_path, path)
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(os.path.dirname(path), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def atomic_write(path, chunks):
+    """Schreibt die Bytes aus chunks atomar nach path.
+
+    Ein Absturz mitten im Schreiben lässt die alte Datei unberührt.
+    """
+    temp_path = write_temp(path, chunks)
+    try:
+        replace_file(temp_path, path)
+    except BaseException:
+        discard_temp(temp_path)
+        raise
+
+
+class FileSaver(QObject):
+    """Speichert Dateien in einem Worker und fasst Speicheraufträge zusammen.
+
+    ``save`` bekommt einen bereits erstellten Schnappschuss (Text oder eine
+    Funktion, die Byte-Stücke liefert). Läuft für denselben Pfad schon ein
+    Speichervorgang, wird nur der jeweils neueste Auftrag vorgemerkt und
+    danach geschrieben; Zwischenstände entfallen. Ihre Callbacks laufen mit
+    dem Ergebnis dieses letzten Schreibvorgangs.
+
+    Mit ``release`` wird nur die temporäre Datei im Worker geschrieben; das
+    Ersetzen folgt im GUI-Thread nach release() (z.B. um ein Mapping der
+    Zieldatei freizugeben, das Windows sonst nicht ersetzen lässt).
+    """
+
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    started = Signal(str)
+    saved = Signal(str)
+    failed = Signal(str, str)
+
+    # Interne Signale aus dem Worker
+    _done = Signal(str, object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._running = set()
+        self._pending = {}
+        self._callbacks = {}
+        self._done.connect(self._on_done)
+
+    def save_text(self, path, text, text_format=DEFAULT_FORMAT, callback=None):
+        """Speichert text im angegebenen Format; das Kodieren läuft im Worker."""
+        self.save(path, lambda: (encode_text(text, text_format),), callback)
+
+    def save(self, path, chunks, callback=None, release=None):
+        """Speichert die Byte-Stücke, die chunks() liefert.
+
+        callback(error) läuft nach Abschluss im GUI-Thread (error ist None
+        bei Erfolg), bevor ``saved`` bzw. ``failed`` gesendet wird.
+        """
+        callbacks = [callback] if callback is not None else []
+        if path in self._running:
+            pending = self._pending.get(path)
+            if pending is not None:
+                # Verdrängter Auftrag: seine Callbacks warten mit
+                callbacks = pending[1] + callbacks
+            self._pending[path] = (chunks, callbacks, release)
+            return
+        self._start(path, chunks, callbacks, release)
+
+    def _start(self, path, chunks, callbacks, release):
+        self._running.add(path)
+        self._callbacks[path] = (callbacks, release)
+        self.started.emit(path)
+        self.executor.submit(self._write, path, chunks, release is None)
+
+    def _write(self, path, chunks, replace):
+        """Schreibt die Datei (läuft im Thread)."""
+        try:
+            if replace:
+                atomic_write(path, chunks())
+                temp_path = None
+            else:
+                temp_path = write_temp(path, chunks())
+        except Exception as e:
+            self._done.emit(path, None, e)
+            return
+        self._done.emit(path, temp_path, None)
+
+    def _on_done(self, path, temp_path, error):
+        self._running.discard(path)
+        callbacks, release = self._callbacks.pop(path, ((), None))
+        if temp_path is not None:
+            release()
+            try:
+                replace_file(temp_path, path)
+            except OSError as e:
+                discard_temp(temp_path)
+                error = e
+        for callback in callbacks:
+            callback(error)
+        if error is None:
+            self.saved.emit(path)
+        else:
+            self.failed.emit(path, str(error))
+        pending = self._pending.pop(path, None)
+        if pending is not None:
+            self._start(path, *pending)
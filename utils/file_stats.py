@@ -0,0 +1,65 @@
+"""Kennzahlen einer Datei für die Wahl des Großdatei-Modus."""
+import os
+from collections import namedtuple
+
+FileStats = namedtuple('FileStats', 'size line_count max_line_length')
+
+# Standard-Schwellenwerte für den Großdatei-Modus
+DEFAULT_LARGE_FILE_THRESHOLDS = {
+    'size_mb': 10,
+    'line_count': 200000,
+    'max_line_length': 10000,
+}
+
+
+def measure_file(path, thresholds=None, block_size=1 << 20):
+    """Ermittelt Größe, Zeilenzahl und längste Zeile (in Bytes) einer Datei.
+
+    Die Datei wird blockweise binär gelesen; Zählen und Aufteilen laufen
+    in C, sodass auch Dateien mit einigen zehn MB schnell gemessen sind.
+    Mit thresholds (wie bei ``exceeds_thresholds``) endet die Messung,
+    sobald ein Schwellenwert überschritten ist; Zeilenzahl und längste
+    Zeile sind dann nur Untergrenzen.
+    """
+    size = os.path.getsize(path)
+    line_count = 1
+    max_line_length = 0
+    current = 0
+    if thresholds is not None:
+        if size > thresholds['size_mb'] * 1024 * 1024:
+            return FileStats(size, line_count, max_line_length)
+        max_lines = thresholds['line_count']
+        max_length = thresholds['max_line_length']
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            newlines = block.count(b'\n')
+            if not newlines:
+                current += len(block)
+                if thresholds is not None and current > max_length:
+                    break
+                continue
+            line_count += newlines
+            first = block.index(b'\n')
+            last = block.rindex(b'\n')
+            max_line_length = max(max_line_length, current + first)
+            if newlines > 1:
+                max_line_length = max(
+                    max_line_length, max(map(len, block[first + 1:last].split(b'\n')))
+                )
+            current = len(block) - last - 1
+            if thresholds is not None and (line_count > max_lines or max_line_length > max_length):
+                break
+    max_line_length = max(max_line_length, current)
+    return FileStats(size, line_count, max_line_length)
+
+
+def exceeds_thresholds(stats, thresholds):
+    """Prüft, ob eine Kennzahl den zugehörigen Schwellenwert überschreitet."""
+    return (
+        stats.size > thresholds['size_mb'] * 1024 * 1024
+        or stats.line_count > thresholds['line_count']
+        or stats.max_line_length > thresholds['max_line_length']
+    )
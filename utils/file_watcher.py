@@ -0,0 +1,181 @@
+"""Übernahme externer Dateiänderungen in offene Editoren."""
+import difflib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+from PySide6.QtGui import QTextCursor
+
+from utils.encoding import decoding_name
+
+
+def _stat_key(path):
+    """(mtime, Größe) einer Datei oder None, wenn sie fehlt."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def diff_lines(old_lines, new_lines):
+    """Geänderte Zeilenbereiche als (i1, i2, j1, j2), aufsteigend sortiert.
+
+    Gemeinsamer Anfang und gemeinsames Ende werden vorher abgeschnitten,
+    damit SequenceMatcher nur den geänderten Mittelteil vergleicht.
+    """
+    prefix = 0
+    limit = min(len(old_lines), len(new_lines))
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    old_middle = old_lines[prefix:len(old_lines) - suffix]
+    new_middle = new_lines[prefix:len(new_lines) - suffix]
+    matcher = difflib.SequenceMatcher(None, old_middle, new_middle, autojunk=False)
+    return [
+        (i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != 'equal'
+    ]
+
+
+class ExternalChangeWatcher(QObject):
+    """Beobachtet die Dateien offener Editoren und lädt Änderungen nach.
+
+    Nach einer Änderung auf der Platte liest ein Worker die Datei und
+    vergleicht sie zeilenweise mit dem Schnappschuss des Puffers. Im
+    GUI-Thread werden nur die geänderten Zeilenbereiche in einem Editierblock
+    ersetzt: Undo-Verlauf, Cursor und die Hervorhebung unveränderter Blöcke
+    bleiben erhalten. Puffer mit ungespeicherten Änderungen werden nicht
+    angefasst. Eigene Speichervorgänge werden über ``mark_synced`` erkannt.
+    """
+
+    DEBOUNCE_MS = 200
+
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    reloaded = Signal(str)
+    conflict = Signal(str)
+    removed = Signal(str)
+
+    # Interne Signale aus dem Worker
+    _diff_ready = Signal(object, str, object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._editors = {}
+        self._known = {}
+        self._timers = {}
+        self._diff_ready.connect(self._apply_diff)
+
+    def watch(self, editor):
+        """Beobachtet die Datei von editor (auch nach 'Speichern unter')."""
+        self.unwatch(editor)
+        path = editor.property("file_path")
+        if not path:
+            return
+        self._editors[path] = editor
+        self._known[path] = _stat_key(path)
+        self._watcher.addPath(path)
+
+    def unwatch(self, editor):
+        for path, watched in list(self._editors.items()):
+            if watched is editor:
+                del self._editors[path]
+                self._known.pop(path, None)
+                self._watcher.removePath(path)
+
+    def mark_synced(self, path):
+        """Merkt sich den jetzigen Dateistand (z.B. nach eigenem Speichern)."""
+        if path in self._editors:
+            self._known[path] = _stat_key(path)
+            # Ersetzen per rename entfernt die Datei aus dem Watcher
+            if path not in self._watcher.files():
+                self._watcher.addPath(path)
+
+    def _on_file_changed(self, path):
+        # Editoren speichern oft in mehreren Schritten; kurz abwarten
+        timer = self._timers.get(path)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self._check(path))
+            self._timers[path] = timer
+        timer.start(self.DEBOUNCE_MS)
+
+    def _check(self, path):
+        editor = self._editors.get(path)
+        if editor is None:
+            return
+        key = _stat_key(path)
+        if key is None:
+            self.removed.emit(path)
+            return
+        if path not in self._watcher.files():
+            self._watcher.addPath(path)
+        if key == self._known.get(path):
+            return
+        if editor.document().isModified():
+            self._known[path] = key
+            self.conflict.emit(path)
+            return
+        snapshot = editor.toPlainText()
+        encoding = decoding_name(editor.text_format)
+        self.executor.submit(self._compute_diff, editor, path, snapshot, encoding, key)
+
+    def _compute_diff(self, editor, path, snapshot, encoding, key):
+        """Liest die Datei und vergleicht sie mit dem Puffer (läuft im Thread)."""
+        try:
+            with open(path, 'r', encoding=encoding, errors='replace') as f:
+                new_lines = f.read().split('\n')
+        except OSError:
+            return
+        changes = diff_lines(snapshot.split('\n'), new_lines)
+        self._diff_ready.emit(editor, path, (snapshot, changes, new_lines), key)
+
+    def _apply_diff(self, editor, path, result, key):
+        snapshot, changes, new_lines = result
+        if self._editors.get(path) is not editor:
+            return
+        if editor.document().isModified() or editor.toPlainText() != snapshot:
+            # Inzwischen bearbeitet: neu prüfen
+            self._check(path)
+            return
+        self._known[path] = key
+        if changes:
+            self._replace_lines(editor, changes, new_lines)
+            editor.document().setModified(False)
+        self.reloaded.emit(path)
+
+    def _replace_lines(self, editor, changes, new_lines):
+        """Ersetzt die Zeilenbereiche von hinten nach vorn in einem Editierblock."""
+        document = editor.document()
+        line_count = document.blockCount()
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        for i1, i2, j1, j2 in reversed(changes):
+            lines = new_lines[j1:j2]
+            if i2 < line_count:
+                start = document.findBlockByNumber(i1).position()
+                end = document.findBlockByNumber(i2).position()
+                text = ''.join(line + '\n' for line in lines)
+            elif i1 < i2:
+                # Bereich reicht bis zum Dokumentende
+                start = document.findBlockByNumber(i1).position()
+                end = document.characterCount() - 1
+                text = '\n'.join(lines)
+                if not lines and i1 > 0:
+                    start -= 1
+            else:
+                # Zeilen am Ende anhängen
+                start = end = document.characterCount() - 1
+                text = '\n' + '\n'.join(lines)
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            cursor.insertText(text)
+        cursor.endEditBlock()
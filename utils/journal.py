@@ -0,0 +1,283 @@
+"""Journal ungespeicherter Puffer für die Wiederherstellung nach einem Absturz."""
+import json
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtGui import QTextCursor
+
+from utils.app_data import app_data_path
+from utils.encoding import TextFormat
+from utils.file_saver import atomic_write
+
+
+class _BufferJournal:
+    """Zustand des Journals eines einzelnen Editors."""
+
+    def __init__(self, buffer_id, editor):
+        self.id = buffer_id
+        self.editor = editor
+        # Generation des letzten Schnappschusses; Journalzeilen gehören zu ihr
+        self.generation = 0
+        self.pending = []
+        self.pending_chars = 0
+        self.ops_since_snapshot = 0
+        self.active = False
+        self.last_meta = None
+        self.connections = []
+
+
+class HotExitJournal(QObject):
+    """Schreibt Änderungen ungespeicherter Puffer laufend auf die Platte.
+
+    Pro Puffer gibt es drei Dateien: ``<id>.snapshot`` (Kopfzeile mit der
+    Generation, danach der Text), ``<id>.journal`` (eine JSON-Zeile je
+    Änderung aus ``contentsChange``) und ``<id>.json`` (Pfad, Format,
+    Cursor und Scrollposition). Änderungen werden im GUI-Thread gesammelt
+    und periodisch von einem einzelnen Worker angehängt; nach
+    ``SNAPSHOT_OPS`` Änderungen oder ``SNAPSHOT_CHARS`` Zeichen ersetzt ein
+    neuer Schnappschuss das Journal, damit die Wiederherstellung nur wenige
+    Änderungen nachspielen muss. Journalzeilen tragen die Generation ihres
+    Schnappschusses, sodass ein Absturz zwischen Schnappschuss und Kürzen
+    des Journals nichts doppelt anwendet.
+
+    Nur geänderte Puffer werden protokolliert: wird ein Dokument wieder
+    unverändert (Speichern, Rückgängig), verschwinden seine Dateien.
+    """
+
+    FLUSH_INTERVAL_MS = 1000
+    SNAPSHOT_OPS = 500
+    SNAPSHOT_CHARS = 1024 * 1024
+
+    # Ein Thread, damit Schreibvorgänge eines Puffers in Reihenfolge bleiben
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    def __init__(self, directory=None, parent=None):
+        super().__init__(parent)
+        self.directory = directory or app_data_path('journal')
+        os.makedirs(self.directory, exist_ok=True)
+        self._buffers = {}
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start(self.FLUSH_INTERVAL_MS)
+
+    def _file(self, buffer_id, suffix):
+        return os.path.join(self.directory, buffer_id + suffix)
+
+    # Anmelden und Abmelden
+
+    def attach(self, editor, buffer_id=None, generation=0):
+        """Beginnt, die Änderungen von editor zu protokollieren."""
+        if editor in self._buffers:
+            return
+        buffer = _BufferJournal(buffer_id or uuid.uuid4().hex, editor)
+        buffer.generation = generation
+        self._buffers[editor] = buffer
+        document = editor.document()
+        buffer.connections = [
+            (document.contentsChange,
+             lambda position, removed, added: self._on_contents_change(buffer, position, removed, added)),
+            (document.modificationChanged,
+             lambda modified: self._on_modification_changed(buffer, modified)),
+        ]
+        for signal, slot in buffer.connections:
+            signal.connect(slot)
+        if document.isModified():
+            self._start(buffer)
+
+    def detach(self, editor, discard=True):
+        """Beendet das Protokollieren; mit discard werden die Dateien gelöscht."""
+        buffer = self._buffers.pop(editor, None)
+        if buffer is None:
+            return
+        for signal, slot in buffer.connections:
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError):
+                pass
+        if discard:
+            self.executor.submit(self._discard_files, buffer.id)
+        else:
+            self._flush_buffer(buffer)
+
+    # Änderungen sammeln
+
+    def _on_modification_changed(self, buffer, modified):
+        if modified:
+            self._start(buffer)
+        else:
+            # Gespeichert oder zurückgenommen: nichts wiederherzustellen
+            buffer.active = False
+            buffer.pending = []
+            self.executor.submit(self._discard_files, buffer.id)
+
+    def _start(self, buffer):
+        """Schnappschuss beim Übergang zu 'geändert' (enthält die erste Änderung)."""
+        buffer.active = True
+        self._snapshot(buffer)
+
+    def _on_contents_change(self, buffer, position, removed, added):
+        if not buffer.active:
+            return
+        text = ''
+        if added:
+            document = buffer.editor.document()
+            end = min(position + added, document.characterCount() - 1)
+            cursor = QTextCursor(document)
+            cursor.setPosition(position)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            text = cursor.selectedText().replace('\u2029', '\n')
+        buffer.pending.append((position, removed, text))
+        buffer.pending_chars += len(text) + removed
+        buffer.ops_since_snapshot += 1
+
+    # Schreiben
+
+    def flush(self):
+        """Hängt gesammelte Änderungen an (Timer) oder schreibt Schnappschüsse."""
+        for buffer in list(self._buffers.values()):
+            self._flush_buffer(buffer)
+
+    def _flush_buffer(self, buffer):
+        if not buffer.active:
+            return
+        if (buffer.ops_since_snapshot >= self.SNAPSHOT_OPS
+                or buffer.pending_chars >= self.SNAPSHOT_CHARS):
+            self._snapshot(buffer)
+            return
+        if buffer.pending:
+            lines = ''.join(
+                json.dumps([buffer.generation, position, removed, text]) + '\n'
+                for position, removed, text in buffer.pending
+            )
+            buffer.pending = []
+            buffer.pending_chars = 0
+            self.executor.submit(self._append, buffer.id, lines)
+        self._write_meta_if_changed(buffer)
+
+    def _snapshot(self, buffer):
+        """Ersetzt Journal und Schnappschuss durch den aktuellen Text."""
+        buffer.generation += 1
+        buffer.pending = []
+        buffer.pending_chars = 0
+        buffer.ops_since_snapshot = 0
+        text = buffer.editor.toPlainText()
+        self.executor.submit(self._write_snapshot, buffer.id, buffer.generation, text)
+        self._write_meta_if_changed(buffer, force=True)
+
+    def _meta(self, buffer):
+        editor = buffer.editor
+        text_format = editor.text_format
+        return {
+            'path': editor.property("file_path") or '',
+            'encoding': text_format.encoding,
+            'bom': text_format.bom,
+            'line_ending': text_format.line_ending,
+            'cursor': editor.textCursor().position(),
+            'scroll': editor.verticalScrollBar().value(),
+        }
+
+    def _write_meta_if_changed(self, buffer, force=False):
+        meta = self._meta(buffer)
+        if force or meta != buffer.last_meta:
+            buffer.last_meta = meta
+            self.executor.submit(self._write_meta, buffer.id, meta)
+
+    # Dateizugriffe (laufen im Worker)
+
+    def _append(self, buffer_id, lines):
+        with open(self._file(buffer_id, '.journal'), 'a', encoding='utf-8') as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_snapshot(self, buffer_id, generation, text):
+        header = json.dumps({'generation': generation}) + '\n'
+        atomic_write(self._file(buffer_id, '.snapshot'),
+                     (header.encode('utf-8'), text.encode('utf-8', 'surrogatepass')))
+        # Alte Journalzeilen gehören zur vorigen Generation
+        open(self._file(buffer_id, '.journal'), 'w').close()
+
+    def _write_meta(self, buffer_id, meta):
+        atomic_write(self._file(buffer_id, '.json'), (json.dumps(meta).encode('utf-8'),))
+
+    def _discard_files(self, buffer_id):
+        for suffix in ('.json', '.snapshot', '.journal'):
+            try:
+                os.remove(self._file(buffer_id, suffix))
+            except OSError:
+                pass
+
+    def shutdown(self):
+        """Schreibt alles Ausstehende und wartet auf den Worker (beim Beenden).
+
+        Die Dateien bleiben liegen, damit die Puffer beim nächsten Start
+        wiederhergestellt werden.
+        """
+        self._timer.stop()
+        for editor in list(self._buffers):
+            self.detach(editor, discard=False)
+        self.executor.submit(lambda: None).result()
+
+    # Wiederherstellen
+
+    def restorable_buffers(self):
+        """IDs aller Puffer mit vollständigem Schnappschuss."""
+        ids = []
+        for name in sorted(os.listdir(self.directory)):
+            buffer_id, suffix = os.path.splitext(name)
+            if suffix == '.json' and os.path.exists(self._file(buffer_id, '.snapshot')):
+                ids.append(buffer_id)
+        return ids
+
+    def restore(self, buffer_id, editor):
+        """Lädt Schnappschuss und Journal in editor und protokolliert weiter.
+
+        Gibt die Metadaten (Pfad, Cursor, Scrollposition) zurück.
+        """
+        with open(self._file(buffer_id, '.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(self._file(buffer_id, '.snapshot'), 'rb') as f:
+            generation = json.loads(f.readline())['generation']
+            text = f.read().decode('utf-8', 'surrogatepass')
+
+        document = editor.document()
+        document.setUndoRedoEnabled(False)
+        editor.setPlainText(text)
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        for position, removed, added in self._read_journal(buffer_id, generation):
+            end = document.characterCount() - 1
+            cursor.setPosition(min(position, end))
+            cursor.setPosition(min(position + removed, end), QTextCursor.KeepAnchor)
+            cursor.insertText(added)
+        cursor.endEditBlock()
+        document.setUndoRedoEnabled(True)
+
+        editor.setProperty("file_path", meta['path'])
+        editor.text_format = TextFormat(meta['encoding'], meta['bom'], meta['line_ending'])
+        text_cursor = editor.textCursor()
+        text_cursor.setPosition(min(meta['cursor'], document.characterCount() - 1))
+        editor.setTextCursor(text_cursor)
+        scroll = meta['scroll']
+        # Erst nach dem Layout ist der Scrollbereich groß genug
+        QTimer.singleShot(0, lambda: editor.verticalScrollBar().setValue(scroll))
+
+        self.attach(editor, buffer_id, generation)
+        document.setModified(True)
+        return meta
+
+    def _read_journal(self, buffer_id, generation):
+        """Änderungen der passenden Generation; eine abgerissene letzte Zeile fehlt."""
+        try:
+            with open(self._file(buffer_id, '.journal'), encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry_generation, position, removed, added = json.loads(line)
+                    except ValueError:
+                        break
+                    if entry_generation == generation:
+                        yield position, removed, added
+        except FileNotFoundError:
+            return
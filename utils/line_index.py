@@ -0,0 +1,139 @@
+"""Dünner Zeilenindex für Byte-Inhalte (z.B. eine ``PieceTable``)."""
+from array import array
+from bisect import bisect_right
+
+# Abstand der Checkpoints in Zeilen
+LINES_PER_CHECKPOINT = 1024
+# Blockgröße beim Scannen
+SCAN_BLOCK = 1 << 22
+# Teilblöcke, in denen nur gezählt wird
+COUNT_STEP = 4096
+
+
+def scan_checkpoints(block, base, newlines, every=LINES_PER_CHECKPOINT):
+    """Sucht die Checkpoint-Zeilen in einem Block.
+
+    block beginnt bei Offset base, davor liegen newlines Zeilenumbrüche.
+    Pro Teilblock wird nur gezählt; Zeilenumbrüche werden einzeln gesucht,
+    wenn der Teilblock einen Checkpoint enthält. Gibt (Offsets, Anzahl
+    Zeilenumbrüche bis Blockende) zurück.
+    """
+    found = array('Q')
+    next_checkpoint = (newlines // every + 1) * every
+    for start in range(0, len(block), COUNT_STEP):
+        stop = min(len(block), start + COUNT_STEP)
+        count = block.count(b'\n', start, stop)
+        if newlines + count < next_checkpoint:
+            newlines += count
+            continue
+        position = block.find(b'\n', start, stop)
+        while position != -1:
+            newlines += 1
+            if newlines == next_checkpoint:
+                found.append(base + position + 1)
+                next_checkpoint += every
+            position = block.find(b'\n', position + 1, stop)
+    return found, newlines
+
+
+class LineIndex:
+    """Offsets jeder ``every``-ten Zeile in einem ``array('Q')``.
+
+    Zeile -> Offset und Offset -> Zeile kosten eine binäre Suche plus einen
+    Scan über höchstens ``every`` Zeilen. Der Index ist bis
+    ``indexed_bytes`` gültig und wird bei Bedarf weiter aufgebaut (oder von
+    einem Worker über ``add_scanned`` befüllt). Änderungen ohne neue oder
+    entfernte Zeilenumbrüche verschieben nur die folgenden Checkpoints;
+    andere kürzen den Index auf den Teil vor der Änderung.
+
+    source muss ``len()``, ``read()``, ``find_byte()`` und ``count_byte()``
+    wie ``PieceTable`` anbieten.
+    """
+
+    def __init__(self, source, every=LINES_PER_CHECKPOINT):
+        self.source = source
+        self.every = every
+        # False, solange ein Worker scannt: dann nicht selbst nachscannen
+        self.lazy = True
+        self.reset()
+
+    def reset(self):
+        self.checkpoints = array('Q', [0])
+        self.indexed_bytes = 0
+        self.indexed_newlines = 0
+
+    @property
+    def complete(self):
+        return self.indexed_bytes >= len(self.source)
+
+    @property
+    def line_count(self):
+        """Anzahl der Zeilen oder None, solange der Index unvollständig ist."""
+        return self.indexed_newlines + 1 if self.complete else None
+
+    def add_scanned(self, found, end, newlines):
+        """Übernimmt Checkpoints, die bis end gescannt wurden."""
+        self.checkpoints.extend(found)
+        self.indexed_bytes = end
+        self.indexed_newlines = newlines
+
+    def _extend(self, offset=None, line=None):
+        """Scannt weiter, bis offset bzw. line abgedeckt ist."""
+        size = len(self.source)
+        while self.indexed_bytes < size:
+            if offset is not None and offset <= self.indexed_bytes:
+                return
+            if line is not None and line < len(self.checkpoints) * self.every:
+                return
+            block = self.source.read(self.indexed_bytes, SCAN_BLOCK)
+            found, newlines = scan_checkpoints(
+                block, self.indexed_bytes, self.indexed_newlines, self.every
+            )
+            self.add_scanned(found, self.indexed_bytes + len(block), newlines)
+
+    def line_for_offset(self, offset):
+        """Zeilennummer (0-basiert) von offset oder None, falls (noch) unbekannt."""
+        if offset > self.indexed_bytes:
+            if not self.lazy:
+                return None
+            self._extend(offset=offset)
+        index = bisect_right(self.checkpoints, offset) - 1
+        checkpoint = self.checkpoints[index]
+        return index * self.every + self.source.count_byte(b'\n', checkpoint, offset)
+
+    def offset_for_line(self, line):
+        """Offset des Anfangs der Zeile (0-basiert) oder None."""
+        if line < 0:
+            return None
+        index = line // self.every
+        if index >= len(self.checkpoints) and self.lazy:
+            self._extend(line=line)
+        if index >= len(self.checkpoints):
+            return None
+        offset = self.checkpoints[index]
+        for _ in range(line % self.every):
+            newline = self.source.find_byte(b'\n', offset)
+            if newline == -1:
+                return None
+            offset = newline + 1
+        return offset
+
+    def update(self, position, removed, removed_newlines, inserted, inserted_newlines):
+        """Passt den Index an eine Änderung an position an.
+
+        removed/inserted sind Bytes, *_newlines die Zeilenumbrüche darin.
+        """
+        if position >= self.indexed_bytes:
+            return
+        if removed_newlines == inserted_newlines and position + removed <= self.indexed_bytes:
+            # Zeilennummern bleiben gleich, nur Offsets verschieben sich
+            delta = inserted - removed
+            start = bisect_right(self.checkpoints, position)
+            for index in range(start, len(self.checkpoints)):
+                self.checkpoints[index] += delta
+            self.indexed_bytes += delta
+            return
+        keep = bisect_right(self.checkpoints, position)
+        del self.checkpoints[keep:]
+        self.indexed_bytes = self.checkpoints[-1]
+        self.indexed_newlines = (keep - 1) * self.every
@@ -0,0 +1,70 @@
+"""Kompakte Zeilenübersicht für die Minimap des ganzen Dokuments."""
+from itertools import repeat
+from operator import sub
+
+# Spalten werden auf ein Byte begrenzt
+MAX_COLUMN = 255
+
+# Leere Zeilen bekommen die größte Einrückung, damit min() sie übergeht
+_BLANK_MASK = bytes([MAX_COLUMN]) + bytes(255)
+
+
+def summarize_lines(lines):
+    """Einrückung und Ende des Textes je Zeile als zwei ``bytearray``.
+
+    Alle Schritte laufen über map() in C. Leere Zeilen haben Einrückung
+    MAX_COLUMN und Ende 0.
+    """
+    ends = bytearray(map(min, map(len, map(str.rstrip, lines)), repeat(MAX_COLUMN)))
+    indents = bytearray(map(
+        min,
+        map(max, map(sub, map(len, lines), map(len, map(str.lstrip, lines))), ends.translate(_BLANK_MASK)),
+        repeat(MAX_COLUMN),
+    ))
+    return indents, ends
+
+
+class LineSummary:
+    """Einrückung und Textende jeder Zeile (je ein Byte pro Zeile).
+
+    Wird bei Änderungen nur im betroffenen Zeilenbereich ersetzt.
+    ``rows`` fasst die Zeilen für eine gegebene Höhe zu Pixelzeilen
+    zusammen; min/max über Slices laufen in C, sodass auch 200.000
+    Zeilen in wenigen Millisekunden verdichtet sind.
+    """
+
+    def __init__(self, lines=()):
+        self.indents, self.ends = summarize_lines(lines)
+
+    def __len__(self):
+        return len(self.ends)
+
+    def replace(self, first, count, lines):
+        """Ersetzt count Zeilen ab first durch die Zusammenfassung von lines."""
+        indents, ends = summarize_lines(lines)
+        self.indents[first:first + count] = indents
+        self.ends[first:first + count] = ends
+
+    def rows(self, height, pitch):
+        """Liefert (y, Zeilenhöhe, Zeile mit dem längsten Text, Einrückung, Ende).
+
+        Passen alle Zeilen mit pitch Pixeln in height, bekommt jede Zeile
+        eine eigene Pixelzeile; sonst fasst jede Pixelzeile mehrere Zeilen
+        zusammen (kleinste Einrückung, größtes Ende). Leere Zeilen und
+        Bereiche fehlen.
+        """
+        indents = self.indents
+        ends = self.ends
+        count = len(ends)
+        if count * pitch <= height:
+            for line in range(count):
+                end = ends[line]
+                if end:
+                    yield line * pitch, pitch, line, indents[line], end
+            return
+        for y in range(height):
+            first = y * count // height
+            last = max(first + 1, (y + 1) * count // height)
+            end = max(ends[first:last])
+            if end:
+                yield y, 1, ends.index(end, first, last), min(indents[first:last]), end
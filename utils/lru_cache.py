@@ -0,0 +1,81 @@
+"""Begrenzter, threadsicherer LRU-Cache mit Trefferstatistik."""
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """LRU-Cache mit fester Maximalgröße.
+
+    Der Cache wird von mehreren Editoren und vom Tokenizer-Worker
+    gleichzeitig benutzt und ist deshalb durch ein Lock geschützt.
+    ``hits`` und ``misses`` zählen die Zugriffe für die Feinabstimmung.
+
+    Statt (oder zusätzlich zu) einer Anzahl kann ein Speicherbudget
+    ``max_bytes`` gesetzt werden; ``sizeof(value)`` schätzt dann die Größe
+    jedes Eintrags, und die ältesten werden verdrängt, bis die Summe
+    ``bytes`` wieder ins Budget passt. maxsize=None heißt ohne Obergrenze
+    für die Anzahl.
+    """
+
+    def __init__(self, maxsize=4096, max_bytes=None, sizeof=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """Gibt den Wert zu key zurück und markiert ihn als zuletzt benutzt."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Speichert einen Wert und verdrängt bei Bedarf die ältesten."""
+        size = self.sizeof(value) if self.sizeof is not None else 0
+        with self._lock:
+            self.bytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while self._data and (
+                    (self.maxsize is not None and len(self._data) > self.maxsize)
+                    or (self.max_bytes is not None and self.bytes > self.max_bytes)):
+                old_key, _ = self._data.popitem(last=False)
+                self.bytes -= self._sizes.pop(old_key)
+
+    def clear(self):
+        """Leert den Cache und setzt die Statistik zurück."""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Gibt Größe, Speicher, Treffer, Fehlzugriffe und Trefferquote zurück."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
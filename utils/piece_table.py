@@ -0,0 +1,230 @@
+"""Piece Table über einer speichergemappten Datei."""
+import mmap
+import os
+from bisect import bisect_right
+
+
+class PieceTable:
+    """Bearbeitbarer Byte-Inhalt einer Datei, ohne sie in den Speicher zu laden.
+
+    Der Originalinhalt bleibt schreibgeschützt gemappt; eingefügte Bytes
+    landen in einem Anhängepuffer. Der aktuelle Text ist die Folge der
+    Pieces (Puffer, Start, Länge). Öffnen kostet damit O(1), Änderungen
+    O(Anzahl Pieces), und der Speicherbedarf wächst nur mit den Änderungen.
+    Alle Offsets sind Byte-Offsets.
+    """
+
+    ORIGINAL = 0
+    ADD = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.modified = False
+        self._file = None
+        self._mmap = b''
+        self._add = bytearray()
+        self._pieces = []
+        self._starts = []
+        self._length = 0
+        self._open_original()
+
+    def _open_original(self):
+        """Mappt die Datei und setzt den Inhalt auf das Original zurück."""
+        size = self._map()
+        self._pieces = [(self.ORIGINAL, 0, size)] if size else []
+        self._add = bytearray()
+        self._rebuild_index()
+        self.modified = False
+
+    def _map(self):
+        """Öffnet und mappt die Datei; gibt ihre Größe zurück."""
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._mmap = b''
+        return size
+
+    @property
+    def closed(self):
+        return self._file is None
+
+    def close(self):
+        """Gibt Mapping und Dateihandle frei."""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._mmap = b''
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self):
+        return self._length
+
+    def _buffer(self, buffer_id):
+        return self._mmap if buffer_id == self.ORIGINAL else self._add
+
+    def _rebuild_index(self):
+        """Berechnet die Startoffsets der Pieces neu."""
+        starts = []
+        offset = 0
+        for _buffer_id, _start, length in self._pieces:
+            starts.append(offset)
+            offset += length
+        self._starts = starts
+        self._length = offset
+
+    def _locate(self, offset):
+        """Gibt (Piece-Index, Offset innerhalb des Pieces) zurück."""
+        if offset >= self._length:
+            return len(self._pieces), 0
+        index = bisect_right(self._starts, offset) - 1
+        return index, offset - self._starts[index]
+
+    def read(self, offset, size):
+        """Liest bis zu size Bytes ab offset."""
+        offset = max(0, offset)
+        end = min(self._length, offset + size)
+        if offset >= end:
+            return b''
+        index, inner = self._locate(offset)
+        parts = []
+        remaining = end - offset
+        while remaining > 0 and index < len(self._pieces):
+            buffer_id, start, length = self._pieces[index]
+            take = min(length - inner, remaining)
+            parts.append(self._buffer(buffer_id)[start + inner:start + inner + take])
+            remaining -= take
+            inner = 0
+            index += 1
+        return b''.join(parts)
+
+    def insert(self, offset, data):
+        """Fügt Bytes an offset ein."""
+        if not data:
+            return
+        offset = max(0, min(offset, self._length))
+        index, inner = self._locate(offset)
+        add_start = len(self._add)
+        self._add.extend(data)
+        new_piece = (self.ADD, add_start, len(data))
+
+        if inner == 0 and index > 0:
+            # Fortlaufendes Tippen: vorheriges Piece verlängern
+            buffer_id, start, length = self._pieces[index - 1]
+            if buffer_id == self.ADD and start + length == add_start:
+                self._pieces[index - 1] = (buffer_id, start, length + len(data))
+                self._finish_edit()
+                return
+        if inner == 0:
+            self._pieces.insert(index, new_piece)
+        else:
+            buffer_id, start, length = self._pieces[index]
+            self._pieces[index:index + 1] = [
+                (buffer_id, start, inner),
+                new_piece,
+                (buffer_id, start + inner, length - inner),
+            ]
+        self._finish_edit()
+
+    def delete(self, offset, size):
+        """Entfernt size Bytes ab offset."""
+        offset = max(0, offset)
+        end = min(self._length, offset + size)
+        if offset >= end:
+            return
+        first, first_inner = self._locate(offset)
+        last, last_inner = self._locate(end)
+        replacement = []
+        if first_inner:
+            buffer_id, start, _length = self._pieces[first]
+            replacement.append((buffer_id, start, first_inner))
+        if last < len(self._pieces) and last_inner:
+            buffer_id, start, length = self._pieces[last]
+            replacement.append((buffer_id, start + last_inner, length - last_inner))
+            last += 1
+        self._pieces[first:last] = replacement
+        self._finish_edit()
+
+    def _finish_edit(self):
+        self._rebuild_index()
+        self.modified = True
+
+    def find_byte(self, value, start=0, end=None):
+        """Sucht ein einzelnes Byte in [start, end); -1, wenn es nicht vorkommt."""
+        end = self._length if end is None else min(end, self._length)
+        index, inner = self._locate(max(0, start))
+        while index < len(self._pieces) and self._starts[index] < end:
+            buffer_id, piece_start, length = self._pieces[index]
+            stop = piece_start + min(length, end - self._starts[index])
+            found = self._buffer(buffer_id).find(value, piece_start + inner, stop)
+            if found != -1:
+                return self._starts[index] + found - piece_start
+            inner = 0
+            index += 1
+        return -1
+
+    def rfind_byte(self, value, end):
+        """Sucht ein einzelnes Byte rückwärts vor end; -1, wenn es fehlt."""
+        end = min(end, self._length)
+        if end <= 0:
+            return -1
+        index, inner = self._locate(end - 1)
+        inner += 1
+        while index >= 0:
+            buffer_id, piece_start, _length = self._pieces[index]
+            found = self._buffer(buffer_id).rfind(value, piece_start, piece_start + inner)
+            if found != -1:
+                return self._starts[index] + found - piece_start
+            index -= 1
+            if index >= 0:
+                inner = self._pieces[index][2]
+        return -1
+
+    def count_byte(self, value, start=0, end=None, block_size=1 << 20):
+        """Zählt ein Byte in [start, end), blockweise ohne große Kopien."""
+        end = self._length if end is None else min(end, self._length)
+        count = 0
+        for block_start in range(max(0, start), end, block_size):
+            count += self.read(block_start, min(block_size, end - block_start)).count(value)
+        return count
+
+    def line_start(self, offset):
+        """Offset des Anfangs der Zeile, die offset enthält."""
+        return self.rfind_byte(b'\n', offset) + 1
+
+    def line_end(self, offset):
+        """Offset des Zeilenumbruchs (oder Dateiende) der Zeile ab offset."""
+        end = self.find_byte(b'\n', offset)
+        return self._length if end == -1 else end
+
+    def snapshot(self, chunk_size=1 << 20):
+        """Gibt eine Funktion zurück, die den jetzigen Inhalt in Stücken liefert.
+
+        Die Piece-Liste wird kopiert; der Anhängepuffer wächst nur, daher
+        bleiben die Bereiche gültig. Das Mapping muss offen bleiben, bis die
+        Stücke gelesen sind (z.B. von einem Speicher-Worker).
+        """
+        pieces = list(self._pieces)
+        buffers = (self._mmap, self._add)
+
+        def chunks():
+            for buffer_id, start, length in pieces:
+                buffer = buffers[buffer_id]
+                for chunk_start in range(start, start + length, chunk_size):
+                    yield buffer[chunk_start:min(start + length, chunk_start + chunk_size)]
+        return chunks
+
+    def reopen(self, path=None):
+        """Mappt nach dem Speichern die neue Datei als Original.
+
+        Ohne path (Speichern fehlgeschlagen) wird nur das alte Mapping
+        wiederhergestellt; die Änderungen bleiben erhalten.
+        """
+        self.close()
+        if path is None:
+            self._map()
+            return
+        self.path = path
+        self._open_original()
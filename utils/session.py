@@ -0,0 +1,42 @@
+"""Speichern und Laden der offenen Tabs zwischen zwei Programmstarts."""
+import json
+import os
+
+from utils.app_data import app_data_path
+from utils.file_saver import atomic_write
+
+SESSION_FILE = 'session.json'
+
+
+def session_path():
+    return app_data_path(SESSION_FILE)
+
+
+def load_session(path=None):
+    """Liest die Sitzung; ohne gültige Datei eine leere Sitzung.
+
+    Rückgabe: {'tabs': [{'path', 'cursor', 'scroll'}, ...], 'current': Index}
+    """
+    try:
+        with open(path or session_path(), encoding='utf-8') as f:
+            data = json.load(f)
+        tabs = [
+            {
+                'path': str(tab['path']),
+                'cursor': int(tab.get('cursor', 0)),
+                'scroll': int(tab.get('scroll', 0)),
+            }
+            for tab in data.get('tabs', [])
+        ]
+        current = int(data.get('current', 0))
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {'tabs': [], 'current': 0}
+    return {'tabs': tabs, 'current': current}
+
+
+def save_session(tabs, current, path=None):
+    """Schreibt die Sitzung atomar (tabs wie bei load_session)."""
+    path = path or session_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = json.dumps({'tabs': tabs, 'current': current}, indent=1)
+    atomic_write(path, (data.encode('utf-8'),))